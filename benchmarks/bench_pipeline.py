@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks of gooey_quick's introspection -> conversion -> parser pipeline.
+
+Synthetic handlers with 10 to 1000 parameters (cycling through every supported
+annotation) and sectioned programs with 1 to 500 sections are timed, the
+results are compared against benchmarks/baseline.json. Run from the
+repository's root:
+
+    python benchmarks/bench_pipeline.py                  # compare with the baseline
+    python benchmarks/bench_pipeline.py --save-baseline  # record a new baseline
+
+The script exits with status 1 if any benchmark got slower than the baseline
+by more than --tolerance.
+"""
+import sys
+import json
+import time
+import argparse
+import statistics
+from enum import Enum
+from pathlib import Path
+from datetime import date, time as time_of_day
+from typing import Optional, Literal, Callable, Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gooey_quick import introspection, converters
+from gooey_quick.introspection import Parameter
+from gooey_quick.headless import HeadlessParser
+from gooey_quick.__main__ import create_parser, create_sectioned_parser
+from gooey_quick.types import DirectoryPath, SaveToPath, FileWithExtension
+
+BASELINE_FILE = Path(__file__).resolve().parent / 'baseline.json'
+
+PARAMETER_COUNTS = (10, 100, 1000)
+
+SECTION_COUNTS = (1, 10, 100, 500)
+
+PARAMETERS_PER_SECTION = 10
+
+
+class Color(Enum):
+    RED = 'red'
+    GREEN = 'green'
+    BLUE = 'blue'
+
+
+# annotation source, default value source (None for required parameters)
+ANNOTATIONS = (
+    ('str', None),
+    ('int', '1'),
+    ('float', None),
+    ('bool', 'False'),
+    ('date', None),
+    ('time_of_day', None),
+    ('Path', None),
+    ('DirectoryPath', None),
+    ('SaveToPath', None),
+    ('Color', 'Color.RED'),
+    ('Optional[str]', 'None'),
+    ('list[Path]', None),
+    ("FileWithExtension[Literal['csv', 'json']]", None),
+    ("list[FileWithExtension[Literal['csv', 'json']]]", None),
+)
+
+HANDLER_NAMESPACE = {
+    'Optional': Optional,
+    'Literal': Literal,
+    'date': date,
+    'time_of_day': time_of_day,
+    'Path': Path,
+    'DirectoryPath': DirectoryPath,
+    'SaveToPath': SaveToPath,
+    'FileWithExtension': FileWithExtension,
+    'Color': Color,
+}
+
+
+def synthetic_handler(parameter_count: int, name: str = 'handler') -> Callable[..., Any]:
+    """
+    Creates a documented function with :parameter_count: parameters
+
+    :param parameter_count: how many parameters the function should take
+    :param name: the function's name
+    """
+    required, optional, docstring = [], [], []
+    for index in range(parameter_count):
+        annotation, default = ANNOTATIONS[index % len(ANNOTATIONS)]
+        if default is None:
+            required.append(f'parameter_{index}: {annotation}')
+        else:
+            optional.append(f'parameter_{index}: {annotation} = {default}')
+        docstring.append(f'    :param parameter_{index}: synthetic parameter number {index}')
+
+    source = '\n'.join((
+        f'def {name}(',
+        *(f'    {parameter},' for parameter in required + optional),
+        '):',
+        '    """',
+        '    synthetic handler',
+        '',
+        *docstring,
+        '    """',
+    ))
+    namespace = dict(HANDLER_NAMESPACE)
+    exec(source, namespace)
+    return namespace[name]
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """
+    Returns the median time (in seconds) of :repeat: calls of :function:,
+    introspection's in-memory caches are emptied before every call
+    """
+    timings = []
+    for _ in range(repeat):
+        introspection._PARSED_PARAMETERS_CACHE.clear()
+        introspection._SIGNATURES_CACHE.clear()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def benchmarks(repeat: int) -> dict[str, float]:
+    results = {}
+    for parameter_count in PARAMETER_COUNTS:
+        handler = synthetic_handler(parameter_count)
+        parameters = Parameter.parse_callable_parameters(handler)
+
+        results[f'parse_callable_parameters[{parameter_count}]'] = measure(
+            lambda: Parameter.parse_callable_parameters(handler),
+            repeat,
+        )
+        results[f'convert_to_argument[{parameter_count}]'] = measure(
+            lambda: [converters.convert_to_argument(parameter) for parameter in parameters],
+            repeat,
+        )
+        results[f'create_parser[{parameter_count}]'] = measure(
+            lambda: create_parser(handler, HeadlessParser()),
+            repeat,
+        )
+
+    for section_count in SECTION_COUNTS:
+        sections = {
+            f'Section {index}': synthetic_handler(PARAMETERS_PER_SECTION, f'section_{index}')
+            for index in range(section_count)
+        }
+        results[f'create_sectioned_parser[{section_count}]'] = measure(
+            lambda: create_sectioned_parser(sections, HeadlessParser()),
+            repeat,
+        )
+        results[f'create_sectioned_parser[{section_count}, only_section]'] = measure(
+            lambda: create_sectioned_parser(sections, HeadlessParser(), only_section='section_0'),
+            repeat,
+        )
+
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float) -> list[str]:
+    """
+    Prints :results: next to :baseline: and returns the names of regressed benchmarks
+    """
+    regressions = []
+    print(f'{"benchmark":<54} {"median":>12} {"baseline":>12} {"change":>8}')
+    for name, seconds in results.items():
+        if name in baseline:
+            change = seconds / baseline[name] - 1
+            regressed = change > tolerance
+            if regressed:
+                regressions.append(name)
+            print(
+                f'{name:<54} {seconds * 1000:>10.3f}ms {baseline[name] * 1000:>10.3f}ms '
+                f'{change:>+8.1%}{"  REGRESSION" if regressed else ""}'
+            )
+        else:
+            print(f'{name:<54} {seconds * 1000:>10.3f}ms {"-":>12} {"-":>8}')
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=7, help='samples taken per benchmark')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='allowed slowdown, 0.5 means 50%%')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE, help='baseline file to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='overwrite the baseline with the results')
+    args = parser.parse_args(argv)
+
+    results = benchmarks(args.repeat)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=4) + '\n')
+        print(f'baseline saved to {args.baseline}')
+        return 0
+    if regressions:
+        print(f'{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,35 @@
-from gooey_quick.__main__ import run_gooey
+"""
+gooey_quick's public interface. The attributes are imported lazily, so that
+e.g. importing gooey_quick.types doesn't pull in the rest of the package
+"""
+import importlib
+
 __version__ = '1.0.0'
 
+_LAZY_ATTRIBUTES = {
+    'run_gooey': 'gooey_quick.__main__',
+    'create_parser': 'gooey_quick.__main__',
+    'create_sectioned_parser': 'gooey_quick.__main__',
+    'register_converter': 'gooey_quick.converters',
+    'register_origin_converter': 'gooey_quick.converters',
+    'cancelled': 'gooey_quick.threaded',
+    'progress': 'gooey_quick.reporting',
+    'report': 'gooey_quick.reporting',
+}
+
+__all__ = ['__version__', *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
@@ -1,40 +1,101 @@
 """wrappers around Gooey that inspect callables"""
+import sys
 import inspect
-from typing import Callable, Any, TypeVar
-
-from gooey import GooeyParser, Gooey
+from argparse import ArgumentParser
+from typing import Callable, Any, TypeVar, Optional
 
 from gooey_quick.introspection import Parameter
-from gooey_quick import converters
+from gooey_quick import (
+    converters,
+    headless,
+    cache,
+    execution,
+    results,
+    instrumentation,
+    profiling,
+    argument_files,
+    validation,
+    memoization,
+    parallel,
+    reporting,
+)
 
 T = TypeVar('T')
 
 
-def create_parser(function: callable, parser: GooeyParser = None):
+def new_parser(**kwargs) -> ArgumentParser:
+    """
+    Creates a GooeyParser, or a headless.HeadlessParser when running without
+    the GUI (so that wxPython never gets imported)
+
+    :param kwargs: keyword arguments for the parser's constructor
+    """
+    if headless.is_headless():
+        return headless.HeadlessParser(**kwargs)
+
+    from gooey import GooeyParser
+    return GooeyParser(**kwargs)
+
+
+def convert_arguments(function: callable) -> list[dict[str, Any]]:
+    """
+    Converts :function:'s parameters into a list of GooeyParser.add_argument args
+
+    :param function: callable to inspect for arguments
+    """
+    return [
+        converters.convert_to_argument(parameter)
+        for parameter in Parameter.parse_callable_parameters(function)
+    ]
+
+
+def create_parser(
+    function: callable,
+    parser: ArgumentParser = None,
+    cache_arguments: bool = False,
+    profile: bool = False,
+    job_status: bool = False,
+):
     """
     Crate a GooeyParser from a callabe
 
     :param function: callable to inspect for arguments
     :param parser: base parser
+    :param cache_arguments: whether to keep the converted arguments in an
+    on-disk cache (see gooey_quick.cache)
+    :param profile: whether to add the profiling checkbox (see gooey_quick.profiling)
+    :param job_status: whether to add the job queue's status checkbox (see gooey_quick.jobs)
     :returns: a GooeyParser
     """
     if parser is None:
-        parser = GooeyParser()
-
-    for args in map(
-        converters.convert_to_argument,
-        Parameter.parse_callable_parameters(function)
-    ):
-        parameter_name = args['dest']
-        if args.pop('required'):
-            parser.add_argument(
-                **args,
-            )
+        parser = new_parser()
+
+    with instrumentation.span('create_parser', function=function.__qualname__):
+        if cache_arguments:
+            arguments = cache.cached_arguments(function, convert_arguments)
         else:
-            parser.add_argument(
-                f'--{parameter_name}',
-                **args,
-            )
+            arguments = convert_arguments(function)
+
+        for args in arguments:
+            parameter_name = args['dest']
+            if instrumentation.enabled() and args['action'] == 'store' and 'type' in args:
+                args['type'] = instrumentation.timed('convert_argument', args['type'], parameter=parameter_name)
+
+            if args.pop('required'):
+                parser.add_argument(
+                    **args,
+                )
+            else:
+                parser.add_argument(
+                    f'--{parameter_name}',
+                    **args,
+                )
+
+        if profile:
+            profiling.add_profile_argument(parser)
+        if job_status:
+            from gooey_quick import jobs
+            jobs.add_status_argument(parser)
 
     return parser
 
@@ -42,6 +103,10 @@ def create_parser(function: callable, parser: GooeyParser = None):
 def create_sectioned_parser(
     sections: dict[str, Callable[..., Any]],
     base_parser = None,
+    cache_arguments: bool = False,
+    only_section: Optional[str] = None,
+    profile: bool = False,
+    job_status: bool = False,
 ):
     """
     Transforms :sections: into subparsed GooeyParser
@@ -49,23 +114,63 @@ def create_sectioned_parser(
     :param sections: the keys of this dict will be become display names,
     while the values define application logic
     :param base_parser: root parser
+    :param cache_arguments: see create_parser
+    :param only_section: if set, only the section whose handler has this
+    __name__ gets introspected and added to the parser (see selected_section)
+    :param profile: see create_parser
+    :param job_status: see create_parser
     """
     if base_parser is None:
-        base_parser = GooeyParser()
+        base_parser = new_parser()
 
-    subparser = base_parser.add_subparsers()
-    for section_name, handler in sections.items():
-        section_parser = subparser.add_parser(
-            handler.__name__,
-            prog=section_name,
-        )
-        create_parser(handler, parser=section_parser).set_defaults(handler=handler)
+    with instrumentation.span('create_sectioned_parser', sections=len(sections)):
+        subparser = base_parser.add_subparsers()
+        for section_name, handler in sections.items():
+            if only_section is not None and handler.__name__ != only_section:
+                continue
+            section_parser = subparser.add_parser(
+                handler.__name__,
+                prog=section_name,
+            )
+            create_parser(
+                handler,
+                parser=section_parser,
+                cache_arguments=cache_arguments,
+                profile=profile,
+                job_status=job_status,
+            ).set_defaults(handler=handler)
 
     return base_parser
 
 
+def selected_section(
+    sections: dict[str, Callable[..., Any]],
+    argv: Optional[list[str]] = None,
+) -> Optional[str]:
+    """
+    Peeks at the command line for the subcommand naming one of :sections:
+
+    :param sections: see create_sectioned_parser
+    :param argv: command line arguments, defaults to sys.argv[1:]
+    :returns: the selected handler's __name__ or None if no section was selected
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in {handler.__name__ for handler in sections.values()}:
+        return argv[0]
+    return None
+
+
 def run_gooey(
     description: Callable[..., T] | dict[str, Callable[..., Any]],
+    cache_arguments: bool = False,
+    trace: Optional[Any] = None,
+    profile: bool | str = False,
+    validate_paths: bool = False,
+    memoize: bool | str = False,
+    warm_worker: bool = False,
+    in_process: bool = False,
+    job_queue: bool | int = False,
     **kwargs,
 ) -> T | Any:
     """
@@ -73,24 +178,149 @@ def run_gooey(
 
     :param description: if a callable is provided, Gooey will be started
     in basic and the callable will be called started with the inputted
-    parameters. A dict of callables should be transfomed into an advanced
-    mode Gooey program, its keys will become sidebars display names while its
-    values what's the subprogram's logic
+    parameters. Generator callables have their yielded items printed as
+    they're produced, their return value is returned. A dict of callables
+    should be transfomed into an advanced mode Gooey program, its keys will
+    become sidebars display names while its values what's the subprogram's logic
+    :param cache_arguments: keep the arguments converted from :description:'s
+    signatures in an on-disk cache, so that later starts (including Gooey's
+    child process) skip the introspection
+    :param trace: emit timing events of every pipeline stage to a sink (see
+    gooey_quick.instrumentation), a callback taking an event dict, a trace file
+    path ('.jsonl' for JSON lines, Chrome's trace event format otherwise) or a
+    list of those. The GOOEY_QUICK_TRACE environment variable works the same
+    :param profile: add a 'Profile' checkbox, ticking it runs the handler under
+    cProfile and tracemalloc (or only one of them: 'cpu' or 'memory'). The
+    profiles are saved to the working directory and summarized in the console
+    :param validate_paths: check that path arguments exist and can be read (or
+    written to for SaveToPath) before the handler runs, see gooey_quick.validation
+    :param memoize: return the stored result of an earlier run with the same
+    arguments instead of running the handler again. Input files are identified
+    by their size and modification time, or by their contents' hash with
+    'content'. See gooey_quick.memoization
+    :param warm_worker: run the handlers in a long-lived worker process that
+    imports the program once, instead of a fresh process per run. Gooey's
+    Stop button kills the worker, which is then respawned. See gooey_quick.worker
+    :param in_process: run the handlers on a thread of the GUI's process, for
+    handlers quicker than starting a process. Their output goes to Gooey's
+    console, Gooey's Stop button cancels them cooperatively: they should check
+    gooey_quick.cancelled() regularly. map_over handlers are rejected. See
+    gooey_quick.threaded
+    :param job_queue: queue the submitted runs instead of waiting for them, so
+    the form can be submitted again right away. The jobs run in child processes,
+    as many at once as the given number (or the available CPUs for True),
+    every submission prints the jobs' status. Ticking the added status
+    checkbox prints it without queueing a job. See gooey_quick.jobs
     :param kwargs: keyword arguments that will be passed on to gooey.Gooey.
     See https://github.com/chriskiehl/Gooey#global-configuration
+    Unless progress_regex is given, the progress bar follows the handler's
+    gooey_quick.progress and gooey_quick.report calls
+    When the program runs as Gooey's child process (or is started with
+    --ignore-gooey from the command line), Gooey is not imported at all and
+    the arguments are parsed with a plain argparse parser. Command lines too
+    long for the OS are passed to the child through an argument file (see
+    gooey_quick.argument_files). If the caller
+    enabled the result channel (see results.run_program), the return value
+    is also sent back to it
     """
+    # the checkbox is handled by the GUI's queue, runs never see it
+    job_status = bool(job_queue) and not headless.is_headless()
     if callable(description):
-        def inner():
-            argv = create_parser(description).parse_args()
-            return description(**argv.__dict__)
+        def inner(parser: ArgumentParser, arguments: Optional[list[str]] = None):
+            parser = create_parser(description, parser, cache_arguments, bool(profile), job_status)
+            with instrumentation.span('parse_args'):
+                argv = parser.parse_args(arguments).__dict__
+            if validate_paths:
+                validation.validate_or_exit(parser, description, argv)
+            return call_handler(description, argv)
     elif isinstance(description, dict):
-        def inner():
-            argv = create_sectioned_parser(description).parse_args().__dict__
-            return argv.pop('handler')(**argv)
+        def inner(parser: ArgumentParser, arguments: Optional[list[str]] = None):
+            # the GUI gets every section, a run only needs the selected one
+            parser = create_sectioned_parser(
+                description,
+                parser,
+                cache_arguments,
+                only_section=selected_section(description, arguments),
+                profile=bool(profile),
+                job_status=job_status,
+            )
+            with instrumentation.span('parse_args'):
+                argv = parser.parse_args(arguments).__dict__
+            handler = argv.pop('handler')
+            if validate_paths:
+                validation.validate_or_exit(parser, handler, argv)
+            return call_handler(handler, argv)
     else:
         raise ValueError(
             f'{description} of {type(description)} cannot be handeled by gooey_quick. '
              'Please pass either a callable or a dict to run_gooey'
         )
-    return Gooey(inner, **kwargs)()
 
+    if sum(map(bool, (warm_worker, in_process, job_queue))) > 1:
+        raise ValueError('warm_worker, in_process and job_queue are exclusive, they decide where handlers run')
+    if in_process:
+        handlers = description.values() if isinstance(description, dict) else (description,)
+        mapped = [handler.__name__ for handler in handlers if parallel.mapped_parameter(handler) is not None]
+        if mapped:
+            # their process pool would fork the multi-threaded GUI process
+            raise ValueError(f'map_over handlers can\'t run in the GUI\'s process: {", ".join(mapped)}')
+
+    profiling_modes = profiling.profiling_modes(profile or True)
+    fingerprint_mode = memoization.fingerprint_mode(memoize or True)
+
+    def call_handler(handler: Callable[..., Any], arguments: dict[str, Any]) -> Any:
+        if profiling.profiling_requested(arguments):
+            return profiling.profile_call(
+                execution.call_handler,
+                handler,
+                arguments,
+                modes=profiling_modes,
+                name=handler.__name__,
+            )
+        if memoize:
+            return memoization.memoized_call(execution.call_handler, handler, arguments, fingerprint_mode)
+        return execution.call_handler(handler, arguments)
+
+    instrumentation.enable_from_environment()
+    if trace is not None:
+        instrumentation.enable(*(trace if isinstance(trace, list) else [trace]))
+
+    def run_headless(argv: Optional[list[str]] = None):
+        headless.strip_ignore_gooey_flag(argv)
+        argument_files.expand_argument_files(argv)
+        return inner(headless.HeadlessParser(), argv)
+
+    if headless.is_headless():
+        if headless.is_worker():
+            # the worker, threaded and jobs modules are only imported for the modes (and handlers) using them
+            from gooey_quick import worker
+            worker.serve(run_headless)
+        result = run_headless()
+        results.publish_result(result)
+        return result
+
+    from gooey import Gooey, GooeyParser
+    argument_files.install()
+    # a target given by the caller wins, nothing gets started for the mode then
+    if 'target' in kwargs:
+        pass
+    elif warm_worker:
+        from gooey_quick import worker
+        kwargs['target'] = worker.start_worker()
+    elif in_process:
+        from gooey_quick import threaded
+        kwargs['target'] = threaded.install(run_headless)
+    elif job_queue:
+        from gooey_quick import jobs, threaded
+        queue = jobs.start_queue(parallel.available_cpus() if job_queue is True else job_queue)
+        kwargs['target'] = threaded.install(queue.submit_and_report)
+
+    def gooey_inner():
+        return inner(GooeyParser())
+
+    return Gooey(gooey_inner, **reporting.gooey_options(kwargs))()
+
+
+if __name__ == '__main__':
+    from gooey_quick import cli
+    sys.exit(cli.main())
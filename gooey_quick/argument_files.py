@@ -0,0 +1,130 @@
+"""
+Passing huge command lines (e.g. thousands of files selected in a
+MultiFileChooser) from Gooey's GUI to its child process through a file.
+Command lines are limited by the OS (a single argument may not exceed 128KiB
+on Linux, cmd.exe takes 8KiB), so long ones are spilled into an argument file
+holding one JSON encoded token per line, which the child streams back
+"""
+import os
+import re
+import sys
+import json
+import shlex
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+from gooey_quick.headless import IGNORE_GOOEY_FLAG
+
+ARGUMENT_FILE_FLAG = '--gooey-quick-argument-file'
+
+# commands longer than this (in characters) are spilled into an argument file
+SPILL_THRESHOLD = 4096
+
+
+# a token of a Windows command line: quoted and bare parts not separated by whitespace
+_WINDOWS_TOKEN = re.compile(r'(?:"(?:[^"]|"")*"?|[^\s"]+)+')
+
+# a quoted part (in which Gooey doubles quotes) or a bare part of a token
+_WINDOWS_PART = re.compile(r'"((?:[^"]|"")*)"?|([^\s"]+)')
+
+
+def _split_windows_command(command: str) -> list[str]:
+    return [
+        ''.join(
+            part[2] if part[2] is not None else part[1].replace('""', '"')
+            for part in _WINDOWS_PART.finditer(token)
+        )
+        for token in _WINDOWS_TOKEN.findall(command)
+    ]
+
+
+def split_command(command: str) -> list[str]:
+    """
+    Splits the arguments of a command line built by Gooey into tokens, the
+    way the shell running it would. On Windows, Gooey wraps values in double
+    quotes and doubles the quotes they contain
+
+    :param command: command line, quoted like Gooey quotes it
+    """
+    if os.name != 'nt':
+        return shlex.split(command)
+    return _split_windows_command(command)
+
+
+def write_argument_file(tokens: Iterable[str]) -> str:
+    """
+    Writes :tokens: into a new temporary argument file, the reader removes it
+
+    :returns: the file's path
+    """
+    descriptor, path = tempfile.mkstemp(prefix='gooey_quick-', suffix='.args')
+    with open(descriptor, 'w', encoding='utf-8') as f:
+        for token in tokens:
+            f.write(json.dumps(token))
+            f.write('\n')
+    return path
+
+
+def read_argument_file(path: str) -> Iterator[str]:
+    """
+    Streams the tokens of an argument file written by write_argument_file and
+    removes the file once it's read
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+    finally:
+        os.remove(path)
+
+
+def spill_command(command: str, threshold: int = SPILL_THRESHOLD) -> str:
+    """
+    Moves the arguments of a command line longer than :threshold: into an
+    argument file. Only the arguments following Gooey's --ignore-gooey flag
+    are moved, the target (interpreter and script) stays untouched
+
+    :param command: command line Gooey is about to run
+    :param threshold: length from which the arguments are spilled
+    :returns: the command line to run instead
+    """
+    separator = f' {IGNORE_GOOEY_FLAG} '
+    if len(command) <= threshold or separator not in command:
+        return command
+    target, _, arguments = command.partition(separator)
+    path = write_argument_file(split_command(arguments))
+    return f'{target}{separator}{ARGUMENT_FILE_FLAG} "{path}"'
+
+
+def expand_argument_files(argv: Optional[list[str]] = None):
+    """
+    Replaces (in place) every --gooey-quick-argument-file flag and its path
+    with the tokens of the argument file
+
+    :param argv: command line to modify, defaults to sys.argv
+    """
+    if argv is None:
+        argv = sys.argv
+    while ARGUMENT_FILE_FLAG in argv:
+        index = argv.index(ARGUMENT_FILE_FLAG)
+        argv[index:index + 2] = read_argument_file(argv[index + 1])
+
+
+def install():
+    """
+    Makes Gooey's GUI spill long command lines into argument files. Gooey
+    runs every command through gooey.gui.processor.ProcessController.run,
+    which is wrapped (once)
+    """
+    from gooey.gui.processor import ProcessController
+
+    run = ProcessController.run
+    if getattr(run, 'spills_arguments', False):
+        return
+
+    def spilling_run(self, command, *args, **kwargs):
+        return run(self, spill_command(command), *args, **kwargs)
+
+    spilling_run.spills_arguments = True
+    ProcessController.run = spilling_run
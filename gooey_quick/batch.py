@@ -0,0 +1,263 @@
+"""running a handler over many rows of arguments, without the GUI"""
+import io
+import os
+import sys
+import csv
+import json
+import importlib
+import traceback
+from enum import Enum
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, redirect_stdout
+from concurrent.futures import (
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    wait,
+    FIRST_COMPLETED,
+    ALL_COMPLETED,
+)
+from typing import Callable, Any, Optional, TextIO
+
+from gooey_quick import execution, instrumentation, mapping
+from gooey_quick.headless import HeadlessParser
+from gooey_quick.introspection import Parameter
+from gooey_quick.__main__ import convert_arguments, create_parser
+
+# how many rows may wait in the pool per worker, bounds the memory used for huge inputs
+ROWS_IN_FLIGHT_PER_WORKER = 4
+
+
+class BatchParser(HeadlessParser):
+    """A HeadlessParser that raises ValueError instead of exiting on invalid rows"""
+    def error(self, message):
+        raise ValueError(message)
+
+
+def load_handler(reference: str) -> Callable[..., Any]:
+    """
+    Imports a handler from a 'module:function' reference
+
+    :param reference: e.g. 'my_tool:upload_file' or 'my_package.tools:Tools.upload'
+    :raises ValueError: if the reference is malformed
+    """
+    module_name, separator, qualified_name = reference.partition(':')
+    if not separator or not module_name or not qualified_name:
+        raise ValueError(f'{reference} is not a module:function reference')
+
+    handler = importlib.import_module(module_name)
+    for attribute in qualified_name.split('.'):
+        handler = getattr(handler, attribute)
+    return handler
+
+
+def read_rows(source: TextIO, csv_format: bool = False) -> Iterator[dict[str, Any]]:
+    """
+    Lazily reads argument rows, either JSON objects (one per line) or CSV
+    records with a header. Empty CSV cells are treated as missing values
+
+    :param source: text stream to read the rows from
+    :param csv_format: whether :source: is a CSV file
+    """
+    if csv_format:
+        for record in csv.DictReader(source):
+            yield {name: value for name, value in record.items() if value != ''}
+    else:
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _stringify(value: Any) -> str:
+    return value.name if isinstance(value, Enum) else str(value)
+
+
+def _call_in_worker(handler: Callable[..., Any], arguments: dict[str, Any]) -> Any:
+    # files mapped by the parent arrive as MappedPaths, see mapping.portable_arguments
+    return execution.call_handler(handler, mapping.mapped_arguments(arguments))
+
+
+def row_to_argv(
+    arguments: list[dict[str, Any]],
+    row: dict[str, Any],
+    defaults: Optional[dict[str, Any]] = None,
+) -> list[str]:
+    """
+    Translates :row: into a command line for a parser created from :arguments:,
+    so that the values are converted exactly like in the GUI (Enum names,
+    ISO dates, paths...)
+
+    :param arguments: converted add_argument args, see __main__.convert_arguments
+    :param row: values keyed by the handler's parameter names
+    :param defaults: values of the parameters missing from :row:
+    :raises ValueError: if :row: names unknown parameters or lacks required ones
+    """
+    if defaults is None:
+        defaults = {}
+
+    unknown = set(row) - {args['dest'] for args in arguments}
+    if unknown:
+        raise ValueError(f'unknown parameters: {", ".join(sorted(unknown))}')
+
+    optionals, positionals = [], []
+    for args in arguments:
+        name = args['dest']
+        value = row.get(name, defaults.get(name))
+        if value is None:
+            if args['required']:
+                raise ValueError(f'the parameter {name} is required')
+            continue
+
+        if args['action'] in ('store_true', 'store_false'):
+            if value in (True, 'true', 'True', '1', 1):
+                optionals.append(f'--{name}')
+            continue
+
+        if args.get('nargs') == '+' and isinstance(value, list):
+            tokens = [_stringify(item) for item in value]
+        else:
+            tokens = [_stringify(value)]
+
+        if args['required']:
+            positionals.extend(tokens)
+        elif len(tokens) == 1:
+            # glued to its flag, so that values starting with a dash aren't taken for flags
+            optionals.append(f'--{name}={tokens[0]}')
+        else:
+            optionals.extend((f'--{name}', *tokens))
+
+    if not positionals:
+        # argparse rejects a '--' no positional follows
+        return optionals
+    return [*optionals, '--', *positionals]
+
+
+def run_batch(
+    handler: Callable[..., Any],
+    rows: Iterable[dict[str, Any]],
+    output: TextIO,
+    workers: int = 1,
+    executor_type: type[Executor] = ThreadPoolExecutor,
+) -> int:
+    """
+    Runs :handler: once per row, :workers: rows at a time. Every row's result
+    (or error) is written to :output: as a JSON line as soon as it's done,
+    rows finishing together are written in their order
+
+    :param handler: function to run
+    :param rows: arguments for every run, keyed by the handler's parameter names
+    :param output: text stream for the results
+    :param workers: how many rows may run concurrently
+    :param executor_type: ThreadPoolExecutor or ProcessPoolExecutor (for CPU bound handlers)
+    :returns: the number of failed rows
+    """
+    arguments = convert_arguments(handler)
+    defaults = {
+        parameter.name: parameter.default
+        for parameter in Parameter.parse_callable_parameters(handler)
+        if parameter.has_default_value
+    }
+    parser = create_parser(handler, BatchParser(prog=handler.__name__))
+    failures = 0
+
+    def report(row_number: int, result: Any = None, error: Optional[BaseException] = None):
+        nonlocal failures
+        if error is None:
+            record = {'row': row_number, 'result': result}
+        else:
+            failures += 1
+            record = {'row': row_number, 'error': ''.join(traceback.format_exception_only(error)).strip()}
+        output.write(json.dumps(record, default=str) + '\n')
+        output.flush()
+
+    with executor_type(max_workers=workers) as executor:
+        in_flight: dict[Future, int] = {}
+
+        def collect(return_when: str):
+            done, _ = wait(in_flight, return_when=return_when)
+            for future in sorted(done, key=in_flight.get):
+                row_number = in_flight.pop(future)
+                error = future.exception()
+                report(row_number, None if error else future.result(), error)
+
+        for row_number, row in enumerate(rows):
+            try:
+                parsed = parser.parse_args(row_to_argv(arguments, row, defaults))
+            except Exception as error:
+                report(row_number, error=error)
+                continue
+
+            if isinstance(executor, ProcessPoolExecutor):
+                # mapped files are mapped again by the worker process
+                portable = mapping.portable_arguments(parsed.__dict__)
+                mapping.release_mapped_files(parsed.__dict__)
+                future = executor.submit(_call_in_worker, handler, portable)
+            else:
+                future = executor.submit(execution.call_handler, handler, parsed.__dict__)
+            in_flight[future] = row_number
+            if len(in_flight) >= workers * ROWS_IN_FLIGHT_PER_WORKER:
+                collect(FIRST_COMPLETED)
+
+        if in_flight:
+            collect(ALL_COMPLETED)
+
+    return failures
+
+
+@contextmanager
+def _results_stream() -> Iterator[TextIO]:
+    """
+    Reserves stdout for the results: meanwhile whatever handlers print
+    (generator items included, and their worker processes' output) goes to stderr
+    """
+    try:
+        stdout_descriptor = sys.stdout.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        results = sys.stdout
+        with redirect_stdout(sys.stderr):
+            yield results
+        return
+
+    sys.stdout.flush()
+    saved_descriptor = os.dup(stdout_descriptor)
+    os.dup2(sys.stderr.fileno(), stdout_descriptor)
+    try:
+        with open(os.dup(saved_descriptor), 'w') as results, redirect_stdout(sys.stderr):
+            yield results
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved_descriptor, stdout_descriptor)
+        os.close(saved_descriptor)
+
+
+def main(
+    reference: str,
+    rows_file: str,
+    output_file: Optional[str] = None,
+    workers: int = 1,
+    processes: bool = False,
+) -> int:
+    """
+    Entry point of `python -m gooey_quick batch`, see cli.py
+
+    :returns: the process' exit code
+    """
+    instrumentation.enable_from_environment()
+    handler = load_handler(reference)
+    csv_format = rows_file.lower().endswith('.csv')
+    source = sys.stdin if rows_file == '-' else open(rows_file, newline='' if csv_format else None)
+    output = _results_stream() if output_file in (None, '-') else open(output_file, 'w')
+    try:
+        with output as results:
+            failures = run_batch(
+                handler,
+                read_rows(source, csv_format),
+                results,
+                workers=workers,
+                executor_type=ProcessPoolExecutor if processes else ThreadPoolExecutor,
+            )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    return 1 if failures else 0
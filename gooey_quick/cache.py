@@ -0,0 +1,180 @@
+"""persistent on-disk cache of arguments converted from callables' signatures"""
+import os
+import pickle
+import typing
+import hashlib
+import inspect
+import tempfile
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import gooey_quick
+
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE = 'GOOEY_QUICK_CACHE_DIR'
+
+
+def cache_directory(*parts: str) -> Path:
+    """
+    Returns (and creates) gooey_quick's cache directory. It can be set with the
+    GOOEY_QUICK_CACHE_DIR environment variable, it defaults to ~/.cache/gooey_quick
+
+    :param parts: subdirectories to append to the cache's root
+    """
+    root = os.environ.get(CACHE_DIRECTORY_ENVIRONMENT_VARIABLE)
+    if not root:
+        root = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'gooey_quick'
+    directory = Path(root, *parts)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _source_file(function: Callable[..., Any]) -> str | None:
+    module = inspect.getmodule(function)
+    return getattr(module, '__file__', None)
+
+
+def cache_key(function: Callable[..., Any]) -> str:
+    """
+    Identifies :function: by its module's path, qualified name and gooey_quick's version
+    """
+    identity = (
+        gooey_quick.__version__,
+        _source_file(function),
+        getattr(function, '__module__', None),
+        getattr(function, '__qualname__', repr(function)),
+    )
+    return hashlib.sha256(repr(identity).encode()).hexdigest()
+
+
+def _file_state(path: str | None) -> str:
+    if path is None:
+        return ''
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return ''
+    return f'{path}:{stat.st_mtime_ns}:{stat.st_size}'
+
+
+def _module_file(value: Any) -> str | None:
+    module = inspect.getmodule(value)
+    return getattr(module, '__file__', None)
+
+
+def _describe(value: Any) -> str:
+    """
+    Represents :value: the same way in every process, unlike the default
+    reprs of functions (which hold their address)
+    """
+    if isinstance(value, dict):
+        return '{' + ', '.join(f'{_describe(key)}: {_describe(item)}' for key, item in value.items()) + '}'
+    if isinstance(value, (list, tuple)):
+        return '(' + ', '.join(map(_describe, value)) + ')'
+    if typing.get_origin(value) is None and (isinstance(value, type) or callable(value)) and hasattr(value, '__qualname__'):
+        module = getattr(value, '__module__', None) or getattr(getattr(value, '__self__', None), '__module__', None)
+        description = f'{module}.{value.__qualname__}'
+        if hasattr(value, 'args'):
+            # a converter returning constant args, see converters.static_converter
+            description += _describe(value.args)
+        return description
+    return repr(value)
+
+
+def _annotation_types(annotation: Any) -> Iterator[type]:
+    """
+    :returns: the types :annotation: is made of, e.g. Path and Color for list[Path] | Color
+    """
+    if isinstance(annotation, type):
+        yield annotation
+    origin = typing.get_origin(annotation)
+    if isinstance(origin, type):
+        yield origin
+    for argument in typing.get_args(annotation):
+        yield from _annotation_types(argument)
+
+
+def _types_state(function: Callable[..., Any]) -> str:
+    from gooey_quick.introspection import extract_signature
+
+    modules, enums = set(), []
+    for parameter in extract_signature(function):
+        for annotation_type in _annotation_types(parameter.annotation):
+            modules.add(_module_file(annotation_type))
+            if issubclass(annotation_type, Enum):
+                enums.append((_describe(annotation_type), list(annotation_type.__members__)))
+    return repr((sorted(map(_file_state, modules)), enums))
+
+
+# the default registry's description and the version it was made for
+_described_registry: tuple[int, str] = (-1, '')
+
+
+def _registry_state() -> str:
+    from gooey_quick.converters import DEFAULT_REGISTRY
+
+    global _described_registry
+    if _described_registry[0] != DEFAULT_REGISTRY.version:
+        registrations = DEFAULT_REGISTRY.registrations()
+        modules = {_module_file(converter) for _, _, converter in registrations}
+        description = repr((
+            [(kind, _describe(annotation), _describe(converter)) for kind, annotation, converter in registrations],
+            sorted(map(_file_state, modules)),
+        ))
+        _described_registry = (DEFAULT_REGISTRY.version, description)
+    return _described_registry[1]
+
+
+def function_fingerprint(function: Callable[..., Any]) -> str:
+    """
+    Hashes everything the converted arguments are derived from: the function's
+    bytecode, docstring, annotations and defaults, the state of its source file
+    and of the modules defining its annotations' types (e.g. an Enum's members),
+    and the converters registered (see converters.register_converter)
+    """
+    hasher = hashlib.sha256()
+    hasher.update(_file_state(_source_file(function)).encode())
+
+    code = getattr(function, '__code__', None)
+    if code is not None:
+        hasher.update(code.co_code)
+    for attribute in ('__doc__', '__annotations__', '__defaults__', '__kwdefaults__'):
+        hasher.update(repr(getattr(function, attribute, None)).encode())
+    hasher.update(_types_state(function).encode())
+    hasher.update(_registry_state().encode())
+    return hasher.hexdigest()
+
+
+def cached_arguments(
+    function: Callable[..., Any],
+    convert: Callable[[Callable[..., Any]], list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """
+    Returns arguments converted from :function:, loading them from the cache if
+    possible. Missing, stale or corrupted entries are rebuilt with :convert:
+
+    :param function: callable whose arguments are cached
+    :param convert: function producing add_argument dicts from :function:
+    """
+    cache_file = cache_directory('arguments') / f'{cache_key(function)}.pickle'
+    fingerprint = function_fingerprint(function)
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_fingerprint, arguments = pickle.load(f)
+        if cached_fingerprint == fingerprint:
+            return arguments
+    except Exception:
+        # a missing, unreadable or otherwise stale entry, just rebuild it
+        pass
+
+    arguments = convert(function)
+    try:
+        payload = pickle.dumps((fingerprint, arguments))
+        with tempfile.NamedTemporaryFile(dir=cache_file.parent, delete=False) as f:
+            f.write(payload)
+        os.replace(f.name, cache_file)
+    except Exception:
+        # arguments that can't be pickled (e.g. lambdas used as types) are not cached
+        pass
+    return arguments
@@ -0,0 +1,48 @@
+"""gooey_quick's command line, i.e. `python -m gooey_quick`"""
+import argparse
+from typing import Optional
+
+
+def create_cli_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m gooey_quick')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    batch = commands.add_parser(
+        'batch',
+        help='run a handler over rows of arguments without the GUI',
+        description=(
+            'Runs a handler once per row of ROWS (JSON objects, one per line, or '
+            'a CSV file with a header) and writes every row\'s result or error '
+            'as a JSON line'
+        ),
+    )
+    batch.add_argument('handler', help='module:function reference, e.g. my_tool:upload_file')
+    batch.add_argument('rows', help='.jsonl or .csv file with the arguments, - for stdin')
+    batch.add_argument('--output', '-o', help='where to write the results, defaults to stdout (the handler\'s own output then goes to stderr)')
+    batch.add_argument('--workers', '-w', type=int, default=1, help='how many rows run concurrently')
+    batch.add_argument(
+        '--processes',
+        action='store_true',
+        help='run the rows in worker processes instead of threads (for CPU bound handlers)',
+    )
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    :param argv: command line arguments, defaults to sys.argv[1:]
+    :returns: the process' exit code
+    """
+    args = create_cli_parser().parse_args(argv)
+
+    if args.command == 'batch':
+        from gooey_quick import batch
+        return batch.main(
+            args.handler,
+            args.rows,
+            output_file=args.output,
+            workers=args.workers,
+            processes=args.processes,
+        )
+    raise AssertionError(f'unhandled command {args.command}')
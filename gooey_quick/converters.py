@@ -3,21 +3,31 @@ from enum import Enum
 from pathlib import Path
 from argparse import Action
 from datetime import date, time
-from typing import Optional, Any, Union
+from typing import Optional, Any, Union, Callable, get_args
 
+from gooey_quick import instrumentation
+from gooey_quick.mapping import map_file
+from gooey_quick.sequences import LIST_PARSERS, ELEMENT_PARSERS, TupleOf
+from gooey_quick.traversal import WalkDirectory
 from gooey_quick.introspection import Parameter
-from gooey_quick.types import DirectoryPath, SaveToPath, FileWithExtension
+from gooey_quick.types import DirectoryPath, SaveToPath, FileWithExtension, MappedFile, DirectoryFiles
 
 
-def convert_optional(parameter: Parameter) -> dict[str, Any]:
+Converter = Callable[[Parameter], dict[str, Any]]
+
+# origin converters get the registry they were resolved by, to convert the generics' args with
+OriginConverter = Callable[[Parameter, 'ConverterRegistry'], dict[str, Any]]
+
+
+def convert_optional(parameter: Parameter, registry: 'ConverterRegistry') -> dict[str, Any]:
     return {
-        **DEFAULT_TYPE_INTERPRETATION[parameter.type_annotation],
+        **registry.convert(parameter),
         'required': False,
     }
 
 
-def convert_file_with_extension(parameter: Parameter) -> dict[str, Any]:
-    allowed_file_types = '|'.join((f'{filetype.upper()} (*.{filetype})|*.{filetype}' for filetype in parameter.args))
+def convert_file_with_extension(parameter: Parameter, registry: 'ConverterRegistry') -> dict[str, Any]:
+    allowed_file_types = '|'.join((f'{filetype.upper()} (*.{filetype})|*.{filetype}' for filetype in get_args(parameter.type_annotation)))
     allowed_file_types += '|All files (*.*)|*.*'
     return {
         'type': FileWithExtension,
@@ -28,30 +38,64 @@ def convert_file_with_extension(parameter: Parameter) -> dict[str, Any]:
     }
 
 
-def convert_list(parameter: Parameter) -> dict[str, Any]:
-    if parameter.type_annotation is Path:
+def convert_mapped_file(parameter: Parameter, registry: 'ConverterRegistry') -> dict[str, Any]:
+    return {
+        **convert_file_with_extension(parameter, registry),
+        'type': map_file,
+    }
+
+
+def convert_directory_files(parameter: Parameter, registry: 'ConverterRegistry') -> dict[str, Any]:
+    return {
+        'type': WalkDirectory(get_args(parameter.type_annotation)),
+        'widget': 'DirChooser',
+    }
+
+
+def convert_list(parameter: Parameter, registry: 'ConverterRegistry') -> dict[str, Any]:
+    if parameter.type_annotation in (Path, MappedFile):
         return {
-            'type': Path,
+            'type': Path if parameter.type_annotation is Path else map_file,
             'nargs': '+',
             'widget': 'MultiFileChooser',
         }
-    elif parameter.origin is FileWithExtension:
+    elif parameter.origin in (FileWithExtension, MappedFile):
+        convert_file = convert_file_with_extension if parameter.origin is FileWithExtension else convert_mapped_file
         return {
-            **convert_file_with_extension(
+            **convert_file(
                 Parameter(
                     parameter.name,
                     parameter.args,
                     parameter.docstring,
                     parameter.default,
-                )
+                ),
+                registry,
             ),
             'widget': 'MultiFileChooser',
             'nargs': '+',
         }
+    elif parameter.type_annotation in LIST_PARSERS:
+        return {
+            'type': LIST_PARSERS[parameter.type_annotation],
+            'widget': 'Textarea',
+        }
     else:
         raise ValueError(f'list of {parameter.type_annotation} cannot be translated into a Gooey widget!')
 
 
+def convert_tuple(parameter: Parameter, registry: 'ConverterRegistry') -> dict[str, Any]:
+    types = parameter.type_annotation if isinstance(parameter.type_annotation, tuple) else (parameter.type_annotation,)
+    variadic = len(types) == 2 and types[1] is Ellipsis
+    if variadic:
+        types = types[:1]
+    if not all(element_type in ELEMENT_PARSERS for element_type in types):
+        raise ValueError(f'tuple of {parameter.type_annotation} cannot be translated into a Gooey widget!')
+    return {
+        'type': TupleOf(types, variadic),
+        'widget': 'Textarea',
+    }
+
+
 def convert_enum(parameter: Parameter) -> dict[str, Any]:
     return {
         'action': StoreEnumAction,
@@ -62,8 +106,11 @@ def convert_enum(parameter: Parameter) -> dict[str, Any]:
 
 DEFAULT_ORIGIN_CONVERTERS = {
     list:               convert_list,
+    tuple:              convert_tuple,
     Optional:           convert_optional,
-    FileWithExtension:  convert_file_with_extension
+    FileWithExtension:  convert_file_with_extension,
+    MappedFile:         convert_mapped_file,
+    DirectoryFiles:     convert_directory_files,
 }
 
 
@@ -106,6 +153,17 @@ DEFAULT_TYPE_INTERPRETATION = {
         'type': DirectoryPath,
         'widget': 'DirChooser',
     },
+    DirectoryFiles: {
+        'type': WalkDirectory(),
+        'widget': 'DirChooser',
+    },
+    MappedFile: {
+        'type': map_file,
+        'widget': 'FileChooser',
+        'gooey_options': {
+            'wildcard': "All files (*.*)|*.*",
+        },
+    },
 }
 
 
@@ -114,15 +172,164 @@ DEFAULT_SUBTYPES_CONVERTERS = {
 }
 
 
-def convert_to_argument(parameter: Parameter | Optional[Any]):
+def static_converter(args: dict[str, Any]) -> Converter:
+    """
+    Wraps a constant dict of add_argument args into a converter
+
+    :param args: args that every parameter of the converted type gets
+    """
+    def convert(parameter: Parameter) -> dict[str, Any]:
+        return dict(args)
+    convert.args = args
+    return convert
+
+
+class ConverterRegistry:
+    """
+    Maps parameters' annotations into converters (callables returning
+    add_argument args for a Parameter). Generic annotations are dispatched by
+    their origin, other annotations by their exact type and then by the first
+    of the type's base classes (in MRO order) that was registered with
+    include_subclasses. The resolved converter is cached per type
+    """
+    def __init__(self):
+        self._origin_converters: dict[Any, OriginConverter] = {}
+        self._type_converters: dict[Any, Converter] = {}
+        self._subtype_converters: dict[type, Converter] = {}
+        self._resolved: dict[Any, Converter] = {}
+        # bumped by every registration, lets callers tell whether the registry changed
+        self.version = 0
+
+    def register_origin(self, origin: Any, converter: OriginConverter):
+        """
+        :param origin: generic's origin (e.g. list) the converter should handle
+        :param converter: called with a Parameter annotated with the generic's
+        args and this registry (e.g. to convert the args with)
+        """
+        self._origin_converters[origin] = converter
+        self.version += 1
+
+    def register(
+        self,
+        annotation: Any,
+        converter: Converter | dict[str, Any],
+        include_subclasses: bool = False,
+    ):
+        """
+        :param annotation: type (or NewType) the converter should handle
+        :param converter: a converter or a constant dict of add_argument args
+        :param include_subclasses: whether the converter should handle the
+        annotation's subclasses too
+        """
+        if isinstance(converter, dict):
+            converter = static_converter(converter)
+        if include_subclasses:
+            self._subtype_converters[annotation] = converter
+        else:
+            self._type_converters[annotation] = converter
+        self._resolved.clear()
+        self.version += 1
+
+    def registrations(self) -> list[tuple[str, Any, Converter | OriginConverter]]:
+        """
+        :returns: every registered (kind, annotation or origin, converter), in
+        registration order, kind being 'origin', 'type' or 'subtypes'
+        """
+        return [
+            *(('origin', origin, converter) for origin, converter in self._origin_converters.items()),
+            *(('type', annotation, converter) for annotation, converter in self._type_converters.items()),
+            *(('subtypes', annotation, converter) for annotation, converter in self._subtype_converters.items()),
+        ]
+
+    def resolve(self, annotation: Any) -> Converter:
+        """
+        :param annotation: non generic annotation to find a converter for
+        :raises KeyError: if no converter can handle :annotation:
+        """
+        try:
+            return self._resolved[annotation]
+        except KeyError:
+            pass
+        except TypeError:
+            raise KeyError(annotation)
+
+        converter = self._type_converters.get(annotation)
+        if converter is None and isinstance(annotation, type):
+            for parent_type in annotation.__mro__:
+                if parent_type in self._subtype_converters:
+                    converter = self._subtype_converters[parent_type]
+                    break
+        if converter is None:
+            raise KeyError(annotation)
+
+        self._resolved[annotation] = converter
+        return converter
+
+    def convert(self, parameter: Parameter) -> dict[str, Any]:
+        """
+        :param parameter: parameter to find type specific add_argument args for
+        :raises KeyError: if no converter can handle :parameter:
+        """
+        if parameter.origin in self._origin_converters:
+            convert = self._origin_converters[parameter.origin]
+            return convert(
+                Parameter(
+                    parameter.name,
+                    parameter.args,
+                    docstring=parameter.docstring,
+                    default=parameter.default,
+                ),
+                self,
+            )
+        return self.resolve(parameter.type_annotation)(parameter)
+
+
+DEFAULT_REGISTRY = ConverterRegistry()
+for origin, converter in DEFAULT_ORIGIN_CONVERTERS.items():
+    DEFAULT_REGISTRY.register_origin(origin, converter)
+for annotation, args in DEFAULT_TYPE_INTERPRETATION.items():
+    DEFAULT_REGISTRY.register(annotation, args)
+for parent_type, converter in DEFAULT_SUBTYPES_CONVERTERS.items():
+    DEFAULT_REGISTRY.register(parent_type, converter, include_subclasses=True)
+
+
+def register_converter(
+    annotation: Any,
+    converter: Converter | dict[str, Any],
+    include_subclasses: bool = False,
+):
+    """
+    Teaches gooey_quick how to turn parameters annotated with :annotation:
+    into a Gooey widget. See ConverterRegistry.register
+    """
+    DEFAULT_REGISTRY.register(annotation, converter, include_subclasses)
+
+
+def register_origin_converter(origin: Any, converter: OriginConverter):
+    """
+    Teaches gooey_quick how to turn parameters annotated with a generic of
+    :origin: into a Gooey widget. See ConverterRegistry.register_origin
+    """
+    DEFAULT_REGISTRY.register_origin(origin, converter)
+
+
+def convert_to_argument(
+    parameter: Parameter | Optional[Any],
+    registry: ConverterRegistry = DEFAULT_REGISTRY,
+):
     """
     converts a parameter into dict of args for gooey.GooeyParser.add_argument
 
     :param parameter: parameter to be converted
+    :param registry: converters to translate the parameter with
     :raises ValueError: if parameter cannot be translated into a gooey widget
     :returns: dict of args to be passed int gooey.GooeyParser.add_argument
     """
+    with instrumentation.span('convert_to_argument', parameter=parameter.name):
+        return _convert_to_argument(parameter, registry)
+
 
+def _convert_to_argument(parameter: Parameter, registry: ConverterRegistry) -> dict[str, Any]:
     args = {
         'dest': parameter.name,
         'metavar': parameter.name.capitalize().replace('_', ' '),
@@ -136,31 +343,18 @@ def convert_to_argument(parameter: Parameter | Optional[Any]):
             parameter.default is not None
             and parameter.type_annotation not in {int, float, str, bool}
         )
+        initial_value = parameter.default
+        if stringify_default:
+            if isinstance(initial_value, (list, tuple)):
+                initial_value = ', '.join(map(str, initial_value))
+            else:
+                initial_value = str(initial_value)
         args['gooey_options'] = {
-            'initial_value': str(parameter.default) if stringify_default else parameter.default
+            'initial_value': initial_value,
         }
 
     try:
-        if parameter.origin in DEFAULT_ORIGIN_CONVERTERS:
-            convert = DEFAULT_ORIGIN_CONVERTERS[parameter.origin]
-            type_specific_args = convert(
-                Parameter(
-                    parameter.name,
-                    parameter.args,
-                    docstring=parameter.docstring,
-                    default=parameter.default,
-                )
-            )
-        elif parameter.type_annotation in DEFAULT_TYPE_INTERPRETATION:
-            type_specific_args = DEFAULT_TYPE_INTERPRETATION[parameter.type_annotation]
-        else:
-            for parent_type in DEFAULT_SUBTYPES_CONVERTERS:
-                if issubclass(parameter.type_annotation, parent_type):
-                    convert = DEFAULT_SUBTYPES_CONVERTERS[parent_type]
-                    type_specific_args = convert(parameter)
-                    break
-            else:
-                raise KeyError()
+        type_specific_args = registry.convert(parameter)
     except KeyError:
         raise ValueError(f'{parameter.type_annotation} cannot be translated into a Gooey widget!')
 
@@ -179,5 +373,6 @@ class StoreEnumAction(Action):
         super().__init__(*args, **kwargs)
 
     def __call__(self, parser, namespace, values, option_string=None):
-        setattr(namespace, self.dest, self.enum_type[values])
+        with instrumentation.span('convert_argument', parameter=self.dest):
+            setattr(namespace, self.dest, self.enum_type[values])
 
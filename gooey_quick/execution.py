@@ -0,0 +1,155 @@
+"""calling handlers with the arguments parsed from Gooey's (or the command line's) input"""
+import sys
+import signal
+import inspect
+from collections.abc import Generator, AsyncGenerator, Coroutine
+from typing import Callable, Any
+
+from gooey_quick import parallel, instrumentation, mapping, reporting
+
+# signals Gooey's Stop button may terminate the run with, see Gooey's shutdown_signal option
+SHUTDOWN_SIGNALS = tuple(
+    getattr(signal, name) for name in ('SIGTERM', 'SIGBREAK') if hasattr(signal, name)
+)
+
+
+def drain_generator(generator: Generator[Any, Any, Any]) -> Any:
+    """
+    Prints every item yielded by :generator: as soon as it's produced, so it
+    shows up in Gooey's console immediately. Items aren't kept, None items are
+    skipped (a bare yield can be used as a heartbeat). Runs on a GUI thread
+    (see gooey_quick.threaded) are stopped between items once cancelled
+
+    :param generator: generator returned by a handler
+    :raises SystemExit: if the run was cancelled
+    :returns: the generator's return value
+    """
+    # like asyncio, threaded is only imported by the handlers needing it
+    from gooey_quick.threaded import cancelled
+
+    while True:
+        try:
+            item = next(generator)
+        except StopIteration as stop:
+            return stop.value
+        if item is not None:
+            print(item, flush=True)
+        if cancelled():
+            generator.close()
+            raise SystemExit('the run was cancelled')
+
+
+async def drain_async_generator(generator: AsyncGenerator[Any, Any]):
+    """
+    Asynchronous counterpart of drain_generator, async generators can't return values
+    """
+    async for item in generator:
+        if item is not None:
+            print(item, flush=True)
+
+
+# seconds between two checks of a GUI thread run's cancellation
+CANCELLATION_POLL_INTERVAL = 0.1
+
+
+def exit_code(code: Any) -> int:
+    """
+    Translates SystemExit's code into a process' exit code, printing
+    non-integer codes (i.e. messages) to stderr like the interpreter does
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_coroutine(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Runs :coroutine: on a new event loop. Stopping the run from Gooey
+    (i.e. receiving one of SHUTDOWN_SIGNALS, or cancelling a run on a GUI
+    thread) cancels the coroutine, so its finally blocks and async context
+    managers get to clean up
+
+    :param coroutine: coroutine returned by a handler
+    :raises SystemExit: if the run was cancelled
+    :returns: the coroutine's return value
+    """
+    # only async handlers pay for asyncio's import
+    import asyncio
+    from gooey_quick import threaded
+
+    async def main():
+        task = asyncio.ensure_future(coroutine)
+        loop = asyncio.get_running_loop()
+        loop_handled_signals, previous_handlers = [], {}
+        for signal_number in SHUTDOWN_SIGNALS:
+            try:
+                loop.add_signal_handler(signal_number, task.cancel)
+                loop_handled_signals.append(signal_number)
+            except NotImplementedError:
+                # e.g. Windows' event loops, fall back to a plain signal handler
+                previous_handlers[signal_number] = signal.signal(
+                    signal_number,
+                    lambda *_: loop.call_soon_threadsafe(task.cancel),
+                )
+            except (RuntimeError, ValueError):
+                # signals can only be handled in the main thread
+                pass
+
+        async def cancel_when_requested(run: threaded.ThreadRun):
+            while not run.cancel_requested.is_set():
+                await asyncio.sleep(CANCELLATION_POLL_INTERVAL)
+            task.cancel()
+
+        run = threaded.current_run()
+        watcher = None if run is None else asyncio.ensure_future(cancel_when_requested(run))
+        try:
+            return await task
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+            for signal_number in loop_handled_signals:
+                loop.remove_signal_handler(signal_number)
+            for signal_number, previous_handler in previous_handlers.items():
+                signal.signal(signal_number, previous_handler)
+
+    try:
+        return asyncio.run(main())
+    except asyncio.CancelledError:
+        raise SystemExit('the run was cancelled')
+
+
+def call_handler(handler: Callable[..., Any], arguments: dict[str, Any]) -> Any:
+    """
+    Calls :handler: with :arguments:, generator handlers are consumed
+    incrementally, async handlers are run on an event loop and handlers
+    decorated with parallel.map_over are called for every item in parallel
+
+    :param handler: function a gooey_quick program was created from
+    :param arguments: parsed arguments, keyed by the handler's parameter names
+    :returns: the handler's return value
+    """
+    reporting.reset()
+    try:
+        with instrumentation.span('handler', handler=getattr(handler, '__qualname__', repr(handler))):
+            if parallel.mapped_parameter(handler) is not None:
+                return parallel.map_items(handler, arguments)
+            return invoke_handler(handler, arguments)
+    finally:
+        mapping.release_mapped_files(arguments)
+
+
+def invoke_handler(handler: Callable[..., Any], arguments: dict[str, Any]) -> Any:
+    """
+    Calls :handler: once, see call_handler
+    """
+    result = handler(**arguments)
+    if inspect.iscoroutine(result):
+        return run_coroutine(result)
+    if inspect.isasyncgen(result):
+        return run_coroutine(drain_async_generator(result))
+    if inspect.isgenerator(result):
+        return drain_generator(result)
+    return result
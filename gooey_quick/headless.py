@@ -0,0 +1,62 @@
+"""running gooey_quick programs without Gooey (and thus without wxPython)"""
+import os
+import sys
+import argparse
+from typing import Optional
+
+IGNORE_GOOEY_FLAG = '--ignore-gooey'
+
+HEADLESS_ENVIRONMENT_VARIABLE = 'GOOEY_QUICK_HEADLESS'
+
+# only set for warm workers (see gooey_quick.worker), checked here so that plain runs don't import the worker
+WORKER_ENVIRONMENT_VARIABLE = 'GOOEY_QUICK_WORKER_LISTEN'
+
+GOOEY_ONLY_ARGUMENTS = ('widget', 'gooey_options')
+
+FLAG_ACTIONS = ('store_true', 'store_false')
+
+
+def is_headless(argv: Optional[list[str]] = None) -> bool:
+    """
+    Checks whether the program runs as Gooey's child process or from the command line
+
+    :param argv: command line to inspect, defaults to sys.argv
+    :returns: True if Gooey's GUI should not be started
+    """
+    if argv is None:
+        argv = sys.argv
+    return IGNORE_GOOEY_FLAG in argv or bool(os.environ.get(HEADLESS_ENVIRONMENT_VARIABLE))
+
+
+def is_worker() -> bool:
+    """
+    :returns: whether this process was started as a warm worker, see gooey_quick.worker
+    """
+    return WORKER_ENVIRONMENT_VARIABLE in os.environ
+
+
+def strip_ignore_gooey_flag(argv: Optional[list[str]] = None):
+    """
+    Removes Gooey's --ignore-gooey flag (in place) so it does not reach argparse
+
+    :param argv: command line to modify, defaults to sys.argv
+    """
+    if argv is None:
+        argv = sys.argv
+    while IGNORE_GOOEY_FLAG in argv:
+        argv.remove(IGNORE_GOOEY_FLAG)
+
+
+class HeadlessParser(argparse.ArgumentParser):
+    """
+    An argparse.ArgumentParser that accepts GooeyParser's add_argument signature.
+    The Gooey specific options (widget, gooey_options) are dropped, since there
+    is no GUI to render them in
+    """
+    def add_argument(self, *args, **kwargs):
+        for gooey_only_argument in GOOEY_ONLY_ARGUMENTS:
+            kwargs.pop(gooey_only_argument, None)
+        if kwargs.get('action') in FLAG_ACTIONS:
+            # GooeyParser uses metavar as the checkbox's label, argparse's flags reject it
+            kwargs.pop('metavar', None)
+        return super().add_argument(*args, **kwargs)
@@ -0,0 +1,210 @@
+"""
+Timing events for gooey_quick's pipeline stages. Nothing is measured until a
+sink is enabled, either with run_gooey(trace=...) or the GOOEY_QUICK_TRACE
+environment variable (a file path, prefixed with `jsonl:` or `chrome:`).
+Events follow Chrome's trace event format ("complete" events), so they can be
+opened with chrome://tracing or https://ui.perfetto.dev
+"""
+import os
+import json
+import time
+import atexit
+import functools
+import threading
+from pathlib import Path
+from typing import Callable, Any
+
+TRACE_ENVIRONMENT_VARIABLE = 'GOOEY_QUICK_TRACE'
+
+Event = dict[str, Any]
+
+_sinks: list['Sink'] = []
+
+
+class Sink:
+    """receives every timing event, see CallbackSink, JsonLinesSink and ChromeTraceSink"""
+    def emit(self, event: Event):
+        raise NotImplementedError()
+
+    def close(self):
+        pass
+
+
+class CallbackSink(Sink):
+    """passes the events to a callable"""
+    def __init__(self, callback: Callable[[Event], Any]):
+        self.callback = callback
+
+    def emit(self, event: Event):
+        self.callback(event)
+
+
+class JsonLinesSink(Sink):
+    """
+    appends the events to a file, one JSON object per line. Gooey's GUI and
+    child processes may append to the same file
+    """
+    def __init__(self, path: os.PathLike):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _line(self, event: Event) -> str:
+        return json.dumps(event, default=str) + '\n'
+
+    def emit(self, event: Event):
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', buffering=1)
+            self._file.write(self._line(event))
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ChromeTraceSink(JsonLinesSink):
+    """
+    appends the events to a trace event file in the JSON array format, whose
+    closing bracket is optional, so that several processes can append to it
+    """
+    def emit(self, event: Event):
+        try:
+            with open(self.path, 'x') as f:
+                f.write('[\n')
+        except FileExistsError:
+            pass
+        super().emit(event)
+
+    def _line(self, event: Event) -> str:
+        return json.dumps(event, default=str) + ',\n'
+
+
+def sink_from_specification(specification: str) -> Sink:
+    """
+    Creates a sink from a 'jsonl:<path>' or 'chrome:<path>' specification,
+    without a prefix, '.jsonl' files get a JsonLinesSink, others a ChromeTraceSink
+    """
+    kind, separator, path = specification.partition(':')
+    if separator and kind in ('jsonl', 'chrome'):
+        return JsonLinesSink(path) if kind == 'jsonl' else ChromeTraceSink(path)
+    if specification.endswith('.jsonl'):
+        return JsonLinesSink(specification)
+    return ChromeTraceSink(specification)
+
+
+def _as_sink(sink: Sink | Callable[[Event], Any] | str | os.PathLike) -> Sink:
+    if isinstance(sink, Sink):
+        return sink
+    if isinstance(sink, (str, os.PathLike)):
+        return sink_from_specification(os.fspath(sink))
+    if callable(sink):
+        return CallbackSink(sink)
+    raise ValueError(f'{sink} is not a trace sink, a callable nor a path')
+
+
+def enable(*sinks: Sink | Callable[[Event], Any] | str | os.PathLike):
+    """
+    Starts sending timing events to :sinks:
+
+    :param sinks: Sink instances, callbacks taking an event dict or trace file specifications
+    """
+    if not _sinks:
+        atexit.register(disable)
+    _sinks.extend(map(_as_sink, sinks))
+
+
+def enable_from_environment():
+    """
+    Enables the sink set with the GOOEY_QUICK_TRACE environment variable (once)
+    """
+    specification = os.environ.get(TRACE_ENVIRONMENT_VARIABLE)
+    if specification and not any(getattr(sink, 'from_environment', False) for sink in _sinks):
+        sink = sink_from_specification(specification)
+        sink.from_environment = True
+        enable(sink)
+
+
+def disable():
+    """
+    Closes and removes every sink
+    """
+    while _sinks:
+        _sinks.pop().close()
+
+
+def enabled() -> bool:
+    return bool(_sinks)
+
+
+def emit(event: Event):
+    for sink in _sinks:
+        sink.emit(event)
+
+
+class _Span:
+    __slots__ = ('name', 'fields', 'start')
+
+    def __init__(self, name: str, fields: dict[str, Any]):
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        emit({
+            'name': self.name,
+            'cat': 'gooey_quick',
+            'ph': 'X',
+            'ts': self.start / 1000,
+            'dur': (end - self.start) / 1000,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': self.fields,
+        })
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str, **fields: Any) -> _Span | _NoSpan:
+    """
+    Context manager timing its body as the :name: event, costs next to
+    nothing when no sink is enabled
+
+    :param name: the pipeline stage's name
+    :param fields: details attached to the event (e.g. the parameter's name)
+    """
+    if not _sinks:
+        return _NO_SPAN
+    return _Span(name, fields)
+
+
+def timed(name: str, function: Callable[..., Any], **fields: Any) -> Callable[..., Any]:
+    """
+    Wraps :function: so every call is timed as the :name: event
+
+    :param name: the pipeline stage's name
+    :param function: callable to time, e.g. an argparse type
+    :param fields: details attached to the events
+    """
+    @functools.wraps(function)
+    def inner(*args, **kwargs):
+        with span(name, **fields):
+            return function(*args, **kwargs)
+    return inner
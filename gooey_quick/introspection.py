@@ -2,30 +2,109 @@
 import re
 import typing
 import inspect
+import weakref
 import collections
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any, Optional, Union, TypeVar, Callable
 
+from gooey_quick import instrumentation
+from gooey_quick.parallel import mapped_parameter
+
 T = TypeVar('T')
 
 
 DOCSTRING_PARAM_REGEX = re.compile(r'(?:param +)(\w+)(?:: +)((?:\w+| )+)')
 
+# callables' parsed parameters and resolved signatures, entries disappear together with the callables
+_PARSED_PARAMETERS_CACHE = weakref.WeakKeyDictionary()
+_SIGNATURES_CACHE = weakref.WeakKeyDictionary()
+
+
+def _weakly_cached(
+    cache: weakref.WeakKeyDictionary,
+    function: Callable[..., Any],
+    compute: Callable[[Callable[..., Any]], T],
+) -> T:
+    try:
+        value = cache.get(function)
+    except TypeError:
+        # callables that can't be weakly referenced are not cached
+        return compute(function)
+
+    if value is None:
+        value = compute(function)
+        cache[function] = value
+    return value
+
+
+def _closure_variables(function: Callable[..., Any]) -> dict[str, Any]:
+    function = inspect.unwrap(function)
+    code = getattr(function, '__code__', None)
+    closure = getattr(function, '__closure__', None) or ()
+    if code is None:
+        return {}
+
+    variables = {}
+    for name, cell in zip(code.co_freevars, closure):
+        try:
+            variables[name] = cell.cell_contents
+        except ValueError:
+            # the variable hasn't been assigned yet
+            pass
+    return variables
+
+
+def _resolve_signature(function: Callable[..., Any]) -> tuple[inspect.Parameter, ...]:
+    with instrumentation.span('extract_signature', function=getattr(function, '__qualname__', repr(function))):
+        return _evaluate_signature(function)
+
+
+def _evaluate_signature(function: Callable[..., Any]) -> tuple[inspect.Parameter, ...]:
+    try:
+        signature = inspect.signature(function, eval_str=True, locals=_closure_variables(function))
+    except Exception:
+        # some annotation can't be evaluated, resolve the ones that can
+        signature = inspect.signature(function)
+        globals_ = getattr(inspect.unwrap(function), '__globals__', {})
+        locals_ = _closure_variables(function)
+        resolved_parameters = []
+        for parameter in signature.parameters.values():
+            if isinstance(parameter.annotation, str):
+                try:
+                    parameter = parameter.replace(annotation=eval(parameter.annotation, globals_, locals_))
+                except Exception:
+                    pass
+            resolved_parameters.append(parameter)
+        return tuple(resolved_parameters)
+
+    return tuple(signature.parameters.values())
+
 
 def extract_signature(function: Callable[..., Any]) -> Iterable[inspect.Parameter]:
-    return inspect.signature(function).parameters.values()
+    """
+    Returns :function:'s parameters with stringified annotations (e.g. from
+    modules using `from __future__ import annotations`) evaluated. The result
+    is cached per function
+    """
+    return _weakly_cached(_SIGNATURES_CACHE, function, _resolve_signature)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Parameter:
     """class for keeping function's parameter signature and docstring"""
     name: str
     type_annotation: type[T]
     docstring: Optional[str] = None
     default: Optional[T] = inspect.Parameter.empty
+    origin: Optional[type] = field(init=False, repr=False, compare=False)
+    args: Optional[type | tuple[type]] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        # the parameter is immutable, so its origin and args are computed only once
+        object.__setattr__(self, 'origin', self._compute_origin())
+        object.__setattr__(self, 'args', self._compute_args())
+
         if self.type_annotation is bool and not self.has_default_value:
             raise ValueError('bool field must have an optional value')
         if self.origin == Union:
@@ -34,8 +113,7 @@ class Parameter:
             elif self.has_default_value and self.default is not None:
                 raise ValueError(f'Optionals with default non None values are inappropriate see https://docs.python.org/3/library/typing.html#typing.Optional')
 
-    @property
-    def origin(self) -> Optional[type]:
+    def _compute_origin(self) -> Optional[type]:
         origin = typing.get_origin(self.type_annotation)
         if origin is None:
             return None
@@ -47,8 +125,7 @@ class Parameter:
         )
         return origin if not is_optional else Optional
 
-    @property
-    def args(self) -> Optional[type | tuple[type]]:
+    def _compute_args(self) -> Optional[type | tuple[type]]:
         args = typing.get_args(self.type_annotation)
         if not args:
             return None
@@ -72,7 +149,23 @@ class Parameter:
         :param function: callable to inspect
         :param signature_extractor: method to extract the inspect.Parameter list with
         """
-        parameters_docstring = dict(DOCSTRING_PARAM_REGEX.findall(function.__doc__)) if function.__doc__ else {}
+        if signature_extractor is not extract_signature:
+            return Parameter._parse_callable_parameters(function, signature_extractor)
+
+        return list(_weakly_cached(
+            _PARSED_PARAMETERS_CACHE,
+            function,
+            lambda function: tuple(Parameter._parse_callable_parameters(function, signature_extractor)),
+        ))
+
+    @staticmethod
+    def _parse_callable_parameters(
+        function: Callable[..., Any],
+        signature_extractor: Callable[..., Iterable[inspect.Parameter]],
+    ) -> list['Parameter']:
+        with instrumentation.span('parse_docstring', function=getattr(function, '__qualname__', repr(function))):
+            parameters_docstring = dict(DOCSTRING_PARAM_REGEX.findall(function.__doc__)) if function.__doc__ else {}
+        mapping = mapped_parameter(function)
 
         parsed_parameters = []
         for parameter in signature_extractor(function):
@@ -81,10 +174,15 @@ class Parameter:
             else:
                 docstring = None
 
+            type_annotation = parameter.annotation
+            if mapping is not None and parameter.name == mapping.parameter:
+                # the function takes a single item, the GUI asks for a list of them
+                type_annotation = list[type_annotation]
+
             parsed_parameters.append(
                 Parameter(
                     name=parameter.name,
-                    type_annotation=parameter.annotation,
+                    type_annotation=type_annotation,
                     docstring=docstring,
                     default=parameter.default,
                 )
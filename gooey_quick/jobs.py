@@ -0,0 +1,209 @@
+"""
+Queueing runs instead of waiting for them: every submission from the GUI
+becomes a job, run as a child process of the GUI by a bounded pool, with its
+output saved to a log file. Submitting returns at once and prints every
+job's status, so the form can be changed and submitted again right away.
+A checkbox lets a submission only print the status
+"""
+import os
+import sys
+import time
+import shlex
+import atexit
+import threading
+import subprocess
+from datetime import datetime
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from gooey_quick import cache, argument_files
+from gooey_quick.headless import IGNORE_GOOEY_FLAG
+
+QUEUED = 'queued'
+
+RUNNING = 'running'
+
+SUCCEEDED = 'succeeded'
+
+FAILED = 'failed'
+
+CANCELLED = 'cancelled'
+
+# longest command line shown in the status table
+ARGUMENTS_WIDTH = 60
+
+STATUS_ONLY_DEST = 'gooey_quick_job_status'
+
+
+@dataclass
+class Job:
+    """a run submitted to a JobQueue"""
+    number: int
+    argv: list[str]
+    log_path: str
+    status: str = QUEUED
+    exit_code: Optional[int] = None
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    process: Optional[subprocess.Popen] = field(default=None, repr=False)
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started is None:
+            return None
+        return (self.finished or time.monotonic()) - self.started
+
+
+def add_status_argument(parser):
+    """
+    Adds the 'Only show the jobs' status' checkbox to :parser:, ticking it makes
+    a submission print the status table without queueing a job
+    """
+    parser.add_argument(
+        f'--{STATUS_ONLY_DEST}',
+        dest=STATUS_ONLY_DEST,
+        action='store_true',
+        required=False,
+        metavar='Only show the jobs\' status',
+        help='print the status of the queued jobs instead of queueing a new one',
+        widget='CheckBox',
+    )
+
+
+class JobQueue:
+    """
+    Runs :command: followed by every job's arguments, :max_workers: jobs at a
+    time, in the order they were submitted
+    """
+    def __init__(self, command: list[str], max_workers: int, log_directory: Optional[os.PathLike] = None):
+        """
+        :param command: the program to run, e.g. [sys.executable, 'program.py']
+        :param max_workers: how many jobs may run at once
+        :param log_directory: where the jobs' output is saved, defaults to a
+        new directory in gooey_quick's cache
+        """
+        self.command = command
+        self.log_directory = log_directory or cache.cache_directory('jobs', f'{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}')
+        self.jobs: list[Job] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='gooey_quick-job')
+
+    def submit(self, argv: list[str], cwd: Optional[str] = None) -> Job:
+        """
+        Queues a run of the program with :argv:, long command lines are passed
+        through an argument file (see gooey_quick.argument_files)
+
+        :param argv: command line arguments
+        :param cwd: the run's working directory, defaults to the current one
+        """
+        with self._lock:
+            job = Job(len(self.jobs) + 1, argv, os.path.join(self.log_directory, f'job-{len(self.jobs) + 1}.log'))
+            self.jobs.append(job)
+        self._executor.submit(self._run, job, cwd or os.getcwd())
+        return job
+
+    def _command_line(self, job: Job) -> list[str]:
+        if sum(map(len, job.argv)) <= argument_files.SPILL_THRESHOLD:
+            return [*self.command, *job.argv]
+        return [
+            *self.command,
+            IGNORE_GOOEY_FLAG,
+            argument_files.ARGUMENT_FILE_FLAG,
+            argument_files.write_argument_file(argument for argument in job.argv if argument != IGNORE_GOOEY_FLAG),
+        ]
+
+    def _run(self, job: Job, cwd: str):
+        with self._lock:
+            if job.status == CANCELLED:
+                return
+            job.status = RUNNING
+            job.started = time.monotonic()
+            try:
+                with open(job.log_path, 'wb') as log:
+                    job.process = subprocess.Popen(
+                        self._command_line(job),
+                        stdout=log,
+                        stderr=subprocess.STDOUT,
+                        stdin=subprocess.DEVNULL,
+                        cwd=cwd,
+                        env={**os.environ, 'GOOEY': '1', 'PYTHONIOENCODING': 'utf-8'},
+                    )
+            except Exception as error:
+                # e.g. a missing working directory or interpreter, the executor would swallow it
+                self._fail_to_start(job, error)
+                return
+
+        exit_code = job.process.wait()
+        with self._lock:
+            job.exit_code = exit_code
+            job.finished = time.monotonic()
+            if job.status == RUNNING:
+                job.status = SUCCEEDED if exit_code == 0 else FAILED
+
+    @staticmethod
+    def _fail_to_start(job: Job, error: Exception):
+        job.status = FAILED
+        job.finished = time.monotonic()
+        try:
+            with open(job.log_path, 'a') as log:
+                log.write(f'gooey_quick: the job could not be started: {error}\n')
+        except OSError:
+            pass
+
+    def status_table(self) -> str:
+        """
+        :returns: every job's number, status, exit code, run time and arguments
+        """
+        lines = [f'{"job":>4}  {"status":<9}  {"exit":>4}  {"time":>8}  arguments']
+        with self._lock:
+            for job in self.jobs:
+                duration = '' if job.duration is None else f'{job.duration:.1f}s'
+                exit_code = '' if job.exit_code is None else job.exit_code
+                arguments = shlex.join(argument for argument in job.argv if argument != IGNORE_GOOEY_FLAG)
+                if len(arguments) > ARGUMENTS_WIDTH:
+                    arguments = arguments[:ARGUMENTS_WIDTH - 3] + '...'
+                lines.append(f'{job.number:>4}  {job.status:<9}  {exit_code:>4}  {duration:>8}  {arguments}')
+        return '\n'.join(lines)
+
+    def submit_and_report(self, argv: list[str]):
+        """
+        What a GUI submission runs (see gooey_quick.threaded): queues the job
+        and prints the status of every job. Only the status is printed if the
+        status checkbox (see add_status_argument) was ticked
+        """
+        if f'--{STATUS_ONLY_DEST}' in argv:
+            print(self.status_table(), flush=True)
+            return
+        job = self.submit(argv)
+        print(f'Job {job.number} queued, its output goes to {job.log_path}\n')
+        print(self.status_table(), flush=True)
+
+    def shutdown(self, cancel: bool = False):
+        """
+        Waits for the jobs to finish
+
+        :param cancel: kill the running jobs and drop the queued ones instead
+        """
+        if cancel:
+            with self._lock:
+                for job in self.jobs:
+                    if job.status in (QUEUED, RUNNING):
+                        job.status = CANCELLED
+                        if job.process is not None:
+                            job.process.kill()
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+
+
+def start_queue(max_workers: int, command: Optional[list[str]] = None) -> JobQueue:
+    """
+    Creates the GUI's job queue, whose jobs are killed when the GUI exits
+
+    :param max_workers: how many jobs may run at once
+    :param command: the program to run, defaults to this program
+    """
+    if command is None:
+        command = [sys.executable, '-u', os.path.abspath(sys.argv[0])]
+    queue = JobQueue(command, max_workers)
+    atexit.register(queue.shutdown, cancel=True)
+    return queue
@@ -0,0 +1,102 @@
+"""memory mapping the files handlers receive as types.MappedFile"""
+import mmap
+from dataclasses import dataclass
+from argparse import ArgumentTypeError
+from typing import Any, Callable
+
+
+class _FileMapping(mmap.mmap):
+    """an mmap remembering the path of the file it maps"""
+    path: str
+
+
+class _EmptyFile(bytes):
+    """contents of an empty file (which can't be mapped), remembering its path"""
+    path: str
+
+
+@dataclass(frozen=True)
+class MappedPath:
+    """
+    Stands for a file mapped by map_file while arguments are sent to another
+    process, memoryviews can't be pickled
+    """
+    path: str
+
+
+def map_file(path: str) -> memoryview:
+    """
+    argparse type turning a path into a read-only memoryview of the file's
+    memory mapped contents. Pages are only read when the handler touches them
+
+    :param path: file to map
+    :raises ArgumentTypeError: if the file can't be mapped
+    """
+    try:
+        with open(path, 'rb') as f:
+            try:
+                contents = _FileMapping(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files can't be mapped
+                contents = _EmptyFile()
+    except OSError as error:
+        raise ArgumentTypeError(f"can't map {path}: {error.strerror or error}")
+    contents.path = path
+    return memoryview(contents)
+
+
+def _map_values(arguments: dict[str, Any], transform: Callable[[Any], Any]) -> dict[str, Any]:
+    return {
+        name: type(value)(map(transform, value)) if isinstance(value, (list, tuple)) else transform(value)
+        for name, value in arguments.items()
+    }
+
+
+def _to_mapped_path(value: Any) -> Any:
+    if isinstance(value, memoryview) and isinstance(value.obj, (_FileMapping, _EmptyFile)):
+        return MappedPath(value.obj.path)
+    return value
+
+
+def _to_mapped_file(value: Any) -> Any:
+    return map_file(value.path) if isinstance(value, MappedPath) else value
+
+
+def portable_arguments(arguments: dict[str, Any]) -> dict[str, Any]:
+    """
+    :returns: :arguments: with map_file's views replaced by MappedPaths, so
+    that they can be sent to a worker process (see mapped_arguments)
+    """
+    return _map_values(arguments, _to_mapped_path)
+
+
+def mapped_arguments(arguments: dict[str, Any]) -> dict[str, Any]:
+    """
+    :returns: :arguments: with portable_arguments' MappedPaths mapped again
+    """
+    return _map_values(arguments, _to_mapped_file)
+
+
+def _release(value: Any):
+    if isinstance(value, memoryview) and isinstance(value.obj, mmap.mmap):
+        mapping = value.obj
+        try:
+            value.release()
+            mapping.close()
+        except BufferError:
+            # the handler kept (or exported) views of the mapping, it's closed once they're collected
+            pass
+
+
+def release_mapped_files(arguments: dict[str, Any]):
+    """
+    Unmaps the files map_file mapped for :arguments:, once the handler returned
+
+    :param arguments: arguments the handler was called with
+    """
+    for value in arguments.values():
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                _release(item)
+        else:
+            _release(value)
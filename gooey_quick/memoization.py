@@ -0,0 +1,192 @@
+"""
+Persistent memoization of handlers' results: a run with the same arguments
+as an earlier one (and unchanged input files) returns the stored result
+instead of running the handler again. Results are kept in gooey_quick's
+cache directory, the least recently used ones are evicted past a size limit
+"""
+import os
+import stat
+import pickle
+import hashlib
+import inspect
+import tempfile
+from enum import Enum
+from pathlib import Path, PurePath
+from typing import Callable, Any, get_args
+
+from gooey_quick import cache
+from gooey_quick.types import SaveToPath
+from gooey_quick.traversal import DirectoryWalk
+from gooey_quick.introspection import Parameter
+
+SIZE_LIMIT_ENVIRONMENT_VARIABLE = 'GOOEY_QUICK_RESULTS_CACHE_SIZE'
+
+# bytes of results kept on disk, unless set with GOOEY_QUICK_RESULTS_CACHE_SIZE
+SIZE_LIMIT = 256 * 1024 * 1024
+
+STAT = 'stat'
+
+CONTENT = 'content'
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class NotMemoizable(Exception):
+    """raised for arguments whose state can't be fingerprinted"""
+
+
+def fingerprint_mode(memoize: bool | str) -> str:
+    """
+    :param memoize: True (same as 'stat'), 'stat' (input files are identified
+    by their size and modification time) or 'content' (by their contents' hash)
+    :raises ValueError: for unknown modes
+    """
+    if memoize is True:
+        return STAT
+    if memoize in (STAT, CONTENT):
+        return memoize
+    raise ValueError(f'{memoize} is not a memoization mode, use True, {STAT!r} or {CONTENT!r}')
+
+
+def _content_hash(path: PurePath) -> str:
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def argument_fingerprint(value: Any, mode: str = STAT) -> Any:
+    """
+    Turns an argument into a picklable value that changes whenever the
+    handler's result could: paths are replaced with their file's state
+
+    :param value: parsed argument
+    :param mode: STAT or CONTENT
+    :raises NotMemoizable: for arguments such as memory mapped files or directory walks
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, [argument_fingerprint(item, mode) for item in value]
+    if isinstance(value, (memoryview, DirectoryWalk)):
+        raise NotMemoizable(f'{value!r} can not be fingerprinted')
+
+    if isinstance(value, Enum):
+        return repr(value)
+    if isinstance(value, PurePath):
+        path = os.path.abspath(value)
+        try:
+            status = os.stat(path)
+        except OSError:
+            return path, None
+        if mode == CONTENT and stat.S_ISREG(status.st_mode):
+            return path, _content_hash(path)
+        return path, status.st_size, status.st_mtime_ns
+    return value
+
+
+def writes_outputs(handler: Callable[..., Any]) -> bool:
+    """
+    :returns: whether :handler: takes SaveToPath parameters. Writing them is
+    the run's side effect, which a stored result wouldn't reproduce
+    """
+    return any(
+        SaveToPath in (parameter.type_annotation, *get_args(parameter.type_annotation))
+        for parameter in Parameter.parse_callable_parameters(handler)
+    )
+
+
+def result_key(handler: Callable[..., Any], arguments: dict[str, Any], mode: str = STAT) -> str:
+    """
+    Identifies a run by the handler (see cache.function_fingerprint) and the
+    fingerprints of its arguments
+
+    :raises NotMemoizable: if an argument can't be fingerprinted
+    """
+    fingerprints = sorted((name, argument_fingerprint(value, mode)) for name, value in arguments.items())
+    try:
+        payload = pickle.dumps((cache.cache_key(handler), cache.function_fingerprint(handler), fingerprints))
+    except Exception as error:
+        raise NotMemoizable(f"the arguments can't be pickled: {error}") from error
+    return hashlib.sha256(payload).hexdigest()
+
+
+def size_limit() -> int:
+    """
+    :returns: the results cache's size limit in bytes
+    """
+    return int(os.environ.get(SIZE_LIMIT_ENVIRONMENT_VARIABLE) or SIZE_LIMIT)
+
+
+def evict(directory: Path, limit: int):
+    """
+    Removes the least recently used results from :directory: until they take at most :limit: bytes
+    """
+    entries = []
+    for entry in os.scandir(directory):
+        try:
+            status = entry.stat()
+        except OSError:
+            continue
+        entries.append((status.st_mtime_ns, status.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def memoized_call(
+    call: Callable[[Callable[..., Any], dict[str, Any]], Any],
+    handler: Callable[..., Any],
+    arguments: dict[str, Any],
+    mode: str = STAT,
+) -> Any:
+    """
+    Returns the stored result of an earlier identical run, or calls
+    call(handler, arguments) and stores its result. Generator handlers (whose
+    output is the point), handlers failing, handlers writing SaveToPath
+    outputs and arguments that can't be fingerprinted are never memoized
+
+    :param call: runs the handler, e.g. execution.call_handler
+    :param handler: function to run
+    :param arguments: parsed arguments, keyed by :handler:'s parameter names
+    :param mode: STAT or CONTENT, how input files are fingerprinted
+    """
+    if inspect.isgeneratorfunction(handler) or inspect.isasyncgenfunction(handler) or writes_outputs(handler):
+        return call(handler, arguments)
+    try:
+        key = result_key(handler, arguments, mode)
+    except NotMemoizable:
+        return call(handler, arguments)
+
+    directory = cache.cache_directory('results')
+    result_file = directory / f'{key}.pickle'
+    try:
+        with open(result_file, 'rb') as f:
+            result = pickle.load(f)
+        # the modification time orders the entries for the LRU eviction
+        os.utime(result_file)
+        print('Returning the stored result of an identical earlier run', flush=True)
+        return result
+    except Exception:
+        # a missing or corrupted entry, just run the handler
+        pass
+
+    result = call(handler, arguments)
+    try:
+        payload = pickle.dumps(result)
+        limit = size_limit()
+        if len(payload) <= limit:
+            with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
+                f.write(payload)
+            os.replace(f.name, result_file)
+            evict(directory, limit)
+    except Exception:
+        # results that can't be pickled are not memoized
+        pass
+    return result
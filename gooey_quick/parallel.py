@@ -0,0 +1,118 @@
+"""fanning handlers out over the items of their list parameters with a process pool"""
+import os
+import inspect
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+MAPPED_PARAMETER_ATTRIBUTE = '__gooey_quick_map_over__'
+
+# how many chunks each worker gets on average, more chunks balance uneven items better
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class MapOver:
+    """marks which parameter of a per-item function gooey_quick should map over"""
+    parameter: str
+    max_workers: Optional[int] = None
+
+
+def map_over(parameter: str, max_workers: Optional[int] = None):
+    """
+    Decorator declaring a function that processes a single item of :parameter:.
+    The GUI shows :parameter: as a list (e.g. a Path parameter becomes a
+    MultiFileChooser), the selected items are processed in parallel by a pool
+    of worker processes and run_gooey returns the results in the items' order.
+    The decorated function is returned unchanged, so it must be importable
+    (defined at a module's top level) for the worker processes to find it
+
+    :param parameter: name of the parameter taking a single item
+    :param max_workers: worker processes limit, defaults to the available CPUs
+    :raises ValueError: if the decorated function has no :parameter: parameter
+    """
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+        parameters = inspect.signature(function).parameters
+        if parameter not in parameters:
+            raise ValueError(
+                f'{function.__qualname__} has no parameter named {parameter!r} to map over, '
+                f'its parameters are: {", ".join(parameters) or "none"}'
+            )
+        setattr(function, MAPPED_PARAMETER_ATTRIBUTE, MapOver(parameter, max_workers))
+        return function
+    return decorator
+
+
+def mapped_parameter(function: Callable[..., Any]) -> Optional[MapOver]:
+    """
+    :returns: the map_over declaration of :function: or None
+    """
+    return getattr(function, MAPPED_PARAMETER_ATTRIBUTE, None)
+
+
+def available_cpus() -> int:
+    """
+    :returns: how many CPUs this process may run on
+    """
+    if hasattr(os, 'process_cpu_count'):
+        return os.process_cpu_count() or 1
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _call_with_item(
+    function: Callable[..., Any],
+    parameter: str,
+    arguments: dict[str, Any],
+    item: Any,
+) -> Any:
+    from gooey_quick import execution
+    return execution.invoke_handler(function, {**arguments, parameter: item})
+
+
+def _call_in_worker(
+    function: Callable[..., Any],
+    parameter: str,
+    arguments: dict[str, Any],
+    item: Any,
+) -> Any:
+    from gooey_quick import mapping
+
+    # files mapped by the parent arrive as MappedPaths, see mapping.portable_arguments
+    arguments = mapping.mapped_arguments({**arguments, parameter: item})
+    try:
+        return _call_with_item(function, parameter, arguments, arguments[parameter])
+    finally:
+        mapping.release_mapped_files(arguments)
+
+
+def map_items(function: Callable[..., Any], arguments: dict[str, Any]) -> list[Any]:
+    """
+    Calls the map_over decorated :function: for every item of its mapped parameter
+
+    :param function: function decorated with map_over
+    :param arguments: parsed arguments, the mapped parameter's value is a list
+    :returns: the results, in the same order as the items
+    """
+    mapping = mapped_parameter(function)
+    items = list(arguments[mapping.parameter])
+    shared_arguments = {
+        name: value for name, value in arguments.items() if name != mapping.parameter
+    }
+
+    workers = min(mapping.max_workers or available_cpus(), len(items))
+    if workers <= 1:
+        return [
+            _call_with_item(function, mapping.parameter, shared_arguments, item)
+            for item in items
+        ]
+
+    from functools import partial
+    from concurrent.futures import ProcessPoolExecutor
+    from gooey_quick.mapping import portable_arguments
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            partial(_call_in_worker, function, mapping.parameter, portable_arguments(shared_arguments)),
+            portable_arguments({mapping.parameter: items})[mapping.parameter],
+            chunksize=max(1, len(items) // (workers * CHUNKS_PER_WORKER)),
+        ))
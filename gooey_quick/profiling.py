@@ -0,0 +1,111 @@
+"""running handlers under cProfile and tracemalloc on the user's request"""
+import os
+import sys
+from pathlib import Path
+from datetime import datetime
+from argparse import ArgumentParser
+from typing import Callable, Any, Optional
+
+PROFILE_ENVIRONMENT_VARIABLE = 'GOOEY_QUICK_PROFILE'
+
+PROFILE_DEST = 'gooey_quick_profile'
+
+CPU = 'cpu'
+
+MEMORY = 'memory'
+
+# how many hot functions and allocation sites get printed
+TOP_ENTRIES = 20
+
+
+def profiling_modes(profile: bool | str) -> tuple[str, ...]:
+    """
+    :param profile: True for both profilers, or 'cpu' (cProfile) or 'memory' (tracemalloc)
+    :raises ValueError: for unknown modes
+    """
+    if profile is True:
+        return CPU, MEMORY
+    if profile in (CPU, MEMORY):
+        return profile,
+    raise ValueError(f'{profile} is not a profiling mode, use True, {CPU!r} or {MEMORY!r}')
+
+
+def add_profile_argument(parser: ArgumentParser):
+    """
+    Adds the 'Profile' checkbox to :parser:
+    """
+    parser.add_argument(
+        f'--{PROFILE_DEST}',
+        dest=PROFILE_DEST,
+        action='store_true',
+        required=False,
+        metavar='Profile',
+        help='measure where the run spends time and memory, see the console at the end',
+        widget='CheckBox',
+    )
+
+
+def profiling_requested(arguments: dict[str, Any]) -> bool:
+    """
+    Removes the checkbox's value from :arguments:
+
+    :param arguments: parsed arguments
+    :returns: whether the checkbox was ticked or GOOEY_QUICK_PROFILE is set
+    """
+    ticked = arguments.pop(PROFILE_DEST, False)
+    return ticked or bool(os.environ.get(PROFILE_ENVIRONMENT_VARIABLE))
+
+
+def profile_call(
+    function: Callable[..., Any],
+    *args: Any,
+    modes: tuple[str, ...] = (CPU, MEMORY),
+    name: str = 'gooey_quick',
+    output_directory: Optional[os.PathLike] = None,
+    top: int = TOP_ENTRIES,
+) -> Any:
+    """
+    Calls :function: with :args: under the profilers chosen with :modes:. Their
+    data is saved as <name>-<timestamp>.pstats (open it with pstats or e.g.
+    snakeviz) and <name>-<timestamp>.tracemalloc (tracemalloc.Snapshot.load),
+    the hottest functions and largest allocation sites are printed
+
+    :param function: callable to profile
+    :param args: positional arguments for :function:
+    :param modes: CPU and/or MEMORY
+    :param name: prefix of the saved files' names
+    :param output_directory: where to save the files, defaults to the working directory
+    :param top: how many entries of each report to print
+    :returns: :function:'s return value
+    """
+    # imported on use, so that programs merely offering profiling don't start slower
+    import pstats
+    import cProfile
+    import tracemalloc
+
+    stem = Path(output_directory or os.getcwd()) / f'{name}-{datetime.now():%Y%m%d-%H%M%S}'
+    profiler = cProfile.Profile() if CPU in modes else None
+    if MEMORY in modes:
+        tracemalloc.start()
+
+    try:
+        if profiler is None:
+            return function(*args)
+        return profiler.runcall(function, *args)
+    finally:
+        if MEMORY in modes:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            snapshot.dump(f'{stem}.tracemalloc')
+        if profiler is not None:
+            profiler.dump_stats(f'{stem}.pstats')
+
+        print(flush=True)
+        if profiler is not None:
+            print(f'Hottest functions (saved to {stem}.pstats):')
+            pstats.Stats(profiler, stream=sys.stdout).sort_stats('cumulative').print_stats(top)
+        if MEMORY in modes:
+            print(f'Largest allocation sites (saved to {stem}.tracemalloc):')
+            for statistic in snapshot.statistics('lineno')[:top]:
+                print(f'    {statistic}')
+        sys.stdout.flush()
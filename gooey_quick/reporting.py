@@ -0,0 +1,132 @@
+"""
+Reporting progress to Gooey's progress bar. Handlers call progress (for
+iterables) or report (for anything else), which print lines matching
+PROGRESS_REGEX at most every MIN_INTERVAL seconds, however often they're
+called. run_gooey sets Gooey's progress_regex and progress_expr accordingly
+"""
+import time
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Callable, TypeVar, Optional
+
+T = TypeVar('T')
+
+PROGRESS_REGEX = r'^progress: (?P<current>\d+)/(?P<total>\d+)$'
+
+PROGRESS_EXPRESSION = 'current / total * 100'
+
+# seconds between two progress updates
+MIN_INTERVAL = 0.1
+
+# seconds between two updates without a total, these are printed to the console
+UNKNOWN_TOTAL_INTERVAL = 1
+
+# how many times per MIN_INTERVAL progress checks the clock
+CHECKS_PER_INTERVAL = 4
+
+_reporters = threading.local()
+
+
+def gooey_options(kwargs: dict) -> dict:
+    """
+    :param kwargs: gooey.Gooey's keyword arguments
+    :returns: :kwargs: with the progress bar set up for report's output,
+    unless it was set up already
+    """
+    if 'progress_regex' in kwargs:
+        return kwargs
+    return {
+        'progress_regex': PROGRESS_REGEX,
+        'progress_expr': PROGRESS_EXPRESSION,
+        'hide_progress_msg': True,
+        **kwargs,
+    }
+
+
+class ProgressReporter:
+    """
+    Prints progress updates, dropping those that come less than
+    :min_interval: seconds after the previous one (but the final one)
+    """
+    def __init__(self, min_interval: float = MIN_INTERVAL, clock: Callable[[], float] = time.monotonic):
+        self.min_interval = min_interval
+        self.clock = clock
+        self.last_done: Optional[int] = None
+        self._next_update = float('-inf')
+
+    def __call__(self, done: int, total: Optional[int] = None, force: bool = False) -> bool:
+        """
+        :param done: how many units of work are done
+        :param total: how many units of work there are, if known
+        :param force: print the update even if the previous one was too recent
+        :returns: whether the update was printed
+        """
+        now = self.clock()
+        finished = total is not None and done >= total
+        if now < self._next_update and not force and not (finished and done != self.last_done):
+            return False
+
+        if total:
+            print(f'progress: {done}/{total}', flush=True)
+            self._next_update = now + self.min_interval
+        else:
+            print(f'{done} done', flush=True)
+            self._next_update = now + max(self.min_interval, UNKNOWN_TOTAL_INTERVAL)
+        self.last_done = done
+        return True
+
+
+def report(done: int, total: Optional[int] = None) -> bool:
+    """
+    Reports that :done: of :total: units of work are done. Can be called as
+    often as needed, updates are printed at most every MIN_INTERVAL seconds
+    (every UNKNOWN_TOTAL_INTERVAL seconds, in the console, without a total)
+
+    :returns: whether the update was printed
+    """
+    reporter = getattr(_reporters, 'reporter', None)
+    if reporter is None:
+        reporter = _reporters.reporter = ProgressReporter()
+    return reporter(done, total)
+
+
+def reset():
+    """
+    Forgets the calling thread's previous updates, so that a new run's first
+    update is printed even if the thread (a warm worker, the GUI's thread for
+    in-process runs) reported moments ago
+    """
+    _reporters.__dict__.pop('reporter', None)
+
+
+def progress(iterable: Iterable[T], total: Optional[int] = None, min_interval: float = MIN_INTERVAL) -> Iterator[T]:
+    """
+    Yields :iterable:'s items, reporting how many were consumed. The clock
+    is only checked a few times per :min_interval:, so even tight loops over
+    millions of items barely slow down
+
+    :param iterable: the work's items
+    :param total: how many items there are, defaults to len(iterable) if it has one
+    :param min_interval: seconds between two updates
+    """
+    if total is None:
+        try:
+            total = len(iterable)
+        except TypeError:
+            pass
+
+    reporter = ProgressReporter(min_interval)
+    reporter(0, total, force=True)
+    started = time.monotonic()
+    done, next_check = 0, 1
+    for item in iterable:
+        yield item
+        done += 1
+        if done >= next_check:
+            reporter(done, total)
+            # check again once about a fraction of the interval's worth of items is done
+            rate = done / max(time.monotonic() - started, 1e-9)
+            next_check = done + max(1, int(rate * min_interval / CHECKS_PER_INTERVAL))
+
+    if reporter.last_done != done:
+        reporter(done, total, force=True)
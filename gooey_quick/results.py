@@ -0,0 +1,168 @@
+"""passing handlers' return values from a gooey_quick process back to its caller"""
+import os
+import sys
+import mmap
+import pickle
+import struct
+import reprlib
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Any, Optional
+
+RESULT_FILE_ENVIRONMENT_VARIABLE = 'GOOEY_QUICK_RESULT_FILE'
+
+MAGIC = b'GQR1'
+
+RAW_RESULT = b'r'
+
+PICKLED_RESULT = b'p'
+
+# out-of-band buffers start at offsets aligned to this, so that e.g. ndarrays stay aligned
+BUFFER_ALIGNMENT = 64
+
+# results whose repr is longer than this are summarized in the console
+SUMMARY_LIMIT = 1000
+
+_LENGTH = struct.Struct('<Q')
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // BUFFER_ALIGNMENT) * BUFFER_ALIGNMENT
+
+
+def write_result(value: Any, path: os.PathLike):
+    """
+    Serializes :value: into :path: once. Bytes-like values are written as they
+    are, anything else is pickled with protocol 5 and its out-of-band buffers
+    (e.g. ndarrays' data) are written next to the pickle without copying
+
+    :param value: handler's return value
+    :param path: file to write to
+    """
+    with open(path, 'wb') as f:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            f.write(MAGIC + RAW_RESULT)
+            f.write(value)
+            return
+
+        buffers = []
+        payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+
+        header = MAGIC + PICKLED_RESULT + _LENGTH.pack(len(raw_buffers))
+        header += b''.join(_LENGTH.pack(len(part)) for part in (payload, *raw_buffers))
+        f.write(header)
+        f.write(payload)
+        offset = len(header) + len(payload)
+        for raw_buffer in raw_buffers:
+            padding = _aligned(offset) - offset
+            f.write(b'\0' * padding)
+            f.write(raw_buffer)
+            offset += padding + raw_buffer.nbytes
+
+
+def read_result(path: os.PathLike) -> Any:
+    """
+    Loads a value written by write_result. The file is memory mapped: raw
+    results come back as a read-only memoryview, pickled out-of-band buffers
+    (e.g. ndarrays' data) are used in place, without being copied
+
+    :param path: file written by write_result
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size <= len(MAGIC) + 1:
+            content = memoryview(f.read())
+        else:
+            content = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    if content[:len(MAGIC)] != MAGIC:
+        raise ValueError(f'{path} is not a gooey_quick result file')
+    kind = bytes(content[len(MAGIC):len(MAGIC) + 1])
+    offset = len(MAGIC) + 1
+    if kind == RAW_RESULT:
+        return content[offset:]
+
+    buffer_count, = _LENGTH.unpack_from(content, offset)
+    offset += _LENGTH.size
+    lengths = [
+        _LENGTH.unpack_from(content, offset + index * _LENGTH.size)[0]
+        for index in range(buffer_count + 1)
+    ]
+    offset += len(lengths) * _LENGTH.size
+
+    payload_length, *buffer_lengths = lengths
+    payload = content[offset:offset + payload_length]
+    offset += payload_length
+    buffers = []
+    for buffer_length in buffer_lengths:
+        offset = _aligned(offset)
+        buffers.append(content[offset:offset + buffer_length])
+        offset += buffer_length
+    return pickle.loads(payload, buffers=buffers)
+
+
+def summarize(value: Any, limit: int = SUMMARY_LIMIT) -> str:
+    """
+    Describes :value: without building its full repr when it's large
+
+    :param value: value to describe
+    :param limit: longest description to return
+    """
+    size = getattr(value, 'nbytes', None)
+    if size is None and isinstance(value, (bytes, bytearray, str)):
+        size = len(value)
+    if size is not None and size > limit:
+        return f'<{type(value).__qualname__} of {size} bytes>'
+
+    shortened = reprlib.Repr()
+    shortened.maxstring = shortened.maxother = limit
+    description = shortened.repr(value)
+    if len(description) > limit:
+        description = description[:limit] + '...'
+    return description
+
+
+def publish_result(value: Any) -> bool:
+    """
+    Sends :value: through the result channel if the caller enabled it
+    (i.e. set GOOEY_QUICK_RESULT_FILE) and prints its summary to the console
+
+    :param value: handler's return value
+    :returns: whether the result channel is enabled
+    """
+    path = os.environ.get(RESULT_FILE_ENVIRONMENT_VARIABLE)
+    if not path:
+        return False
+
+    write_result(value, path)
+    print(f'result: {summarize(value)}', flush=True)
+    return True
+
+
+def run_program(
+    script: os.PathLike,
+    *arguments: Any,
+    python: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Any:
+    """
+    Runs a gooey_quick program without the GUI in a child process and returns
+    its handler's actual return value (through the result channel, not stdout)
+
+    :param script: the program's path
+    :param arguments: command line arguments for the program
+    :param python: interpreter to run the program with, defaults to this one
+    :param timeout: seconds after which the child is killed
+    :raises subprocess.CalledProcessError: if the program fails
+    """
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+        result_file = Path(directory) / 'result'
+        subprocess.run(
+            [python or sys.executable, os.fspath(script), *map(str, arguments), '--ignore-gooey'],
+            env={**os.environ, RESULT_FILE_ENVIRONMENT_VARIABLE: str(result_file)},
+            timeout=timeout,
+            check=True,
+        )
+        # the result may be memory mapped, POSIX systems allow removing the file anyway
+        return read_result(result_file)
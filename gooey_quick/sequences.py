@@ -0,0 +1,138 @@
+"""
+Parsing numeric and date list parameters in bulk into compact storage: a
+list[int] arrives as an array('q'), a list[float] as an array('d') and a
+list[date] as a DateArray, instead of lists of boxed objects
+"""
+import os
+from array import array
+from datetime import date
+from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from typing import Callable, Any
+
+# characters separating values, besides whitespace; brackets allow pasting Python lists
+SEPARATORS = ',;[]()'
+
+# characters of a values file read (and parsed) at once
+CHUNK_SIZE = 1024 * 1024
+
+_SEPARATORS_TABLE = str.maketrans(SEPARATORS, ' ' * len(SEPARATORS))
+
+ELEMENT_PARSERS: dict[type, Callable[[str], Any]] = {
+    int: int,
+    float: float,
+    date: date.fromisoformat,
+    str: str,
+}
+
+
+def split_values(text: str) -> list[str]:
+    return text.translate(_SEPARATORS_TABLE).split()
+
+
+def _file_values(path: str) -> Iterator[list[str]]:
+    remainder = ''
+    with open(path) as f:
+        while chunk := f.read(CHUNK_SIZE):
+            values = split_values(remainder + chunk)
+            # the chunk may end in the middle of a value
+            remainder = values.pop() if values and not chunk[-1].isspace() and chunk[-1] not in SEPARATORS else ''
+            yield values
+    if remainder:
+        yield [remainder]
+
+
+def value_chunks(text: str, parse: Callable[[str], Any]) -> Iterator[list[str]]:
+    """
+    Splits :text: on commas, semicolons, brackets and whitespace. A text that
+    names an existing file (separators included, e.g. 'my data/values.txt')
+    and isn't a single value :parse: accepts stands for the file's contents,
+    which is read in chunks
+
+    :param text: the argument's value
+    :param parse: parser of a single value
+    :returns: lists of values
+    """
+    path = text.strip()
+    if os.path.isfile(path):
+        try:
+            parse(path)
+        except ValueError:
+            return _file_values(path)
+    return iter([split_values(text)])
+
+
+def _parse_array(typecode: str, parse: Callable[[str], Any], text: str) -> array:
+    values = array(typecode)
+    try:
+        for chunk in value_chunks(text, parse):
+            values.extend(map(parse, chunk))
+    except OverflowError as error:
+        raise ValueError(str(error))
+    return values
+
+
+def int_list(text: str) -> array:
+    """argparse type parsing integers into an array('q') (64 bit signed integers)"""
+    return _parse_array('q', int, text)
+
+
+def float_list(text: str) -> array:
+    """argparse type parsing floats into an array('d')"""
+    return _parse_array('d', float, text)
+
+
+class DateArray(Sequence):
+    """
+    A read-only sequence of dates stored as an array('i') of their ordinals
+    (see date.toordinal), 4 bytes per date
+    """
+    def __init__(self, ordinals: array):
+        self.ordinals = ordinals
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DateArray(self.ordinals[index])
+        return date.fromordinal(self.ordinals[index])
+
+    def __eq__(self, other):
+        if isinstance(other, DateArray):
+            return self.ordinals == other.ordinals
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({[item.isoformat() for item in self]})'
+
+
+def date_list(text: str) -> DateArray:
+    """argparse type parsing ISO formatted dates into a DateArray"""
+    return DateArray(_parse_array('i', lambda value: date.fromisoformat(value).toordinal(), text))
+
+
+LIST_PARSERS: dict[type, Callable[[str], Any]] = {
+    int: int_list,
+    float: float_list,
+    date: date_list,
+}
+
+
+@dataclass(frozen=True)
+class TupleOf:
+    """
+    argparse type parsing a tuple of values of :types: (separated like list
+    values), or of any number of :types:[0] values if :variadic:
+    """
+    types: tuple[type, ...]
+    variadic: bool = False
+
+    def __call__(self, text: str) -> tuple:
+        parsers = [ELEMENT_PARSERS[element_type] for element_type in self.types]
+        values = [value for chunk in value_chunks(text, parsers[0]) for value in chunk]
+        if self.variadic:
+            return tuple(map(parsers[0], values))
+        if len(values) != len(parsers):
+            raise ValueError(f'expected {len(parsers)} values, got {len(values)}')
+        return tuple(parse(value) for parse, value in zip(parsers, values))
@@ -0,0 +1,182 @@
+"""
+Running handlers on a thread of Gooey's GUI process instead of a child
+process, for handlers quicker than a process' startup. Gooey's
+ProcessController is taught to start such runs: a ThreadRun stands in for
+the child process, its output goes through a pipe Gooey reads like the
+child's, and Gooey's Stop button sets the run's cancellation flag (see
+cancelled), since threads can't be killed
+"""
+import io
+import os
+import sys
+import threading
+import traceback
+from typing import Callable, Any, Optional
+
+# Gooey's target for runs started in the GUI process
+IN_PROCESS_TARGET = 'gooey_quick-in-process'
+
+_current = threading.local()
+
+# what IN_PROCESS_TARGET runs, see install
+_target: Optional[Callable[[list[str]], Any]] = None
+
+
+def current_run() -> Optional['ThreadRun']:
+    """
+    :returns: the ThreadRun executing on this thread, if any
+    """
+    return getattr(_current, 'run', None)
+
+
+def cancelled() -> bool:
+    """
+    Tells handlers running on a thread of the GUI process whether the user
+    pressed Stop. Such handlers can't be killed, long running ones should
+    check it regularly and return early (generator handlers are stopped
+    between items automatically)
+
+    :returns: False when not running on a GUI thread
+    """
+    run = current_run()
+    return run is not None and run.cancel_requested.is_set()
+
+
+class _ThreadStream(io.TextIOBase):
+    """
+    Stands in for sys.stdout or sys.stderr: writes from a ThreadRun's thread
+    go to the run's output, everything else to the original stream
+    """
+    def __init__(self, original: io.TextIOBase):
+        self.original = original
+
+    def _target(self) -> io.TextIOBase:
+        run = current_run()
+        return self.original if run is None else run.output
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self.original, name)
+
+
+def _install_streams():
+    for name in ('stdout', 'stderr'):
+        stream = getattr(sys, name)
+        if not isinstance(stream, _ThreadStream):
+            setattr(sys, name, _ThreadStream(stream))
+
+
+class ThreadRun:
+    """
+    Runs target(argv) on a new thread. It quacks like the subprocess.Popen
+    Gooey expects: the run's output can be read from stdout and poll,
+    communicate and returncode report its exit code (1 for uncaught
+    exceptions, SystemExit's code otherwise)
+    """
+    def __init__(self, target: Callable[[list[str]], Any], argv: list[str], encoding: str = 'utf-8'):
+        self.target = target
+        self.argv = argv
+        self.pid = None
+        self.returncode: Optional[int] = None
+        self.cancel_requested = threading.Event()
+
+        read_descriptor, write_descriptor = os.pipe()
+        self.stdout = os.fdopen(read_descriptor, 'rb')
+        self.output = io.TextIOWrapper(
+            os.fdopen(write_descriptor, 'wb'),
+            encoding=encoding,
+            errors='replace',
+            line_buffering=True,
+        )
+        self._thread = threading.Thread(target=self._run, name='gooey_quick-run', daemon=True)
+
+    def start(self) -> 'ThreadRun':
+        _install_streams()
+        self._thread.start()
+        return self
+
+    def _run(self):
+        from gooey_quick.execution import exit_code
+
+        _current.run = self
+        try:
+            self.target(self.argv)
+            code = 0
+        except SystemExit as exit:
+            code = exit_code(exit.code)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            _current.run = None
+
+        # the exit code is known before the reader sees the output's end
+        self.returncode = code
+        self.output.close()
+
+    def poll(self) -> Optional[int]:
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        self._thread.join(timeout)
+        return self.returncode
+
+    def communicate(self, *args, **kwargs) -> tuple[None, None]:
+        self.wait()
+        return None, None
+
+    def cancel(self):
+        self.cancel_requested.set()
+
+
+def install(run: Callable[[list[str]], Any]) -> str:
+    """
+    Makes Gooey's ProcessController run IN_PROCESS_TARGET commands with :run:
+    on a thread, and stop them by cancelling them
+
+    :param run: parses the command line arguments it's given and calls the handler
+    :returns: Gooey's target
+    """
+    from gooey.gui.processor import ProcessController
+    from gooey_quick.argument_files import split_command
+
+    global _target
+    _target = run
+    if getattr(ProcessController.run, 'runs_in_threads', False):
+        return IN_PROCESS_TARGET
+
+    start = ProcessController.run
+    stop = ProcessController.stop
+
+    def run_in_thread(self, command, *args, **kwargs):
+        if not command.startswith(f'{IN_PROCESS_TARGET} '):
+            return start(self, command, *args, **kwargs)
+        for flag in ('wasForcefullyStopped', 'was_forcefully_stopped'):
+            if hasattr(self, flag):
+                setattr(self, flag, False)
+        argv = split_command(command[len(IN_PROCESS_TARGET):])
+        self._process = ThreadRun(_target, argv, getattr(self, 'encoding', None) or 'utf-8').start()
+        threading.Thread(target=self._forward_stdout, args=(self._process,), daemon=True).start()
+
+    def stop_thread(self, *args, **kwargs):
+        process = getattr(self, '_process', None)
+        if not isinstance(process, ThreadRun):
+            return stop(self, *args, **kwargs)
+        if process.poll() is None:
+            for flag in ('wasForcefullyStopped', 'was_forcefully_stopped'):
+                if hasattr(self, flag):
+                    setattr(self, flag, True)
+            process.cancel()
+
+    run_in_thread.runs_in_threads = True
+    ProcessController.run = run_in_thread
+    ProcessController.stop = stop_thread
+    return IN_PROCESS_TARGET
@@ -0,0 +1,93 @@
+"""lazily walking the files of the directories handlers receive as types.DirectoryFiles"""
+import os
+import re
+import fnmatch
+from pathlib import Path
+from argparse import ArgumentTypeError
+from dataclasses import dataclass
+from collections.abc import Iterator
+from typing import Callable, Any, Optional
+
+# how many directory entries are scanned between two progress reports
+PROGRESS_INTERVAL = 10_000
+
+GLOB_CHARACTERS = frozenset('*?[')
+
+
+def _pattern(pattern: str) -> str:
+    # bare extensions ('csv') match the files' suffix, anything with glob characters their whole name
+    return pattern if GLOB_CHARACTERS & set(pattern) else f'*.{pattern}'
+
+
+class DirectoryWalk:
+    """
+    The files of a directory tree (recursively) whose names match any of the
+    patterns, produced lazily with os.scandir. Only the directories being
+    scanned are held open, so memory stays constant however many entries the
+    tree has. Every iteration walks the tree anew
+    """
+    def __init__(self, root: os.PathLike, patterns: tuple[str, ...] = ()):
+        """
+        :param root: directory to walk
+        :param patterns: extensions (e.g. 'csv') or glob patterns (e.g. 'data_*.json'),
+        every file is produced if empty
+        """
+        self.root = Path(root)
+        self.patterns = patterns
+        flags = re.IGNORECASE if os.name == 'nt' else 0
+        self._match = re.compile('|'.join(fnmatch.translate(_pattern(pattern)) for pattern in patterns), flags).match
+
+    def __repr__(self):
+        return f'{type(self).__name__}({str(self.root)!r}, {self.patterns!r})'
+
+    def __iter__(self) -> Iterator[Path]:
+        return self.walk()
+
+    def walk(
+        self,
+        progress: Optional[Callable[[int], Any]] = None,
+        every: int = PROGRESS_INTERVAL,
+    ) -> Iterator[Path]:
+        """
+        Produces the matching files, depth first. Symbolic links to directories
+        are not followed and directories that can't be read are skipped
+
+        :param progress: called with the number of scanned entries every :every: entries
+        :param every: how many entries are scanned between two :progress: calls
+        """
+        scanned = 0
+        stack = []
+        try:
+            stack.append(os.scandir(self.root))
+            while stack:
+                entry = next(stack[-1], None)
+                if entry is None:
+                    stack.pop().close()
+                    continue
+
+                scanned += 1
+                if progress is not None and scanned % every == 0:
+                    progress(scanned)
+
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(os.scandir(entry.path))
+                        continue
+                except OSError:
+                    continue
+                if not self.patterns or self._match(entry.name):
+                    yield Path(entry.path)
+        finally:
+            for iterator in stack:
+                iterator.close()
+
+
+@dataclass(frozen=True)
+class WalkDirectory:
+    """argparse type turning a directory's path into a DirectoryWalk of its files"""
+    patterns: tuple[str, ...] = ()
+
+    def __call__(self, path: str) -> DirectoryWalk:
+        if not os.path.isdir(path):
+            raise ArgumentTypeError(f'{path} is not a directory')
+        return DirectoryWalk(path, self.patterns)
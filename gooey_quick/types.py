@@ -20,6 +20,35 @@ class FileWithExtension(PurePath, Generic[T]):
         return self
 
 
+class MappedFile(PurePath, Generic[T]):
+    """
+    A file that the handler receives as a read-only memoryview of its memory
+    mapped contents, instead of a path. Large inputs are thus neither copied
+    nor read into memory at once, gooey_quick unmaps the file once the
+    handler returns. Renders as a FileChooser, like FileWithExtension it can
+    take a Literal of allowed extensions, e.g. MappedFile[Literal['bin']]
+    """
+    def __new__(cls, *args):
+        if cls is MappedFile:
+            cls = PureWindowsPath if os.name == 'nt' else PurePosixPath
+        self = cls._from_parts(args)
+        return self
+
+
+class DirectoryFiles(PurePath, Generic[T]):
+    """
+    A directory whose files the handler receives as a lazy iterable of Paths
+    (see traversal.DirectoryWalk), instead of the directory's path. Renders
+    as a DirChooser. It can take a Literal of extensions or glob patterns
+    the files' names must match, e.g. DirectoryFiles[Literal['csv', 'data_*.json']]
+    """
+    def __new__(cls, *args):
+        if cls is DirectoryFiles:
+            cls = PureWindowsPath if os.name == 'nt' else PurePosixPath
+        self = cls._from_parts(args)
+        return self
+
+
 DirectoryPath = NewType('DirectoryPath', Path)
 
 SaveToPath = NewType('SaveToPath', Path)
@@ -0,0 +1,156 @@
+"""checking path arguments before the handler runs, so mistyped paths fail fast"""
+import os
+import stat
+import functools
+from pathlib import Path
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Any, Optional, Union, get_origin, get_args
+
+from gooey_quick import instrumentation
+from gooey_quick.introspection import Parameter
+from gooey_quick.types import FileWithExtension, SaveToPath, DirectoryPath
+
+Check = Callable[[Any], Optional[str]]
+
+# fewer paths than this are checked without a thread pool
+PARALLEL_THRESHOLD = 64
+
+# threads checking paths, stat calls mostly wait for the file system
+MAX_WORKERS = 16
+
+# how many errors are listed, the rest is only counted
+ERROR_LIMIT = 10
+
+
+def check_file(path: os.PathLike, extensions: tuple[str, ...] = ()) -> Optional[str]:
+    """
+    :param extensions: the file's allowed extensions, any if empty
+    :returns: why :path: is not a readable file (with one of :extensions:), or None
+    """
+    try:
+        if stat.S_ISDIR(os.stat(path).st_mode):
+            return f'{path} is a directory, not a file'
+    except OSError as error:
+        return f'{path}: {error.strerror or error}'
+    if extensions and not os.fspath(path).lower().endswith(tuple(f'.{extension.lower()}' for extension in extensions)):
+        return f'{path} is not a {" or ".join(extension.upper() for extension in extensions)} file'
+    if not os.access(path, os.R_OK):
+        return f'{path} is not readable'
+    return None
+
+
+def check_directory(path: os.PathLike) -> Optional[str]:
+    """
+    :returns: why :path: is not a readable directory, or None
+    """
+    if not os.path.isdir(path):
+        return f'{path} is not a directory'
+    if not os.access(path, os.R_OK | os.X_OK):
+        return f'{path} is not readable'
+    return None
+
+
+def check_save_to_path(path: os.PathLike) -> Optional[str]:
+    """
+    :returns: why :path: can't be written to, or None
+    """
+    if os.path.lexists(path):
+        if os.path.isdir(path):
+            return f'{path} is a directory, not a file'
+        if not os.access(path, os.W_OK):
+            return f'{path} is not writable'
+        return None
+    directory = os.path.dirname(os.fspath(path)) or os.curdir
+    if not os.path.isdir(directory):
+        return f"{path} can't be created, {directory} is not a directory"
+    if not os.access(directory, os.W_OK | os.X_OK):
+        return f"{path} can't be created, {directory} is not writable"
+    return None
+
+
+def path_check(annotation: Any) -> Optional[Check]:
+    """
+    :returns: the check for values of :annotation:, None for non path annotations
+    """
+    if get_origin(annotation) is FileWithExtension:
+        return functools.partial(check_file, extensions=get_args(get_args(annotation)[0]))
+    if annotation in (Path, FileWithExtension):
+        return check_file
+    if annotation is SaveToPath:
+        return check_save_to_path
+    if annotation is DirectoryPath:
+        return check_directory
+    return None
+
+
+def _element_annotation(annotation: Any) -> Any:
+    # Optional[X] and list[X] values are checked as X values
+    origin = get_origin(annotation)
+    if origin is Union:
+        arguments = [argument for argument in get_args(annotation) if argument is not type(None)]
+        return _element_annotation(arguments[0]) if len(arguments) == 1 else annotation
+    if origin is list:
+        return get_args(annotation)[0]
+    return annotation
+
+
+def path_checks(handler: Callable[..., Any], arguments: dict[str, Any]) -> list[tuple[Check, Any]]:
+    """
+    :param handler: function the arguments are for
+    :param arguments: parsed arguments, keyed by :handler:'s parameter names
+    :returns: every path argument (including list items) and its check
+    """
+    checks = []
+    for parameter in Parameter.parse_callable_parameters(handler):
+        value = arguments.get(parameter.name)
+        check = path_check(_element_annotation(parameter.type_annotation))
+        if value is None or check is None:
+            continue
+        for item in (value if isinstance(value, (list, tuple)) else [value]):
+            checks.append((check, item))
+    return checks
+
+
+def _run_checks(checks: list[tuple[Check, Any]]) -> list[str]:
+    return [error for check, value in checks if (error := check(value)) is not None]
+
+
+def validate_arguments(
+    handler: Callable[..., Any],
+    arguments: dict[str, Any],
+    max_workers: int = MAX_WORKERS,
+) -> list[str]:
+    """
+    Checks that path arguments exist, are files or directories as their
+    annotations say, have the extensions FileWithExtension allows and can be
+    read (or written to, for SaveToPath). Many paths are checked in parallel,
+    in chunks, on a thread pool
+
+    :param handler: function the arguments are for
+    :param arguments: parsed arguments, keyed by :handler:'s parameter names
+    :param max_workers: threads checking the paths
+    :returns: the errors found, in the arguments' order
+    """
+    with instrumentation.span('validate_paths'):
+        checks = path_checks(handler, arguments)
+        if len(checks) < PARALLEL_THRESHOLD or max_workers <= 1:
+            return _run_checks(checks)
+
+        chunk_size = -(-len(checks) // max_workers)
+        chunks = [checks[start:start + chunk_size] for start in range(0, len(checks), chunk_size)]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            return [error for errors in executor.map(_run_checks, chunks) for error in errors]
+
+
+def validate_or_exit(parser: ArgumentParser, handler: Callable[..., Any], arguments: dict[str, Any]):
+    """
+    Reports the errors found by validate_arguments through :parser: (which
+    exits), before the handler gets to run
+    """
+    errors = validate_arguments(handler, arguments)
+    if errors:
+        message = '\n  '.join(errors[:ERROR_LIMIT])
+        if len(errors) > ERROR_LIMIT:
+            message += f'\n  ...and {len(errors) - ERROR_LIMIT} more'
+        parser.error(f'invalid paths:\n  {message}')
@@ -0,0 +1,274 @@
+"""
+A warm worker process running handlers on the GUI's behalf. The worker
+imports the program (and its heavy dependencies) once and then serves every
+run: Gooey starts a thin client (`python -m gooey_quick.worker`) instead of
+the program, the client forwards its command line to the worker over a local
+socket (a named pipe on Windows) and relays the output back to Gooey's
+console. Stopping the client (Gooey's Stop button) kills the worker, which
+the GUI's Supervisor respawns
+"""
+import os
+import sys
+import time
+import shutil
+import atexit
+import secrets
+import tempfile
+import threading
+import traceback
+import subprocess
+from io import TextIOBase
+from contextlib import redirect_stdout, redirect_stderr
+from multiprocessing.connection import Listener, Client, Connection
+from typing import Callable, Any, Optional
+
+from gooey_quick import headless
+
+ADDRESS_ENVIRONMENT_VARIABLE = 'GOOEY_QUICK_WORKER_ADDRESS'
+
+AUTHKEY_ENVIRONMENT_VARIABLE = 'GOOEY_QUICK_WORKER_AUTHKEY'
+
+# only set for the worker itself, so that programs it runs don't serve too
+LISTEN_ENVIRONMENT_VARIABLE = headless.WORKER_ENVIRONMENT_VARIABLE
+
+# how long the client waits for the worker to (re)start, in seconds
+CONNECT_TIMEOUT = 120
+
+# workers dying sooner than this after their start are respawned after the same delay
+RESPAWN_DELAY = 1
+
+OUTPUT = 'output'
+
+EXIT = 'exit'
+
+
+def new_address() -> str:
+    """
+    :returns: a fresh address for the worker's listener
+    """
+    if sys.platform == 'win32':
+        return rf'\\.\pipe\gooey_quick-{os.getpid()}-{secrets.token_hex(8)}'
+    return os.path.join(tempfile.mkdtemp(prefix='gooey_quick-'), 'worker')
+
+
+class Supervisor:
+    """
+    Keeps a worker process running :command: alive, respawning it whenever it
+    dies (e.g. after a run was stopped), until stop is called
+    """
+    def __init__(self, command: list[str], address: Optional[str] = None):
+        """
+        :param command: the program to run as the worker
+        :param address: where the worker listens, defaults to a fresh address
+        """
+        self.command = command
+        self.address = address or new_address()
+        self.authkey = secrets.token_hex(32)
+        self.process: Optional[subprocess.Popen] = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._monitor = threading.Thread(target=self._keep_alive, name='gooey_quick-supervisor', daemon=True)
+
+    @property
+    def environment(self) -> dict[str, str]:
+        """
+        Variables telling clients (which inherit them) how to reach the worker
+        """
+        return {
+            ADDRESS_ENVIRONMENT_VARIABLE: self.address,
+            AUTHKEY_ENVIRONMENT_VARIABLE: self.authkey,
+        }
+
+    def _spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(self.command, env={
+            **os.environ,
+            **self.environment,
+            LISTEN_ENVIRONMENT_VARIABLE: self.address,
+            headless.HEADLESS_ENVIRONMENT_VARIABLE: '1',
+        })
+
+    def _keep_alive(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                if self._stopped.is_set():
+                    return
+                started = time.monotonic()
+                self.process = self._spawn()
+            self.process.wait()
+            if time.monotonic() - started < RESPAWN_DELAY:
+                self._stopped.wait(RESPAWN_DELAY)
+
+    def start(self) -> 'Supervisor':
+        self._monitor.start()
+        atexit.register(self.stop)
+        return self
+
+    def stop(self):
+        """
+        Kills the worker for good
+        """
+        with self._lock:
+            self._stopped.set()
+            if self.process is not None and self.process.poll() is None:
+                self.process.kill()
+                self.process.wait()
+        if sys.platform != 'win32':
+            shutil.rmtree(os.path.dirname(self.address), ignore_errors=True)
+
+
+def start_worker(command: Optional[list[str]] = None) -> str:
+    """
+    Starts a supervised worker running this program and lets the clients
+    Gooey will start (which inherit os.environ) find it
+
+    :param command: the program to run as the worker, defaults to this program
+    :returns: Gooey's target, i.e. the client's command line
+    """
+    if command is None:
+        command = [sys.executable, os.path.abspath(sys.argv[0])]
+    supervisor = Supervisor(command).start()
+    os.environ.update(supervisor.environment)
+    return f'"{sys.executable}" -u -m gooey_quick.worker'
+
+
+def serving() -> bool:
+    """
+    :returns: whether this process was started as a worker by a Supervisor
+    """
+    return headless.is_worker()
+
+
+class _ConnectionStream(TextIOBase):
+    """sends everything written to it to the client, as :name: output"""
+    def __init__(self, connection: Connection, name: str, lock: threading.Lock):
+        self.connection = connection
+        self.name = name
+        self.lock = lock
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        with self.lock:
+            self.connection.send((OUTPUT, self.name, text))
+        return len(text)
+
+
+def _exit_when_abandoned(connection: Connection, finished: threading.Event):
+    # clients never send anything after their request, this only returns once they're gone
+    try:
+        connection.recv()
+    except (EOFError, OSError):
+        pass
+    if not finished.is_set():
+        # the run was stopped, the supervisor starts a fresh worker
+        os._exit(1)
+
+
+def _exit_when_orphaned(parent: int):
+    while os.getppid() == parent:
+        time.sleep(1)
+    os._exit(1)
+
+
+def serve_run(connection: Connection, run: Callable[[], Any]):
+    """
+    Runs the client's request: its working directory and command line are
+    applied, the output is streamed back and so is the exit code
+
+    :param connection: connection to the client
+    :param run: parses sys.argv and calls the handler
+    """
+    from gooey_quick.execution import exit_code
+
+    request = connection.recv()
+    os.chdir(request['cwd'])
+    sys.argv[1:] = request['argv']
+
+    finished = threading.Event()
+    threading.Thread(target=_exit_when_abandoned, args=(connection, finished), daemon=True).start()
+
+    lock = threading.Lock()
+    stdout = _ConnectionStream(connection, 'stdout', lock)
+    stderr = _ConnectionStream(connection, 'stderr', lock)
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            run()
+            code = 0
+        except SystemExit as exit:
+            code = exit_code(exit.code)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+
+    finished.set()
+    connection.send((EXIT, code))
+
+
+def serve(run: Callable[[], Any]):
+    """
+    Serves the clients' runs one after another, forever
+
+    :param run: parses sys.argv and calls the handler
+    """
+    address = os.environ.pop(LISTEN_ENVIRONMENT_VARIABLE)
+    authkey = os.environ[AUTHKEY_ENVIRONMENT_VARIABLE].encode()
+    if sys.platform != 'win32' and os.path.exists(address):
+        # left behind by the worker this one replaces
+        os.unlink(address)
+
+    threading.Thread(target=_exit_when_orphaned, args=(os.getppid(),), daemon=True).start()
+    with Listener(address, authkey=authkey) as listener:
+        while True:
+            try:
+                connection = listener.accept()
+            except Exception:
+                # e.g. a client that failed to authenticate
+                continue
+            with connection:
+                try:
+                    serve_run(connection, run)
+                except (EOFError, OSError):
+                    pass
+
+
+def connect(argv: list[str], timeout: float = CONNECT_TIMEOUT) -> int:
+    """
+    The client Gooey runs: has the worker run :argv: and relays its output
+
+    :param argv: the program's command line arguments
+    :param timeout: how long to wait for the worker to (re)start
+    :returns: the run's exit code
+    """
+    address = os.environ[ADDRESS_ENVIRONMENT_VARIABLE]
+    authkey = os.environ[AUTHKEY_ENVIRONMENT_VARIABLE].encode()
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            connection = Client(address, authkey=authkey)
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                print('gooey_quick: the worker did not start', file=sys.stderr)
+                return 1
+            time.sleep(0.05)
+
+    streams = {'stdout': sys.stdout, 'stderr': sys.stderr}
+    with connection:
+        connection.send({'argv': argv, 'cwd': os.getcwd()})
+        while True:
+            try:
+                message = connection.recv()
+            except (EOFError, OSError):
+                print('gooey_quick: the worker stopped', file=sys.stderr)
+                return 1
+            if message[0] == EXIT:
+                return message[1]
+            _, name, text = message
+            streams[name].write(text)
+            streams[name].flush()
+
+
+if __name__ == '__main__':
+    sys.exit(connect(sys.argv[1:]))
@@ -0,0 +1,121 @@
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+import gooey_quick
+from gooey_quick import argument_files
+from gooey_quick.argument_files import ARGUMENT_FILE_FLAG, spill_command, expand_argument_files
+
+TARGET = '"/usr/bin/python3" -u "/home/user/program.py"'
+
+
+def select_files(files: list[Path], name: str):
+    return len(files), files[-1], name
+
+
+def test_short_commands_are_left_alone():
+    command = f'{TARGET} --ignore-gooey --name "foo"'
+    assert spill_command(command) == command
+
+
+def test_commands_without_gooey_flag_are_left_alone():
+    command = f'{TARGET} --name "{"x" * 10_000}"'
+    assert spill_command(command) == command
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='POSIX quoting')
+def test_long_commands_are_spilled_and_expanded():
+    files = [f'/data/file {index}.csv' for index in range(10_000)]
+    quoted_files = ' '.join(f'"{file}"' for file in files)
+    command = f'{TARGET} --ignore-gooey --name "it\'s" --files {quoted_files}'
+
+    spilled = spill_command(command)
+    assert len(spilled) < argument_files.SPILL_THRESHOLD
+    assert spilled.startswith(f'{TARGET} --ignore-gooey {ARGUMENT_FILE_FLAG} ')
+
+    argv = spilled.replace('"', '').split(' ')[3:]
+    path = argv[-1]
+    expand_argument_files(argv)
+
+    assert argv == ['--ignore-gooey', '--name', "it's", '--files', *files]
+    assert not os.path.exists(path)
+
+
+def test_argument_files_are_expanded_in_place():
+    path = argument_files.write_argument_file(['--name', 'with\nnewline', 'a "quoted" value'])
+    argv = ['program.py', 'section', ARGUMENT_FILE_FLAG, path, '--last']
+
+    expand_argument_files(argv)
+
+    assert argv == ['program.py', 'section', '--name', 'with\nnewline', 'a "quoted" value', '--last']
+
+
+def test_run_gooey_reads_argument_files(monkeypatch):
+    files = [f'file{index}.txt' for index in range(100_000)]
+    path = argument_files.write_argument_file([*files, 'foo'])
+    monkeypatch.setattr(sys, 'argv', ['program.py', '--ignore-gooey', ARGUMENT_FILE_FLAG, path])
+
+    assert gooey_quick.run_gooey(select_files) == (100_000, Path('file99999.txt'), 'foo')
+
+
+@pytest.fixture
+def windows(monkeypatch):
+    # only argument_files sees Windows, pathlib and pytest would break otherwise
+    monkeypatch.setattr(argument_files, 'os', types.SimpleNamespace(**{**vars(os), 'name': 'nt'}))
+
+
+@pytest.mark.parametrize('command, tokens', [
+    ('"say ""hi"" now"', ['say "hi" now']),
+    ('--name "" --empty', ['--name', '', '--empty']),
+    ('"""quoted"""', ['"quoted"']),
+    ('--name="C:\\Program Files\\x.txt" C:\\data\\y.csv', ['--name=C:\\Program Files\\x.txt', 'C:\\data\\y.csv']),
+    ("  \"it's (1), 2\"  ", ["it's (1), 2"]),
+])
+def test_windows_commands_are_split_like_gooey_quotes_them(windows, command, tokens):
+    assert argument_files.split_command(command) == tokens
+
+
+def test_long_windows_commands_keep_their_quotes(windows):
+    names = [f'say ""hi"" {index}' for index in range(1000)]
+    command = f'{TARGET} --ignore-gooey --names ' + ' '.join(f'"{name}"' for name in names)
+    spilled = spill_command(command)
+
+    argv = [ARGUMENT_FILE_FLAG, spilled.rsplit(' ', 1)[1].strip('"')]
+    expand_argument_files(argv)
+    assert argv == ['--names', *(name.replace('""', '"') for name in names)]
+
+
+@pytest.fixture
+def process_controller(monkeypatch):
+    """a stand-in for Gooey's gooey.gui.processor.ProcessController, recording the commands it runs"""
+    class ProcessController:
+        commands = []
+
+        def run(self, command):
+            self.commands.append(command)
+
+    processor = types.ModuleType('gooey.gui.processor')
+    processor.ProcessController = ProcessController
+    monkeypatch.setitem(sys.modules, 'gooey', types.ModuleType('gooey'))
+    monkeypatch.setitem(sys.modules, 'gooey.gui', types.ModuleType('gooey.gui'))
+    monkeypatch.setitem(sys.modules, 'gooey.gui.processor', processor)
+    return ProcessController
+
+
+def test_install_makes_gooey_spill_long_commands(process_controller):
+    argument_files.install()
+    argument_files.install()
+    short = f'{TARGET} --ignore-gooey --name "foo"'
+    long = f'{TARGET} --ignore-gooey --name "{"x" * 10_000}"'
+
+    process_controller().run(short)
+    process_controller().run(long)
+
+    assert process_controller.commands[0] == short
+    assert process_controller.commands[1].startswith(f'{TARGET} --ignore-gooey {ARGUMENT_FILE_FLAG} ')
+    argv = [ARGUMENT_FILE_FLAG, process_controller.commands[1].rsplit(' ', 1)[1].strip('"')]
+    expand_argument_files(argv)
+    assert argv == ['--name', 'x' * 10_000]
@@ -0,0 +1,121 @@
+import io
+import os
+import sys
+import json
+import subprocess
+from enum import Enum
+from pathlib import Path
+from datetime import date
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from gooey_quick import batch
+
+REPOSITORY_ROOT = Path(__file__).resolve().parent.parent
+
+
+class Method(Enum):
+    SFTP = 'sftp'
+    HTTP = 'http'
+
+
+def upload(file: Path, method: Method, day: date, files: list[Path], retries: int = 3, comment: Optional[str] = None, verbose: bool = False):
+    if retries < 0:
+        raise RuntimeError('negative retries')
+    return [str(file), method.name, day.isoformat(), [str(f) for f in files], retries, comment, verbose]
+
+
+def results(output: str) -> dict[int, dict]:
+    return {record['row']: record for record in map(json.loads, output.splitlines())}
+
+
+def test_row_to_argv_puts_optionals_before_positionals():
+    arguments = batch.convert_arguments(upload)
+    argv = batch.row_to_argv(arguments, {
+        'file': 'a.txt',
+        'method': 'HTTP',
+        'day': '2002-07-22',
+        'files': ['b', 'c'],
+        'comment': '-dashed',
+        'verbose': True,
+    }, defaults={'retries': 3})
+    assert argv == ['--comment=-dashed', '--verbose', '--', 'a.txt', 'HTTP', '2002-07-22', 'b', 'c', '3']
+
+
+@pytest.mark.parametrize('executor_type', [batch.ThreadPoolExecutor, ProcessPoolExecutor])
+def test_rows_are_converted_and_run(executor_type):
+    rows = [
+        {'file': 'a.txt', 'method': 'HTTP', 'day': '2002-07-22', 'files': ['b', 'c'], 'retries': 1},
+        {'file': 'a.txt', 'method': 'FTP', 'day': '2002-07-22', 'files': ['b']},
+        {'file': 'a.txt', 'method': 'SFTP', 'day': '2002-07-22', 'files': ['b'], 'retries': -1},
+        {'file': 'a.txt', 'method': 'SFTP', 'day': '2002-07-22', 'files': ['b'], 'verbose': True, 'comment': 'hi'},
+        {'method': 'SFTP'},
+    ]
+    output = io.StringIO()
+
+    failures = batch.run_batch(upload, rows, output, workers=2, executor_type=executor_type)
+
+    records = results(output.getvalue())
+    assert failures == 3
+    assert records[0]['result'] == ['a.txt', 'HTTP', '2002-07-22', ['b', 'c'], 1, None, False]
+    assert 'invalid choice' in records[1]['error']
+    assert 'negative retries' in records[2]['error']
+    assert records[3]['result'] == ['a.txt', 'SFTP', '2002-07-22', ['b'], 3, 'hi', True]
+    assert 'required' in records[4]['error']
+
+
+def test_csv_rows_skip_empty_cells():
+    source = io.StringIO('file,retries,comment\na.txt,2,\n')
+    assert list(batch.read_rows(source, csv_format=True)) == [{'file': 'a.txt', 'retries': '2'}]
+
+
+def test_batch_command_line(tmp_path):
+    rows = tmp_path / 'rows.jsonl'
+    rows.write_text(json.dumps({'file': 'a', 'method': 'SFTP', 'day': '2020-01-01', 'files': ['b']}) + '\n')
+    output = tmp_path / 'results.jsonl'
+
+    process = subprocess.run(
+        [sys.executable, '-m', 'gooey_quick', 'batch', 'tests.test_batch:upload', str(rows), '-o', str(output)],
+        cwd=REPOSITORY_ROOT,
+        env={**os.environ, 'PYTHONPATH': str(REPOSITORY_ROOT)},
+    )
+
+    assert process.returncode == 0
+    assert results(output.read_text())[0]['result'][1] == 'SFTP'
+
+
+def greet(name: Optional[str] = None):
+    return name
+
+
+def test_optional_values_may_start_with_a_dash():
+    output = io.StringIO()
+    assert batch.run_batch(greet, [{'name': '-neg'}], output) == 0
+    assert results(output.getvalue())[0]['result'] == '-neg'
+
+
+def chatty(name: str):
+    print(f'working on {name}')
+    yield f'still working on {name}'
+    return name
+
+
+def test_handler_output_stays_out_of_the_results(tmp_path):
+    rows = tmp_path / 'rows.jsonl'
+    rows.write_text(''.join(json.dumps({'name': name}) + '\n' for name in 'abcdef'))
+
+    process = subprocess.run(
+        [sys.executable, '-m', 'gooey_quick', 'batch', 'tests.test_batch:chatty', str(rows)],
+        cwd=REPOSITORY_ROOT,
+        env={**os.environ, 'PYTHONPATH': str(REPOSITORY_ROOT)},
+        capture_output=True,
+        text=True,
+    )
+
+    assert process.returncode == 0
+    assert [json.loads(line) for line in process.stdout.splitlines()] == [
+        {'row': row, 'result': name} for row, name in enumerate('abcdef')
+    ]
+    assert 'working on a' in process.stderr
@@ -0,0 +1,141 @@
+import sys
+import importlib.util
+from enum import Enum
+from pathlib import Path
+from datetime import date, time
+from typing import Optional, Literal
+
+import pytest
+
+from gooey_quick import cache, converters
+from gooey_quick.__main__ import convert_arguments
+from gooey_quick.types import DirectoryPath, SaveToPath, FileWithExtension
+
+
+class ExampleEnum(Enum):
+    ONE = 1
+    TWO = 2
+
+
+def some_function(
+    file: Path,
+    files: list[FileWithExtension[Literal['csv']]],
+    directory: DirectoryPath,
+    save_to: SaveToPath,
+    day: date,
+    hour: time,
+    choice: ExampleEnum,
+    comment: Optional[str] = None,
+):
+    """
+    :param file: some file
+    :param choice: some choice
+    """
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(monkeypatch, tmp_path):
+    monkeypatch.setenv(cache.CACHE_DIRECTORY_ENVIRONMENT_VARIABLE, str(tmp_path))
+    return tmp_path
+
+
+def counting(convert):
+    def inner(function):
+        inner.calls += 1
+        return convert(function)
+    inner.calls = 0
+    return inner
+
+
+def test_cached_arguments_are_reused(cache_directory):
+    convert = counting(convert_arguments)
+    first = cache.cached_arguments(some_function, convert)
+    second = cache.cached_arguments(some_function, convert)
+
+    assert convert.calls == 1
+    assert len(list((cache_directory / 'arguments').iterdir())) == 1
+    assert first == second == convert_arguments(some_function)
+
+
+def test_stale_entries_are_rebuilt(monkeypatch):
+    convert = counting(convert_arguments)
+    cache.cached_arguments(some_function, convert)
+    monkeypatch.setattr(cache, 'function_fingerprint', lambda function: 'changed')
+    cache.cached_arguments(some_function, convert)
+
+    assert convert.calls == 2
+
+
+def test_corrupted_entries_are_rebuilt(cache_directory):
+    convert = counting(convert_arguments)
+    cache.cached_arguments(some_function, convert)
+    for entry in (cache_directory / 'arguments').iterdir():
+        entry.write_bytes(b'not a pickle')
+
+    assert cache.cached_arguments(some_function, convert) == convert_arguments(some_function)
+    assert convert.calls == 2
+
+
+def test_fingerprint_changes_with_signature():
+    def before(foo: int):
+        pass
+    fingerprint = cache.function_fingerprint(before)
+
+    def before(foo: str):
+        pass
+    assert cache.function_fingerprint(before) != fingerprint
+
+
+def import_from(directory, name):
+    spec = importlib.util.spec_from_file_location(name, directory / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_entries_are_rebuilt_when_an_annotation_type_changes(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / 'cached_enums.py').write_text('from enum import Enum\nclass Color(Enum):\n    RED = 1\n')
+    (tmp_path / 'cached_tool.py').write_text('from cached_enums import Color\ndef handler(color: Color):\n    pass\n')
+    try:
+        import_from(tmp_path, 'cached_enums')
+        tool = import_from(tmp_path, 'cached_tool')
+        assert cache.cached_arguments(tool.handler, convert_arguments)[0]['choices'] == ['RED']
+
+        (tmp_path / 'cached_enums.py').write_text('from enum import Enum\nclass Color(Enum):\n    RED = 1\n    BLUE = 2\n')
+        import_from(tmp_path, 'cached_enums')
+        tool = import_from(tmp_path, 'cached_tool')
+        assert cache.cached_arguments(tool.handler, convert_arguments)[0]['choices'] == ['RED', 'BLUE']
+    finally:
+        sys.modules.pop('cached_enums', None)
+        sys.modules.pop('cached_tool', None)
+
+
+class Money(float):
+    pass
+
+
+def price(amount: Money):
+    pass
+
+
+@pytest.fixture
+def default_registry(monkeypatch):
+    """lets a test register converters, the default registry is restored afterwards"""
+    registry = converters.DEFAULT_REGISTRY
+    for name in ('_origin_converters', '_type_converters', '_subtype_converters', '_resolved'):
+        monkeypatch.setattr(registry, name, dict(getattr(registry, name)))
+    return registry
+
+
+def test_entries_are_rebuilt_when_converters_are_registered(default_registry):
+    converters.register_converter(Money, {'type': Money, 'widget': 'DecimalField'})
+    assert cache.cached_arguments(price, convert_arguments)[0]['widget'] == 'DecimalField'
+
+    converters.register_converter(Money, {'type': Money, 'widget': 'IntegerField'})
+    assert cache.cached_arguments(price, convert_arguments)[0]['widget'] == 'IntegerField'
+
+
+def test_registered_converters_do_not_outlive_their_test():
+    assert all(annotation is not Money for _, annotation, _ in converters.DEFAULT_REGISTRY.registrations())
@@ -1,4 +1,5 @@
-from enum import Enum
+from enum import Enum, IntEnum
+from decimal import Decimal
 from pathlib import Path
 from typing import Optional, Literal
 from datetime import date, time
@@ -8,7 +9,10 @@ import pytest
 from gooey_quick import converters
 from gooey_quick.introspection import Parameter
 from gooey_quick.converters import StoreEnumAction
-from gooey_quick.types import DirectoryPath, SaveToPath, FileWithExtension
+from gooey_quick.mapping import map_file
+from gooey_quick.traversal import WalkDirectory
+from gooey_quick.sequences import int_list, date_list, TupleOf
+from gooey_quick.types import DirectoryPath, SaveToPath, FileWithExtension, MappedFile, DirectoryFiles
 
 PARAMETER_DOCSTRING = 'some docstring for a parameter'
 
@@ -479,6 +483,161 @@ class ExampleEnum(Enum):
                 },
             ),
         ),
+        (
+            Parameter(
+                'mapped_file',
+                type_annotation=MappedFile,
+                docstring=PARAMETER_DOCSTRING,
+            ),
+            dict(
+                dest='mapped_file',
+                action='store',
+                type=map_file,
+                required=True,
+                help=PARAMETER_DOCSTRING,
+                metavar='Mapped file',
+                widget='FileChooser',
+                gooey_options={
+                    'wildcard': 'All files (*.*)|*.*',
+                },
+            ),
+        ),
+        (
+            Parameter(
+                'mapped_file_with_certain_filetype',
+                type_annotation=MappedFile[Literal['bin']],
+                docstring=PARAMETER_DOCSTRING,
+            ),
+            dict(
+                dest='mapped_file_with_certain_filetype',
+                action='store',
+                type=map_file,
+                required=True,
+                help=PARAMETER_DOCSTRING,
+                metavar='Mapped file with certain filetype',
+                widget='FileChooser',
+                gooey_options={
+                    'wildcard': 'BIN (*.bin)|*.bin|All files (*.*)|*.*',
+                },
+            ),
+        ),
+        (
+            Parameter(
+                'mapped_files',
+                type_annotation=list[MappedFile],
+                docstring=PARAMETER_DOCSTRING,
+            ),
+            dict(
+                dest='mapped_files',
+                action='store',
+                type=map_file,
+                nargs='+',
+                required=True,
+                help=PARAMETER_DOCSTRING,
+                metavar='Mapped files',
+                widget='MultiFileChooser',
+            ),
+        ),
+        (
+            Parameter(
+                'directory_files',
+                type_annotation=DirectoryFiles,
+                docstring=PARAMETER_DOCSTRING,
+            ),
+            dict(
+                dest='directory_files',
+                action='store',
+                type=WalkDirectory(),
+                required=True,
+                help=PARAMETER_DOCSTRING,
+                metavar='Directory files',
+                widget='DirChooser',
+            ),
+        ),
+        (
+            Parameter(
+                'filtered_directory_files',
+                type_annotation=DirectoryFiles[Literal['csv', 'data_*.json']],
+                docstring=PARAMETER_DOCSTRING,
+            ),
+            dict(
+                dest='filtered_directory_files',
+                action='store',
+                type=WalkDirectory(('csv', 'data_*.json')),
+                required=True,
+                help=PARAMETER_DOCSTRING,
+                metavar='Filtered directory files',
+                widget='DirChooser',
+            ),
+        ),
+        (
+            Parameter(
+                'int_list_field',
+                type_annotation=list[int],
+                docstring=PARAMETER_DOCSTRING,
+            ),
+            dict(
+                dest='int_list_field',
+                action='store',
+                type=int_list,
+                required=True,
+                help=PARAMETER_DOCSTRING,
+                metavar='Int list field',
+                widget='Textarea',
+            ),
+        ),
+        (
+            Parameter(
+                'date_list_field',
+                type_annotation=list[date],
+                docstring=PARAMETER_DOCSTRING,
+                default=[date(2020, 1, 1), date(2020, 1, 2)],
+            ),
+            dict(
+                dest='date_list_field',
+                action='store',
+                type=date_list,
+                required=True,
+                help=PARAMETER_DOCSTRING,
+                metavar='Date list field',
+                widget='Textarea',
+                gooey_options={
+                    'initial_value': '2020-01-01, 2020-01-02',
+                },
+            ),
+        ),
+        (
+            Parameter(
+                'tuple_field',
+                type_annotation=tuple[int, float],
+                docstring=PARAMETER_DOCSTRING,
+            ),
+            dict(
+                dest='tuple_field',
+                action='store',
+                type=TupleOf((int, float)),
+                required=True,
+                help=PARAMETER_DOCSTRING,
+                metavar='Tuple field',
+                widget='Textarea',
+            ),
+        ),
+        (
+            Parameter(
+                'variadic_tuple_field',
+                type_annotation=tuple[float, ...],
+                docstring=PARAMETER_DOCSTRING,
+            ),
+            dict(
+                dest='variadic_tuple_field',
+                action='store',
+                type=TupleOf((float,), variadic=True),
+                required=True,
+                help=PARAMETER_DOCSTRING,
+                metavar='Variadic tuple field',
+                widget='Textarea',
+            ),
+        ),
     ],
     ids=lambda parameter: parameter.name if isinstance(parameter, Parameter) else None,
 )
@@ -498,8 +657,63 @@ def test_parameter_is_properly_converted(parameter, expected_add_argument_args):
         type_annotation=Optional[dict],
         docstring=PARAMETER_DOCSTRING,
     ),
+    Parameter(
+        'composite_tuple_field',
+        type_annotation=tuple[int, dict],
+        docstring=PARAMETER_DOCSTRING,
+    ),
 ])
 def test_parameter_conversion_raises_value_error_if_cant_translate_parameter(untranslatable_parameter):
     with pytest.raises(ValueError):
         converters.convert_to_argument(untranslatable_parameter)
 
+
+
+class ExampleIntEnum(IntEnum):
+    ONE = 1
+
+
+class Money(Decimal):
+    pass
+
+
+class Euro(Money):
+    pass
+
+
+def test_subtypes_are_resolved_through_their_mro():
+    assert converters.convert_to_argument(
+        Parameter('int_enum_field', ExampleIntEnum),
+    )['action'] is StoreEnumAction
+
+
+def test_converters_can_be_registered():
+    registry = converters.ConverterRegistry()
+    registry.register(Money, {'type': Money, 'widget': 'DecimalField'}, include_subclasses=True)
+
+    args = converters.convert_to_argument(Parameter('price', Euro), registry=registry)
+
+    assert args['type'] is Money
+    assert args['widget'] == 'DecimalField'
+    with pytest.raises(ValueError):
+        converters.convert_to_argument(Parameter('price', Euro))
+
+    registry.register_origin(Optional, converters.convert_optional)
+    args = converters.convert_to_argument(Parameter('price', Optional[Euro], default=None), registry=registry)
+
+    assert args['type'] is Money
+    assert args['required'] is False
+    with pytest.raises(ValueError):
+        converters.convert_to_argument(Parameter('price', Optional[Euro], default=None))
+
+
+def test_registered_static_args_are_not_shared():
+    registry = converters.ConverterRegistry()
+    registry.register(Money, {'type': Money, 'gooey_options': {'wildcard': '*'}})
+
+    converters.convert_to_argument(Parameter('price', Money, default=Money(1)), registry=registry)
+
+    assert 'initial_value' not in converters.convert_to_argument(
+        Parameter('price', Money),
+        registry=registry,
+    )['gooey_options']
@@ -0,0 +1,84 @@
+import os
+import signal
+import asyncio
+
+import pytest
+
+from gooey_quick import execution
+
+
+def plain_handler(foo: str, bar: int):
+    return foo * bar
+
+
+def generator_handler(count: int):
+    for index in range(count):
+        yield f'step {index}'
+        yield
+    return 'done'
+
+
+def test_plain_handlers_are_called(capsys):
+    assert execution.call_handler(plain_handler, {'foo': 'a', 'bar': 3}) == 'aaa'
+    assert capsys.readouterr().out == ''
+
+
+def test_generator_handlers_are_drained_incrementally(capsys):
+    assert execution.call_handler(generator_handler, {'count': 3}) == 'done'
+    assert capsys.readouterr().out == 'step 0\nstep 1\nstep 2\n'
+
+
+def test_generator_items_are_printed_before_the_handler_finishes(capsys):
+    def handler():
+        yield 'first'
+        assert capsys.readouterr().out == 'first\n'
+        yield 'second'
+
+    assert execution.call_handler(handler, {}) is None
+    assert capsys.readouterr().out == 'second\n'
+
+
+def test_generator_handler_errors_propagate():
+    def handler():
+        yield 'first'
+        raise RuntimeError('failure')
+
+    with pytest.raises(RuntimeError):
+        execution.call_handler(handler, {})
+
+
+async def async_handler(foo: str, bar: int):
+    await asyncio.sleep(0)
+    return foo * bar
+
+
+async def async_generator_handler(count: int):
+    for index in range(count):
+        await asyncio.sleep(0)
+        yield f'step {index}'
+
+
+def test_async_handlers_are_awaited():
+    assert execution.call_handler(async_handler, {'foo': 'a', 'bar': 3}) == 'aaa'
+
+
+def test_async_generator_handlers_are_drained(capsys):
+    assert execution.call_handler(async_generator_handler, {'count': 2}) is None
+    assert capsys.readouterr().out == 'step 0\nstep 1\n'
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGTERM') or os.name == 'nt', reason='needs POSIX signals')
+def test_async_handlers_are_cancelled_by_shutdown_signal():
+    cleaned_up = []
+
+    async def handler():
+        try:
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.sleep(10)
+        finally:
+            cleaned_up.append(True)
+
+    with pytest.raises(SystemExit):
+        execution.call_handler(handler, {})
+    assert cleaned_up == [True]
+    assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL
@@ -0,0 +1,69 @@
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+REPOSITORY_ROOT = Path(__file__).resolve().parent.parent
+
+# cumulative import time budgets in microseconds, generous enough for slow CI machines
+IMPORT_TIME_BUDGETS = {
+    'gooey_quick': 20_000,
+    'gooey_quick.types': 60_000,
+    'gooey_quick.converters': 150_000,
+    'gooey_quick.__main__': 250_000,
+}
+
+# only imported when a program uses them, every headless start imports gooey_quick.__main__
+ON_DEMAND_MODULES = (
+    'asyncio',
+    'cProfile',
+    'tracemalloc',
+    'multiprocessing',
+    'gooey_quick.worker',
+    'gooey_quick.threaded',
+    'gooey_quick.jobs',
+)
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=REPOSITORY_ROOT,
+        env={**os.environ, 'PYTHONPATH': str(REPOSITORY_ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def cumulative_import_time(importtime_report: str, module: str) -> int:
+    for line in importtime_report.splitlines():
+        _, cumulative_time, imported_module = line.split('|')
+        if imported_module.strip() == module:
+            return int(cumulative_time)
+    raise AssertionError(f'{module} was not imported')
+
+
+@pytest.mark.parametrize('module, budget', IMPORT_TIME_BUDGETS.items())
+def test_import_time_is_within_budget(module, budget):
+    # the first import may compile bytecode, only the second one is measured
+    run_python('-c', f'import {module}')
+    report = run_python('-X', 'importtime', '-c', f'import {module}').stderr
+    assert cumulative_import_time(report, module) <= budget
+
+
+def test_gooey_is_not_imported_by_the_core_modules():
+    imported = run_python(
+        '-c',
+        'import sys, gooey_quick, gooey_quick.types, gooey_quick.introspection, gooey_quick.converters;'
+        'print(" ".join(sys.modules))',
+    ).stdout.split()
+    assert 'gooey' not in imported
+    assert 'wx' not in imported
+
+
+def test_optional_features_are_imported_on_demand():
+    imported = run_python('-c', 'import sys, gooey_quick.__main__; print(" ".join(sys.modules))').stdout.split()
+    assert not set(ON_DEMAND_MODULES) & set(imported)
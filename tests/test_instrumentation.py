@@ -0,0 +1,77 @@
+import sys
+import json
+from enum import Enum
+from datetime import date
+
+import pytest
+
+import gooey_quick
+from gooey_quick import instrumentation
+
+
+class Color(Enum):
+    RED = 1
+
+
+def handler(day: date, color: Color, count: int = 1):
+    """
+    :param day: some day
+    """
+    return day, color, count
+
+
+@pytest.fixture(autouse=True)
+def disable_instrumentation(monkeypatch):
+    monkeypatch.delenv(instrumentation.TRACE_ENVIRONMENT_VARIABLE, raising=False)
+    yield
+    instrumentation.disable()
+
+
+def run(monkeypatch, **kwargs):
+    monkeypatch.setattr(sys, 'argv', ['program.py', '--ignore-gooey', '2002-07-22', 'RED', '2'])
+    return gooey_quick.run_gooey(handler, **kwargs)
+
+
+def test_every_stage_is_timed(monkeypatch):
+    events = []
+    assert run(monkeypatch, trace=events.append) == (date(2002, 7, 22), Color.RED, 2)
+
+    names = {event['name'] for event in events}
+    assert names >= {
+        'extract_signature',
+        'parse_docstring',
+        'convert_to_argument',
+        'create_parser',
+        'parse_args',
+        'convert_argument',
+        'handler',
+    }
+    assert all(event['ph'] == 'X' and event['dur'] >= 0 for event in events)
+    assert {
+        event['args']['parameter'] for event in events if event['name'] == 'convert_argument'
+    } == {'day', 'color', 'count'}
+
+
+def test_events_are_written_to_json_lines(monkeypatch, tmp_path):
+    trace_file = tmp_path / 'trace.jsonl'
+    monkeypatch.setenv(instrumentation.TRACE_ENVIRONMENT_VARIABLE, str(trace_file))
+    run(monkeypatch)
+    instrumentation.disable()
+
+    events = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert 'handler' in {event['name'] for event in events}
+
+
+def test_events_are_written_to_chrome_trace(monkeypatch, tmp_path):
+    trace_file = tmp_path / 'trace.json'
+    run(monkeypatch, trace=[f'chrome:{trace_file}'])
+    instrumentation.disable()
+
+    # the array's closing bracket is optional in the trace event format
+    events = json.loads(trace_file.read_text().rstrip().rstrip(',') + ']')
+    assert 'handler' in {event['name'] for event in events}
+
+
+def test_nothing_is_emitted_when_disabled():
+    assert not instrumentation.enabled()
+    assert instrumentation.span('stage') is instrumentation.span('another stage')
@@ -1,10 +1,11 @@
 from inspect import Parameter
+from dataclasses import FrozenInstanceError
 from typing import Optional, Literal
 
 import pytest
 
 from gooey_quick.types import FileWithExtension
-from gooey_quick.introspection import Parameter as ParameterTested
+from gooey_quick.introspection import Parameter as ParameterTested, extract_signature
 
 
 def some_function(foo: str, bar: int, foobar: float):
@@ -138,3 +139,60 @@ def test_parameter_knows_its_origin(type_annotation, expected_origin):
 ])
 def test_parameter_knows_its_args(type_annotation, expected_args):
     assert ParameterTested('field_name', type_annotation, default=None).args == expected_args
+
+
+def test_parameter_is_immutable():
+    parameter = ParameterTested('field_name', str)
+    with pytest.raises(FrozenInstanceError):
+        parameter.name = 'another_name'
+    assert not hasattr(parameter, '__dict__')
+
+
+def test_parsed_parameters_are_cached_per_function(monkeypatch):
+    def function(foo: str, bar: int = 1):
+        """:param foo: an argument"""
+
+    first = ParameterTested.parse_callable_parameters(function)
+    monkeypatch.setattr(
+        'gooey_quick.introspection.DOCSTRING_PARAM_REGEX',
+        None,
+    )
+    second = ParameterTested.parse_callable_parameters(function)
+
+    assert first == second
+    assert all(a is b for a, b in zip(first, second))
+    assert first is not second
+
+
+def stringified_function(foo: 'str', bar: 'Optional[int]' = None, baz: 'FileWithExtension[Literal["csv"]]' = None):
+    pass
+
+
+def test_stringified_annotations_are_resolved():
+    assert ParameterTested.parse_callable_parameters(stringified_function) == [
+        ParameterTested('foo', str),
+        ParameterTested('bar', Optional[int], default=None),
+        ParameterTested('baz', FileWithExtension[Literal['csv']], default=None),
+    ]
+
+
+def test_stringified_annotations_are_resolved_from_closures():
+    class LocalType:
+        pass
+
+    def function(foo: 'LocalType', bar: 'UndefinedType'):
+        return LocalType
+
+    parameters = ParameterTested.parse_callable_parameters(function)
+
+    assert parameters[0].type_annotation is LocalType
+    assert parameters[1].type_annotation == 'UndefinedType'
+
+
+def test_resolved_signatures_are_cached(monkeypatch):
+    def function(foo: 'int'):
+        pass
+
+    first = extract_signature(function)
+    monkeypatch.setattr('inspect.signature', None)
+    assert extract_signature(function) is first
@@ -0,0 +1,146 @@
+import sys
+import time
+import textwrap
+from pathlib import Path
+
+import pytest
+
+import gooey_quick
+from gooey_quick import jobs, headless, argument_files
+from gooey_quick.jobs import JobQueue
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def program(tmp_path, monkeypatch):
+    script = tmp_path / 'program.py'
+    script.write_text(textwrap.dedent('''
+        import time
+        from typing import Optional
+        from pathlib import Path
+
+        import gooey_quick
+
+        def work(name: str, seconds: float, gate: Optional[Path] = None):
+            while gate is not None and not gate.exists():
+                time.sleep(0.01)
+            time.sleep(seconds)
+            if name == 'fail':
+                raise RuntimeError('failure')
+            print(f'done {name}')
+
+        if __name__ == '__main__':
+            gooey_quick.run_gooey(work)
+    '''))
+    monkeypatch.setenv('PYTHONPATH', str(REPOSITORY))
+    return [sys.executable, '-u', str(script)]
+
+
+def wait_until(condition, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.01)
+
+
+def test_jobs_run_concurrently_up_to_the_limit(program, tmp_path):
+    queue = JobQueue(program, max_workers=2, log_directory=tmp_path)
+    gate = tmp_path / 'gate'
+    submitted = [queue.submit(['--ignore-gooey', f'--gate={gate}', name, '0']) for name in ('a', 'b', 'c')]
+
+    # the first two jobs wait for the gate, keeping the third one queued
+    wait_until(lambda: all(job.process is not None for job in submitted[:2]))
+    assert [job.status for job in submitted] == [jobs.RUNNING, jobs.RUNNING, jobs.QUEUED]
+
+    gate.touch()
+    queue.shutdown()
+    assert [job.status for job in submitted] == [jobs.SUCCEEDED] * 3
+    assert [Path(job.log_path).read_text() for job in submitted] == ['done a\n', 'done b\n', 'done c\n']
+
+
+def test_failed_jobs_are_reported(program, tmp_path):
+    queue = JobQueue(program, max_workers=1, log_directory=tmp_path)
+    failed = queue.submit(['--ignore-gooey', 'fail', '0'])
+    queue.shutdown()
+
+    assert failed.status == jobs.FAILED
+    assert failed.exit_code == 1
+    assert 'RuntimeError: failure' in Path(failed.log_path).read_text()
+
+
+def test_long_command_lines_go_through_argument_files(program, tmp_path):
+    queue = JobQueue(program, max_workers=1, log_directory=tmp_path)
+    name = 'x' * (2 * argument_files.SPILL_THRESHOLD)
+    job = queue.submit(['--ignore-gooey', name, '0'])
+    queue.shutdown()
+
+    assert job.status == jobs.SUCCEEDED
+    assert Path(job.log_path).read_text() == f'done {name}\n'
+
+
+@pytest.mark.parametrize('command, cwd', [
+    (['/nonexistent/python'], None),
+    ([sys.executable, '-c', 'pass'], '/nonexistent/directory'),
+])
+def test_jobs_that_cant_start_are_failed(tmp_path, command, cwd):
+    queue = JobQueue(command, max_workers=1, log_directory=tmp_path)
+    job = queue.submit([], cwd=cwd)
+    queue.shutdown()
+
+    assert job.status == jobs.FAILED
+    assert job.finished is not None
+    assert 'could not be started' in Path(job.log_path).read_text()
+
+
+def test_cancelled_jobs_are_killed_or_dropped(program, tmp_path):
+    queue = JobQueue(program, max_workers=1, log_directory=tmp_path)
+    running, queued = queue.submit(['--ignore-gooey', 'a', '60']), queue.submit(['--ignore-gooey', 'b', '0'])
+    wait_until(lambda: running.process is not None)
+
+    queue.shutdown(cancel=True)
+    assert [running.status, queued.status] == [jobs.CANCELLED, jobs.CANCELLED]
+    assert running.exit_code != 0
+    assert queued.process is None
+
+
+def test_submissions_report_every_jobs_status(program, tmp_path, capsys):
+    queue = JobQueue(program, max_workers=1, log_directory=tmp_path)
+    queue.submit_and_report(['--ignore-gooey', 'a', '0'])
+    wait_until(lambda: queue.jobs[0].status == jobs.SUCCEEDED)
+    queue.submit_and_report(['--ignore-gooey', 'b c', '0'])
+    queue.shutdown()
+
+    output = capsys.readouterr().out.splitlines()
+    assert output[0] == f'Job 1 queued, its output goes to {tmp_path / "job-1.log"}'
+    first, second = output[-2].split(), output[-1].split()
+    assert first[:3] + first[4:] == ['1', 'succeeded', '0', 'a', '0']
+    assert second[0] == '2' and second[1] in (jobs.QUEUED, jobs.RUNNING)
+    assert output[-1].endswith("'b c' 0")
+
+
+def test_status_only_submissions_queue_nothing(program, tmp_path, capsys):
+    queue = JobQueue(program, max_workers=1, log_directory=tmp_path)
+    queue.submit_and_report(['--ignore-gooey', 'a', '0'])
+    queue.shutdown()
+    capsys.readouterr()
+
+    queue.submit_and_report(['--ignore-gooey', 'b', '0', f'--{jobs.STATUS_ONLY_DEST}'])
+    output = capsys.readouterr().out.splitlines()
+    assert len(queue.jobs) == 1
+    assert len(output) == 2
+    assert output[1].split()[:3] == ['1', 'succeeded', '0']
+
+
+def test_status_checkbox_is_added_to_the_parser():
+    parser = gooey_quick.create_parser(greet, headless.HeadlessParser(), job_status=True)
+    assert parser.parse_args(['a', f'--{jobs.STATUS_ONLY_DEST}']).__dict__ == {'name': 'a', jobs.STATUS_ONLY_DEST: True}
+
+
+def greet(name: str):
+    return name
+
+
+def test_job_queue_is_exclusive_with_other_modes():
+    with pytest.raises(ValueError):
+        gooey_quick.run_gooey(greet, in_process=True, job_queue=4)
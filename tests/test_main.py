@@ -0,0 +1,87 @@
+import sys
+from enum import Enum
+from pathlib import Path
+from datetime import date
+
+import pytest
+
+import gooey_quick
+from gooey_quick import headless
+from gooey_quick.__main__ import selected_section
+
+
+class ExampleEnum(Enum):
+    ONE = 1
+    TWO = 2
+
+
+def some_handler(file: Path, count: int, choice: ExampleEnum, day: date = date(2000, 1, 1)):
+    return file, count, choice, day
+
+
+def another_handler(name: str, shout: bool = False):
+    return name.upper() if shout else name
+
+
+@pytest.mark.parametrize('argv, expected_headless', [
+    (['program.py'], False),
+    (['program.py', '--ignore-gooey'], True),
+    (['program.py', 'foo', '--ignore-gooey', '--bar', '1'], True),
+])
+def test_headless_is_detected_from_ignore_gooey_flag(monkeypatch, argv, expected_headless):
+    monkeypatch.delenv(headless.HEADLESS_ENVIRONMENT_VARIABLE, raising=False)
+    assert headless.is_headless(argv) == expected_headless
+
+
+def test_headless_is_detected_from_environment(monkeypatch):
+    monkeypatch.setenv(headless.HEADLESS_ENVIRONMENT_VARIABLE, '1')
+    assert headless.is_headless(['program.py'])
+
+
+def test_headless_parser_drops_gooey_only_arguments():
+    parser = headless.HeadlessParser()
+    parser.add_argument('--foo', widget='FileChooser', gooey_options={'wildcard': '*.*'})
+    assert parser.parse_args(['--foo', 'bar']).foo == 'bar'
+
+
+def test_run_gooey_runs_callable_headless(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['program.py', 'some/file', '5', 'TWO', '2002-07-22', '--ignore-gooey'])
+    assert gooey_quick.run_gooey(some_handler) == (
+        Path('some/file'),
+        5,
+        ExampleEnum.TWO,
+        date(2002, 7, 22),
+    )
+    assert 'gooey' not in sys.modules
+
+
+def test_run_gooey_runs_sections_headless(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['program.py', '--ignore-gooey', 'another_handler', 'jaca', '--shout'])
+    assert gooey_quick.run_gooey({
+        'Some section': some_handler,
+        'Another section': another_handler,
+    }) == 'JACA'
+    assert 'gooey' not in sys.modules
+
+
+def unconvertable_handler(mapping: dict):
+    pass
+
+
+@pytest.mark.parametrize('argv, expected_section', [
+    ([], None),
+    (['-h'], None),
+    (['another_handler', 'jaca'], 'another_handler'),
+    (['not_a_handler'], None),
+])
+def test_selected_section_is_peeked_from_command_line(argv, expected_section):
+    sections = {'Some section': some_handler, 'Another section': another_handler}
+    assert selected_section(sections, argv) == expected_section
+
+
+def test_only_the_selected_section_is_built(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['program.py', '--ignore-gooey', 'another_handler', 'jaca'])
+    assert gooey_quick.run_gooey({
+        'Broken section': unconvertable_handler,
+        'Another section': another_handler,
+    }) == 'jaca'
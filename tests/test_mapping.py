@@ -0,0 +1,100 @@
+from argparse import ArgumentTypeError
+
+import pytest
+
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from gooey_quick import execution, parallel, batch
+from gooey_quick.types import MappedFile
+from gooey_quick.mapping import map_file, release_mapped_files
+
+
+def test_files_are_mapped_read_only(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'\x00\x01\x02')
+
+    view = map_file(str(path))
+
+    assert view.readonly
+    assert view.tobytes() == b'\x00\x01\x02'
+
+
+def test_empty_files_are_mapped(tmp_path):
+    path = tmp_path / 'empty.bin'
+    path.touch()
+
+    assert map_file(str(path)).tobytes() == b''
+
+
+def test_missing_files_are_reported_to_argparse(tmp_path):
+    with pytest.raises(ArgumentTypeError):
+        map_file(str(tmp_path / 'missing.bin'))
+
+
+def test_mappings_are_released(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'data')
+    view, views = map_file(str(path)), [map_file(str(path))]
+    mappings = [view.obj, views[0].obj]
+
+    release_mapped_files({'view': view, 'views': views, 'other': b'data'})
+
+    assert all(mapping.closed for mapping in mappings)
+    with pytest.raises(ValueError):
+        view.tobytes()
+
+
+def test_mappings_still_in_use_are_left_to_the_garbage_collector(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'data')
+    view = map_file(str(path))
+    kept = memoryview(view.obj)
+
+    release_mapped_files({'view': view})
+
+    assert kept.tobytes() == b'data'
+
+
+def test_mappings_are_released_after_the_handler(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'data')
+    view = map_file(str(path))
+    mapping = view.obj
+
+    assert execution.call_handler(lambda data: data.tobytes(), {'data': view}) == b'data'
+    assert mapping.closed
+
+
+@parallel.map_over('data', max_workers=2)
+def first_byte(data: MappedFile, offset: int):
+    return data[offset]
+
+
+def size_of(data: MappedFile, others: list[MappedFile]):
+    return [len(view) for view in (data, *others)]
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    paths = []
+    for contents in (b'abc', b'', b'xyz'):
+        paths.append(tmp_path / f'{len(paths)}.bin')
+        paths[-1].write_bytes(contents)
+    return paths
+
+
+def test_mapped_files_reach_worker_processes(monkeypatch, data_files):
+    monkeypatch.setattr(parallel, 'available_cpus', lambda: 2)
+    views = [map_file(str(path)) for path in (data_files[0], data_files[2])]
+
+    assert execution.call_handler(first_byte, {'data': views, 'offset': 1}) == [ord('b'), ord('y')]
+
+
+def test_mapped_files_reach_batch_worker_processes(data_files):
+    rows = [{'data': str(data_files[0]), 'others': [str(data_files[1]), str(data_files[2])]}]
+    output = io.StringIO()
+
+    assert batch.run_batch(size_of, rows, output, executor_type=ProcessPoolExecutor) == 0
+    assert json.loads(output.getvalue())['result'] == [3, 0, 3]
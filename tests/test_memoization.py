@@ -0,0 +1,131 @@
+import os
+import sys
+from enum import Enum
+from pathlib import Path
+
+import pytest
+
+import gooey_quick
+from gooey_quick import cache, memoization
+from gooey_quick.types import SaveToPath
+from gooey_quick.execution import call_handler
+
+
+class ExampleEnum(Enum):
+    ONE = 1
+
+
+calls = []
+
+
+def read_file(file: Path, times: int):
+    calls.append((file, times))
+    return file.read_text() * times
+
+
+def streaming_handler(count: int):
+    calls.append(count)
+    yield from range(count)
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(monkeypatch, tmp_path):
+    monkeypatch.setenv(cache.CACHE_DIRECTORY_ENVIRONMENT_VARIABLE, str(tmp_path / 'cache'))
+    calls.clear()
+    return tmp_path / 'cache'
+
+
+@pytest.fixture
+def file(tmp_path):
+    path = tmp_path / 'input.txt'
+    path.write_text('a')
+    return path
+
+
+def test_identical_runs_are_memoized(file):
+    assert memoization.memoized_call(call_handler, read_file, {'file': file, 'times': 2}) == 'aa'
+    assert memoization.memoized_call(call_handler, read_file, {'times': 2, 'file': file}) == 'aa'
+    assert len(calls) == 1
+
+    assert memoization.memoized_call(call_handler, read_file, {'file': file, 'times': 3}) == 'aaa'
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize('mode', [memoization.STAT, memoization.CONTENT])
+def test_changed_input_files_are_not_memoized(file, mode):
+    assert memoization.memoized_call(call_handler, read_file, {'file': file, 'times': 1}, mode) == 'a'
+    file.write_text('bb')
+    assert memoization.memoized_call(call_handler, read_file, {'file': file, 'times': 1}, mode) == 'bb'
+    assert len(calls) == 2
+
+
+def test_content_mode_ignores_touched_files(file):
+    memoization.memoized_call(call_handler, read_file, {'file': file, 'times': 1}, memoization.CONTENT)
+    os.utime(file, ns=(0, 0))
+    memoization.memoized_call(call_handler, read_file, {'file': file, 'times': 1}, memoization.CONTENT)
+    assert len(calls) == 1
+
+
+def test_generator_handlers_are_not_memoized(capsys):
+    memoization.memoized_call(call_handler, streaming_handler, {'count': 2})
+    memoization.memoized_call(call_handler, streaming_handler, {'count': 2})
+    assert calls == [2, 2]
+    assert capsys.readouterr().out == '0\n1\n0\n1\n'
+
+
+def test_unfingerprintable_arguments_are_not_memoized():
+    def handler(data):
+        calls.append(data)
+
+    memoization.memoized_call(call_handler, handler, {'data': memoryview(b'data')})
+    memoization.memoized_call(call_handler, handler, {'data': memoryview(b'data')})
+    assert len(calls) == 2
+
+
+def write_file(output: SaveToPath, text: str):
+    calls.append(text)
+    Path(output).write_text(text)
+    return len(text)
+
+
+def test_handlers_writing_outputs_are_not_memoized(tmp_path):
+    output = SaveToPath(tmp_path / 'out.txt')
+    memoization.memoized_call(call_handler, write_file, {'output': output, 'text': 'a'})
+    output.unlink()
+
+    assert memoization.memoized_call(call_handler, write_file, {'output': output, 'text': 'a'}) == 1
+    assert output.read_text() == 'a'
+    assert len(calls) == 2
+
+
+def test_fingerprints_of_lists_and_enums():
+    assert memoization.argument_fingerprint([ExampleEnum.ONE, 'a']) == ('list', ['<ExampleEnum.ONE: 1>', 'a'])
+
+
+def test_least_recently_used_results_are_evicted(cache_directory):
+    directory = cache.cache_directory('results')
+    for index, name in enumerate(('old', 'used', 'new')):
+        path = directory / name
+        path.write_bytes(b'x' * 10)
+        os.utime(path, ns=(index, index))
+
+    memoization.evict(directory, limit=20)
+    assert sorted(path.name for path in directory.iterdir()) == ['new', 'used']
+
+
+def test_results_cache_respects_size_limit(monkeypatch, cache_directory, file):
+    monkeypatch.setenv(memoization.SIZE_LIMIT_ENVIRONMENT_VARIABLE, '1')
+    memoization.memoized_call(call_handler, read_file, {'file': file, 'times': 100})
+    assert list(cache.cache_directory('results').iterdir()) == []
+
+
+def test_run_gooey_memoizes_results(monkeypatch, file):
+    for _ in range(2):
+        monkeypatch.setattr(sys, 'argv', ['program.py', '--ignore-gooey', str(file), '2'])
+        assert gooey_quick.run_gooey(read_file, memoize=True) == 'aa'
+    assert len(calls) == 1
+
+
+def test_unknown_memoization_modes_are_rejected():
+    with pytest.raises(ValueError):
+        memoization.fingerprint_mode('size')
@@ -0,0 +1,52 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from gooey_quick import parallel, execution, converters
+from gooey_quick.introspection import Parameter
+
+
+@parallel.map_over('file')
+def count_characters(file: Path, multiplier: int):
+    return os.getpid(), len(str(file)) * multiplier
+
+
+@parallel.map_over('file', max_workers=1)
+def name_of(file: Path):
+    return file.name
+
+
+def test_mapped_parameter_becomes_a_list():
+    parameters = Parameter.parse_callable_parameters(count_characters)
+    assert parameters[0] == Parameter('file', list[Path])
+    assert converters.convert_to_argument(parameters[0])['widget'] == 'MultiFileChooser'
+
+
+def test_decorated_function_is_returned_unchanged():
+    assert name_of(Path('some/file.txt')) == 'file.txt'
+
+
+def test_items_are_mapped_in_order():
+    files = [Path('a' * length) for length in range(1, 50)]
+    results = execution.call_handler(count_characters, {'file': files, 'multiplier': 2})
+    assert [length for _, length in results] == [2 * length for length in range(1, 50)]
+
+
+def test_items_are_processed_in_worker_processes(monkeypatch):
+    monkeypatch.setattr(parallel, 'available_cpus', lambda: 2)
+    results = execution.call_handler(count_characters, {'file': [Path('a'), Path('b')], 'multiplier': 1})
+    assert os.getpid() not in {pid for pid, _ in results}
+
+
+def test_single_worker_runs_in_process():
+    files = [Path('a.txt'), Path('b.txt')]
+    assert execution.call_handler(name_of, {'file': files}) == ['a.txt', 'b.txt']
+
+
+def test_mapped_parameter_must_exist():
+    def count(file: Path):
+        pass
+
+    with pytest.raises(ValueError, match="'files'"):
+        parallel.map_over('files')(count)
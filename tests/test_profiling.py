@@ -0,0 +1,58 @@
+import sys
+
+import pytest
+
+import gooey_quick
+from gooey_quick import profiling
+
+
+def handler(count: int):
+    return sum(range(count))
+
+
+@pytest.fixture(autouse=True)
+def working_directory(monkeypatch, tmp_path):
+    monkeypatch.delenv(profiling.PROFILE_ENVIRONMENT_VARIABLE, raising=False)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def run(monkeypatch, *argv, **kwargs):
+    monkeypatch.setattr(sys, 'argv', ['program.py', '--ignore-gooey', *argv])
+    return gooey_quick.run_gooey(handler, **kwargs)
+
+
+def test_ticked_checkbox_profiles_the_handler(monkeypatch, capsys, working_directory):
+    assert run(monkeypatch, '1000', f'--{profiling.PROFILE_DEST}', profile=True) == sum(range(1000))
+
+    suffixes = sorted(path.suffix for path in working_directory.iterdir())
+    assert suffixes == ['.pstats', '.tracemalloc']
+    output = capsys.readouterr().out
+    assert 'Hottest functions' in output
+    assert 'Largest allocation sites' in output
+
+
+def test_profiling_mode_can_be_chosen(monkeypatch, working_directory):
+    run(monkeypatch, '1000', f'--{profiling.PROFILE_DEST}', profile=profiling.CPU)
+    assert [path.suffix for path in working_directory.iterdir()] == ['.pstats']
+
+
+def test_unticked_checkbox_doesnt_profile(monkeypatch, working_directory):
+    assert run(monkeypatch, '1000', profile=True) == sum(range(1000))
+    assert list(working_directory.iterdir()) == []
+
+
+def test_environment_variable_enables_profiling(monkeypatch, working_directory):
+    monkeypatch.setenv(profiling.PROFILE_ENVIRONMENT_VARIABLE, '1')
+    run(monkeypatch, '1000')
+    assert len(list(working_directory.iterdir())) == 2
+
+
+def test_checkbox_is_only_added_on_request(monkeypatch):
+    with pytest.raises(SystemExit):
+        run(monkeypatch, '1000', f'--{profiling.PROFILE_DEST}')
+
+
+def test_unknown_modes_are_rejected(monkeypatch):
+    with pytest.raises(ValueError):
+        run(monkeypatch, '1000', profile='disk')
@@ -0,0 +1,127 @@
+import re
+from types import SimpleNamespace
+
+import pytest
+
+import gooey_quick
+from gooey_quick import reporting
+from gooey_quick.reporting import ProgressReporter
+from gooey_quick.execution import call_handler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def progress_lines(output: str) -> list[str]:
+    return [line for line in output.splitlines() if re.match(reporting.PROGRESS_REGEX, line)]
+
+
+def test_updates_are_throttled(capsys):
+    clock = FakeClock()
+    reporter = ProgressReporter(min_interval=1, clock=clock)
+
+    assert reporter(1, 10)
+    assert not reporter(2, 10)
+    clock.now = 1
+    assert reporter(3, 10)
+    assert reporter(10, 10)
+    assert not reporter(10, 10)
+    assert capsys.readouterr().out == 'progress: 1/10\nprogress: 3/10\nprogress: 10/10\n'
+
+
+def test_updates_without_total_go_to_the_console(capsys):
+    clock = FakeClock()
+    reporter = ProgressReporter(min_interval=0.1, clock=clock)
+
+    assert reporter(5)
+    clock.now = 0.5
+    assert not reporter(6)
+    assert capsys.readouterr().out == '5 done\n'
+
+
+def test_progress_yields_every_item_and_reports_the_end(capsys):
+    assert list(gooey_quick.progress(range(5))) == [0, 1, 2, 3, 4]
+    lines = progress_lines(capsys.readouterr().out)
+    assert lines[0] == 'progress: 0/5'
+    assert lines[-1] == 'progress: 5/5'
+
+
+def test_progress_without_length(capsys):
+    assert sum(gooey_quick.progress(iter(range(3)))) == 3
+    assert capsys.readouterr().out.splitlines()[-1] == '3 done'
+
+
+def test_progress_checks_the_clock_a_few_times_per_interval(monkeypatch, capsys):
+    clock = FakeClock()
+    monkeypatch.setattr(reporting, 'time', SimpleNamespace(monotonic=clock))
+    checks = []
+
+    class CountingReporter(ProgressReporter):
+        def __call__(self, done, total=None, force=False):
+            checks.append(done)
+            return super().__call__(done, total, force)
+    monkeypatch.setattr(reporting, 'ProgressReporter', CountingReporter)
+
+    def items():
+        # a million items per second
+        for item in range(2_000_000):
+            clock.now += 1e-6
+            yield item
+
+    for _ in gooey_quick.progress(items(), total=2_000_000, min_interval=0.01):
+        pass
+
+    # 0.01s worth of items is 10000 items, they get about CHECKS_PER_INTERVAL checks
+    expected_checks = 2_000_000 / 10_000 * reporting.CHECKS_PER_INTERVAL
+    assert expected_checks <= len(checks) < 1.1 * expected_checks
+    assert progress_lines(capsys.readouterr().out)[-1] == 'progress: 2000000/2000000'
+
+
+def test_report_is_throttled_per_thread(capsys):
+    for done in range(1, 100_001):
+        gooey_quick.report(done, 100_000)
+    lines = progress_lines(capsys.readouterr().out)
+    assert lines[-1] == 'progress: 100000/100000'
+    assert len(lines) < 100
+
+
+def count_to(total: int):
+    for done in range(1, total + 1):
+        gooey_quick.report(done, total)
+
+
+def test_every_run_reports_its_first_update(capsys):
+    # the same thread running twice in a row, like a warm worker or an in-process run
+    call_handler(count_to, {'total': 10})
+    call_handler(count_to, {'total': 10})
+    lines = progress_lines(capsys.readouterr().out)
+    assert lines == ['progress: 1/10', 'progress: 10/10'] * 2
+
+
+@pytest.mark.parametrize('kwargs, expected', [
+    ({}, {
+        'progress_regex': reporting.PROGRESS_REGEX,
+        'progress_expr': reporting.PROGRESS_EXPRESSION,
+        'hide_progress_msg': True,
+    }),
+    ({'hide_progress_msg': False, 'program_name': 'x'}, {
+        'progress_regex': reporting.PROGRESS_REGEX,
+        'progress_expr': reporting.PROGRESS_EXPRESSION,
+        'hide_progress_msg': False,
+        'program_name': 'x',
+    }),
+    ({'progress_regex': r'^(\d+)%$'}, {'progress_regex': r'^(\d+)%$'}),
+])
+def test_gooey_progress_bar_is_set_up(kwargs, expected):
+    assert reporting.gooey_options(kwargs) == expected
+
+
+def test_progress_expression_matches_the_updates():
+    match = re.search(reporting.PROGRESS_REGEX, 'progress: 25/200')
+    values = {name: float(value) for name, value in match.groupdict().items()}
+    assert eval(reporting.PROGRESS_EXPRESSION, {}, values) == 12.5
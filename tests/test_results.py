@@ -0,0 +1,79 @@
+import pickle
+import textwrap
+from array import array
+
+import pytest
+
+from gooey_quick import results
+
+
+class Payload:
+    def __init__(self, data: bytearray, name: str):
+        self.data = pickle.PickleBuffer(data)
+        self.name = name
+
+    def __reduce_ex__(self, protocol):
+        return Payload._rebuild, (self.data, self.name)
+
+    @staticmethod
+    def _rebuild(data, name):
+        payload = Payload.__new__(Payload)
+        payload.data, payload.name = memoryview(data), name
+        return payload
+
+
+@pytest.mark.parametrize('value', [
+    None,
+    'some text',
+    {'nested': [1, 2.5, ('tuple',)]},
+    b'',
+])
+def test_values_round_trip(tmp_path, value):
+    results.write_result(value, tmp_path / 'result')
+    loaded = results.read_result(tmp_path / 'result')
+    assert (bytes(loaded) if isinstance(loaded, memoryview) else loaded) == value
+
+
+def test_bytes_are_returned_as_memory_mapped_view(tmp_path):
+    results.write_result(memoryview(b'x' * 10_000), tmp_path / 'result')
+    loaded = results.read_result(tmp_path / 'result')
+
+    assert isinstance(loaded, memoryview)
+    assert loaded.readonly
+    assert loaded == b'x' * 10_000
+
+
+def test_out_of_band_buffers_are_not_copied(tmp_path):
+    data = bytearray(array('d', range(1000)).tobytes())
+    results.write_result(Payload(data, 'samples'), tmp_path / 'result')
+    loaded = results.read_result(tmp_path / 'result')
+
+    assert loaded.name == 'samples'
+    assert loaded.data.readonly
+    assert loaded.data == data
+    assert loaded.data.cast('d')[999] == 999
+
+
+@pytest.mark.parametrize('value, expected_summary', [
+    ('short', "'short'"),
+    (b'x' * 5000, '<bytes of 5000 bytes>'),
+    (list(range(100_000)), '[0, 1, 2, 3, 4, 5, ...]'),
+])
+def test_large_values_are_summarized(value, expected_summary):
+    assert results.summarize(value) == expected_summary
+
+
+def test_result_channel_returns_handlers_value(tmp_path, monkeypatch):
+    script = tmp_path / 'program.py'
+    script.write_text(textwrap.dedent('''
+        import gooey_quick
+
+        def double(numbers: str) -> dict:
+            return {'doubled': [2 * int(number) for number in numbers.split(',')]}
+
+        if __name__ == '__main__':
+            gooey_quick.run_gooey(double)
+    '''))
+    monkeypatch.setenv('PYTHONPATH', str(results.Path(__file__).resolve().parent.parent))
+
+    assert results.run_program(script, '1,2,3') == {'doubled': [2, 4, 6]}
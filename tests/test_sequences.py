@@ -0,0 +1,90 @@
+import sys
+from array import array
+from datetime import date
+
+import pytest
+
+import gooey_quick
+from gooey_quick import sequences
+from gooey_quick.sequences import int_list, float_list, date_list, DateArray, TupleOf
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('1, 2, 3', array('q', [1, 2, 3])),
+    ('1 2\n3', array('q', [1, 2, 3])),
+    ('[1,2;3]', array('q', [1, 2, 3])),
+    ('', array('q')),
+])
+def test_int_lists_are_parsed_into_arrays(text, expected):
+    assert int_list(text) == expected
+
+
+def test_float_lists_are_parsed_into_arrays():
+    assert float_list('1.5, -2e3 3') == array('d', [1.5, -2000.0, 3.0])
+
+
+def test_date_lists_are_parsed_into_date_arrays():
+    dates = date_list('2020-01-01, 2020-01-31')
+
+    assert isinstance(dates.ordinals, array)
+    assert dates == [date(2020, 1, 1), date(2020, 1, 31)]
+    assert dates[-1] == date(2020, 1, 31)
+    assert dates[:1] == DateArray(array('i', [date(2020, 1, 1).toordinal()]))
+
+
+@pytest.mark.parametrize('parse, text', [
+    (int_list, '1, 2.5'),
+    (int_list, str(2 ** 64)),
+    (float_list, '1, a'),
+    (date_list, '2020-13-01'),
+])
+def test_invalid_values_raise_value_error(parse, text):
+    with pytest.raises(ValueError):
+        parse(text)
+
+
+def test_values_are_read_from_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(sequences, 'CHUNK_SIZE', 7)
+    path = tmp_path / 'values.txt'
+    path.write_text('\n'.join(map(str, range(1000))))
+
+    assert float_list(str(path)) == array('d', range(1000))
+
+
+@pytest.mark.parametrize('name', ['my data/values.txt', 'values (1),final.txt'])
+def test_file_paths_may_contain_separators(tmp_path, name):
+    path = tmp_path / name
+    path.parent.mkdir(exist_ok=True)
+    path.write_text('1, 2\n3')
+
+    assert int_list(f' {path} ') == array('q', [1, 2, 3])
+
+
+def test_numbers_are_not_mistaken_for_files(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / '3').write_text('1 2')
+
+    assert int_list('3') == array('q', [3])
+
+
+@pytest.mark.parametrize('tuple_type, text, expected', [
+    (TupleOf((int, float)), '1, 2.5', (1, 2.5)),
+    (TupleOf((str, date)), 'start 2020-01-01', ('start', date(2020, 1, 1))),
+    (TupleOf((float,), variadic=True), '1 2 3', (1.0, 2.0, 3.0)),
+])
+def test_tuples_are_parsed(tuple_type, text, expected):
+    assert tuple_type(text) == expected
+
+
+def test_tuples_check_their_length():
+    with pytest.raises(ValueError):
+        TupleOf((int, int))('1 2 3')
+
+
+def average(samples: list[float], scale: tuple[float, float]):
+    return type(samples), sum(samples) / len(samples) * scale[0] + scale[1]
+
+
+def test_run_gooey_parses_lists_in_bulk(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['program.py', '--ignore-gooey', ' '.join(map(str, range(1_000_000))), '2, 1'])
+    assert gooey_quick.run_gooey(average) == (array, 999_999 + 1)
@@ -0,0 +1,177 @@
+import sys
+import time
+import types
+import asyncio
+import threading
+
+import pytest
+
+import gooey_quick
+from gooey_quick import threaded, parallel
+from gooey_quick.execution import call_handler
+from gooey_quick.threaded import ThreadRun
+
+
+def read_output(run: ThreadRun) -> str:
+    # the way Gooey reads its child's output
+    return b''.join(iter(run.stdout.readline, b'')).decode()
+
+
+def test_runs_output_and_exit_code_are_reported():
+    def target(argv):
+        print('hello', *argv)
+        print('oops', file=sys.stderr)
+
+    run = ThreadRun(target, ['a', 'b']).start()
+
+    assert read_output(run) == 'hello a b\noops\n'
+    assert run.poll() == 0
+    assert run.communicate() == (None, None)
+
+
+def test_other_threads_output_is_not_captured(capsys):
+    started, finish = threading.Event(), threading.Event()
+
+    def target(argv):
+        started.set()
+        finish.wait()
+
+    run = ThreadRun(target, []).start()
+    started.wait()
+    print('from elsewhere')
+    finish.set()
+
+    assert read_output(run) == ''
+    assert capsys.readouterr().out == 'from elsewhere\n'
+
+
+def test_failures_set_the_exit_code():
+    def target(argv):
+        raise RuntimeError('failure')
+
+    run = ThreadRun(target, []).start()
+    assert 'RuntimeError: failure' in read_output(run)
+    assert run.wait() == 1
+
+    run = ThreadRun(lambda argv: sys.exit(2), []).start()
+    read_output(run)
+    assert run.wait() == 2
+
+
+def test_cancellation_is_cooperative():
+    def target(argv):
+        while not gooey_quick.cancelled():
+            time.sleep(0.01)
+        print('cancelled')
+
+    run = ThreadRun(target, []).start()
+    assert run.poll() is None
+    run.cancel()
+
+    assert read_output(run) == 'cancelled\n'
+    assert not threaded.cancelled()
+
+
+def test_generator_handlers_stop_once_cancelled():
+    def handler():
+        threaded.current_run().cancel()
+        yield 'first'
+        yield 'second'
+
+    run = ThreadRun(lambda argv: call_handler(handler, {}), []).start()
+    assert read_output(run) == 'first\nthe run was cancelled\n'
+    assert run.wait() == 1
+
+
+def test_async_handlers_are_cancelled():
+    async def handler():
+        threaded.current_run().cancel()
+        try:
+            await asyncio.sleep(10)
+        finally:
+            print('cleaned up')
+
+    run = ThreadRun(lambda argv: call_handler(handler, {}), []).start()
+    assert read_output(run) == 'cleaned up\nthe run was cancelled\n'
+    assert run.wait() == 1
+
+
+def greet(name: str):
+    print(f'hello {name}')
+
+
+def test_threads_and_warm_worker_are_exclusive():
+    with pytest.raises(ValueError):
+        gooey_quick.run_gooey(greet, warm_worker=True, in_process=True)
+
+
+@parallel.map_over('name')
+def greet_each(name: str):
+    print(f'hello {name}')
+
+
+@pytest.mark.parametrize('description', [greet_each, {'Greet': greet, 'Greet each': greet_each}])
+def test_map_over_handlers_cant_run_in_process(description):
+    with pytest.raises(ValueError, match='greet_each'):
+        gooey_quick.run_gooey(description, in_process=True)
+
+
+@pytest.fixture
+def process_controller(monkeypatch):
+    """a stand-in for Gooey's gooey.gui.processor.ProcessController"""
+    class ProcessController:
+        def __init__(self):
+            self.wasForcefullyStopped = False
+            self.started, self.stopped, self.output = [], 0, []
+
+        def run(self, command):
+            self.started.append(command)
+
+        def stop(self):
+            self.stopped += 1
+
+        def _forward_stdout(self, process):
+            self.output.extend(line.decode() for line in iter(process.stdout.readline, b''))
+
+    processor = types.ModuleType('gooey.gui.processor')
+    processor.ProcessController = ProcessController
+    monkeypatch.setitem(sys.modules, 'gooey', types.ModuleType('gooey'))
+    monkeypatch.setitem(sys.modules, 'gooey.gui', types.ModuleType('gooey.gui'))
+    monkeypatch.setitem(sys.modules, 'gooey.gui.processor', processor)
+    return ProcessController
+
+
+def test_installed_controller_runs_and_cancels_in_threads(process_controller):
+    started = threading.Event()
+
+    def run(argv):
+        print(f'running with {argv}')
+        started.set()
+        while not gooey_quick.cancelled():
+            time.sleep(0.01)
+        print('cancelled')
+
+    target = threaded.install(run)
+    controller = process_controller()
+    controller.run(f'{target} --name "a b"')
+    assert started.wait(10)
+
+    controller.stop()
+    assert controller._process.wait(10) == 0
+    assert controller.wasForcefullyStopped
+    assert controller.started == [] and controller.stopped == 0
+    deadline = time.monotonic() + 10
+    while len(controller.output) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert controller.output == ["running with ['--name', 'a b']\n", 'cancelled\n']
+
+
+def test_installed_controller_passes_other_commands_through(process_controller):
+    threaded.install(lambda argv: None)
+    controller = process_controller()
+
+    controller.run('"python" -u program.py --ignore-gooey')
+    controller.stop()
+
+    assert controller.started == ['"python" -u program.py --ignore-gooey']
+    assert controller.stopped == 1
@@ -0,0 +1,57 @@
+import os
+from argparse import ArgumentTypeError
+
+import pytest
+
+from gooey_quick.traversal import DirectoryWalk, WalkDirectory
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for name in ('a.csv', 'b.txt', 'data_1.json', 'other.json', 'sub/c.csv', 'sub/deeper/d.CSV', 'sub/deeper/e.csv'):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return tmp_path
+
+
+def relative_names(walk, root):
+    return sorted(path.relative_to(root).as_posix() for path in walk)
+
+
+def test_every_file_is_walked(tree):
+    assert relative_names(DirectoryWalk(tree), tree) == [
+        'a.csv', 'b.txt', 'data_1.json', 'other.json', 'sub/c.csv', 'sub/deeper/d.CSV', 'sub/deeper/e.csv',
+    ]
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='file names are case insensitive on Windows')
+def test_files_are_filtered_by_extensions_and_patterns(tree):
+    assert relative_names(DirectoryWalk(tree, ('csv', 'data_*.json')), tree) == [
+        'a.csv', 'data_1.json', 'sub/c.csv', 'sub/deeper/e.csv',
+    ]
+
+
+def test_walks_are_lazy_and_repeatable(tree):
+    walk = DirectoryWalk(tree)
+    iterator = iter(walk)
+
+    assert next(iterator).parent.is_relative_to(tree)
+    assert len(list(walk)) == 7
+
+
+def test_progress_is_reported_by_entry_count(tree):
+    reports = []
+    assert len(list(DirectoryWalk(tree).walk(progress=reports.append, every=3))) == 7
+    # 7 files and 2 directories
+    assert reports == [3, 6, 9]
+
+
+def test_walk_directory_rejects_missing_directories(tmp_path):
+    with pytest.raises(ArgumentTypeError):
+        WalkDirectory(('csv',))(str(tmp_path / 'missing'))
+
+
+def test_walk_directory_creates_walks(tree):
+    walk = WalkDirectory(('txt',))(str(tree))
+    assert relative_names(walk, tree) == ['b.txt']
@@ -0,0 +1,111 @@
+import sys
+import threading
+from pathlib import Path
+from typing import Literal, Optional
+
+import pytest
+
+import gooey_quick
+from gooey_quick import validation
+from gooey_quick.types import FileWithExtension, SaveToPath, DirectoryPath
+
+
+def handler(
+    table: FileWithExtension[Literal['csv']],
+    inputs: list[Path],
+    output: SaveToPath,
+    workspace: DirectoryPath,
+    config: Optional[Path] = None,
+    name: str = 'name',
+):
+    return table, inputs, output, workspace, config, name
+
+
+@pytest.fixture
+def files(tmp_path):
+    for name in ('table.csv', 'table.txt', 'input1', 'input2'):
+        (tmp_path / name).touch()
+    return tmp_path
+
+
+def arguments(tmp_path, **overrides):
+    return {
+        'table': tmp_path / 'table.csv',
+        'inputs': [tmp_path / 'input1', tmp_path / 'input2'],
+        'output': SaveToPath(tmp_path / 'output'),
+        'workspace': DirectoryPath(tmp_path),
+        'config': None,
+        'name': 'not a path',
+        **overrides,
+    }
+
+
+def test_valid_arguments_pass(files):
+    assert validation.validate_arguments(handler, arguments(files)) == []
+
+
+@pytest.mark.parametrize('overrides, expected_error', [
+    ({'table': 'table.txt'}, 'is not a CSV file'),
+    ({'table': 'missing.csv'}, 'No such file or directory'),
+    ({'inputs': ['input1', 'missing']}, 'No such file or directory'),
+    ({'inputs': ['.']}, 'is a directory, not a file'),
+    ({'output': 'missing/output'}, "can't be created"),
+    ({'workspace': 'input1'}, 'is not a directory'),
+    ({'config': 'missing'}, 'No such file or directory'),
+])
+def test_invalid_paths_are_reported(files, overrides, expected_error):
+    overrides = {
+        name: [files / item for item in value] if isinstance(value, list) else files / value
+        for name, value in overrides.items()
+    }
+    errors = validation.validate_arguments(handler, arguments(files, **overrides))
+    assert len(errors) == 1
+    assert expected_error in errors[0]
+
+
+def recording_chunks(monkeypatch) -> list[tuple[str, int]]:
+    chunks = []
+    run_checks = validation._run_checks
+
+    def recording(checks):
+        chunks.append((threading.current_thread().name, len(checks)))
+        return run_checks(checks)
+    monkeypatch.setattr(validation, '_run_checks', recording)
+    return chunks
+
+
+def test_many_paths_are_checked_in_parallel_chunks(monkeypatch, tmp_path):
+    inputs = []
+    for index in range(1000):
+        inputs.append(tmp_path / str(index))
+        inputs[-1].touch()
+    inputs[123] = tmp_path / 'missing'
+    chunks = recording_chunks(monkeypatch)
+
+    errors = validation.validate_arguments(
+        handler,
+        arguments(tmp_path, table=tmp_path / '0', inputs=inputs),
+        max_workers=4,
+    )
+
+    assert [error.split(':')[0] for error in errors] == [f'{tmp_path / "0"} is not a CSV file', str(inputs[123])]
+    # the table, 1000 inputs, the output and the workspace
+    assert [size for _, size in chunks] == [251, 251, 251, 250]
+    assert threading.current_thread().name not in {thread for thread, _ in chunks}
+
+
+def test_few_paths_are_checked_in_one_go(monkeypatch, files):
+    chunks = recording_chunks(monkeypatch)
+    validation.validate_arguments(handler, arguments(files), max_workers=4)
+    assert chunks == [(threading.current_thread().name, 5)]
+
+
+def test_run_gooey_reports_invalid_paths(monkeypatch, capsys, files):
+    monkeypatch.setattr(sys, 'argv', [
+        'program.py', '--ignore-gooey', '--',
+        str(files / 'table.txt'), str(files / 'input1'), str(files / 'output'), str(files), 'x', 'y',
+    ])
+
+    with pytest.raises(SystemExit):
+        gooey_quick.run_gooey(handler, validate_paths=True)
+    assert 'is not a CSV file' in capsys.readouterr().err
@@ -0,0 +1,96 @@
+import sys
+import time
+import textwrap
+import subprocess
+from pathlib import Path
+from multiprocessing.connection import Client
+
+import pytest
+
+from gooey_quick import worker
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def supervisor(tmp_path, monkeypatch):
+    script = tmp_path / 'program.py'
+    script.write_text(textwrap.dedent('''
+        import sys
+        import gooey_quick
+
+        runs = []
+
+        def greet(name: str, fail: bool = False):
+            runs.append(name)
+            print(f'hello {name}, run {len(runs)}')
+            print('to stderr', file=sys.stderr)
+            if fail:
+                raise RuntimeError('failure')
+            if name == 'sleepy':
+                import time
+                time.sleep(60)
+
+        if __name__ == '__main__':
+            gooey_quick.run_gooey(greet)
+    '''))
+    monkeypatch.setenv('PYTHONPATH', str(REPOSITORY))
+    supervisor = worker.Supervisor([sys.executable, str(script)]).start()
+    for name, value in supervisor.environment.items():
+        monkeypatch.setenv(name, value)
+    yield supervisor
+    supervisor.stop()
+
+
+def test_runs_are_served_by_the_same_worker(supervisor, capsys):
+    assert worker.connect(['--ignore-gooey', 'world'], timeout=30) == 0
+    first_worker = supervisor.process.pid
+    assert worker.connect(['--ignore-gooey', 'again'], timeout=30) == 0
+
+    assert supervisor.process.pid == first_worker
+    output = capsys.readouterr()
+    assert output.out == 'hello world, run 1\nhello again, run 2\n'
+    assert output.err == 'to stderr\nto stderr\n'
+
+
+def test_failures_are_reported_with_exit_codes(supervisor, capsys):
+    assert worker.connect(['--ignore-gooey', '--fail', 'world'], timeout=30) == 1
+    assert 'RuntimeError: failure' in capsys.readouterr().err
+    assert worker.connect(['--ignore-gooey', '--unknown'], timeout=30) == 2
+    assert worker.connect(['--ignore-gooey', 'world'], timeout=30) == 0
+
+
+def test_abandoned_runs_kill_and_respawn_the_worker(supervisor, capsys):
+    assert worker.connect(['--ignore-gooey', 'world'], timeout=30) == 0
+    first_worker = supervisor.process
+
+    connection = Client(supervisor.address, authkey=supervisor.authkey.encode())
+    connection.send({'argv': ['--ignore-gooey', 'sleepy'], 'cwd': '.'})
+    assert connection.recv()[0] == worker.OUTPUT
+    connection.close()
+
+    assert first_worker.wait(timeout=10) == 1
+    assert worker.connect(['--ignore-gooey', 'world'], timeout=30) == 0
+    assert supervisor.process is not first_worker
+    assert capsys.readouterr().out.endswith('hello world, run 1\n')
+
+
+def test_stopping_kills_the_worker(supervisor):
+    assert worker.connect(['--ignore-gooey', 'world'], timeout=30) == 0
+    process = supervisor.process
+    supervisor.stop()
+
+    assert process.poll() is not None
+    time.sleep(2 * worker.RESPAWN_DELAY)
+    assert supervisor.process is process
+
+
+def test_client_runs_as_a_module(supervisor):
+    completed = subprocess.run(
+        [sys.executable, '-m', 'gooey_quick.worker', '--ignore-gooey', 'module'],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert completed.returncode == 0
+    assert completed.stdout == 'hello module, run 1\n'